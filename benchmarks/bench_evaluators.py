@@ -0,0 +1,56 @@
+import numpy as np
+
+from pyga.utils import evaluators
+
+from .common import FUNCTIONS, make_bounds, check_size
+
+BACKENDS = ['vectorized', 'serial', 'thread_pool', 'process_pool']
+
+
+class EvaluatorSuite:
+
+    """Throughput of evaluating a population with each backend."""
+
+    params = (BACKENDS, list(FUNCTIONS), [100, 1_000, 10_000], [2, 100])
+    param_names = ['backend', 'function', 'n_individuals', 'n_dims']
+
+    def setup(self, backend, function, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        self.fn, limit = FUNCTIONS[function]
+
+        lb, ub = np.array(list(make_bounds(n_dims, limit).values())).T
+        rng = np.random.default_rng(0)
+        self.positions = rng.uniform(lb, ub, size=(n_individuals, n_dims))
+
+        chunksize = max(1, n_individuals // 64)
+
+        self.evaluator = {
+            'vectorized': None,
+            'serial': evaluators.SerialEvaluator,
+            'thread_pool': lambda: evaluators.ThreadPoolEvaluator(
+                chunksize=chunksize
+            ),
+            'process_pool': lambda: evaluators.ProcessPoolEvaluator(
+                chunksize=chunksize
+            )
+        }[backend]
+
+        if self.evaluator is not None:
+            self.evaluator = self.evaluator()
+
+            # start the workers before timing.
+            self.evaluator.evaluate(self.fn, self.positions[:1])
+
+        self.generations = 1
+        self.evaluations = n_individuals
+
+    def teardown(self, backend, function, n_individuals, n_dims):
+        if self.evaluator is not None:
+            self.evaluator.close()
+
+    def time_evaluate(self, backend, function, n_individuals, n_dims):
+        if self.evaluator is None:
+            self.fn(self.positions)
+        else:
+            self.evaluator.evaluate(self.fn, self.positions)
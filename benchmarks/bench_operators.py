@@ -0,0 +1,166 @@
+import numpy as np
+
+from pyga.population import Population
+from pyga.utils import selections, crossovers, mutations, recombinations
+from pyga.utils import initialisers
+
+from .common import make_bounds, check_size
+
+SELECTIONS = {
+    'random': selections.RandomSelection,
+    'tournament': selections.TournamentSelection,
+    'fitness_proportionate': selections.FitnessProportionateSelection,
+    'truncation': selections.TruncationSelection,
+    'sus': selections.StochasticUniversalSamplingSelection
+}
+
+CROSSOVERS = {
+    'one_point': crossovers.OnePointCrossover,
+    'two_point': crossovers.TwoPointCrossover,
+    'uniform': lambda: crossovers.UniformCrossover(p_swap=0.5),
+    'line': recombinations.LineRecombination,
+    'intermediate': recombinations.IntermediateRecombination
+}
+
+MUTATIONS = {
+    'random': mutations.RandomMutation,
+    'gaussian': mutations.GaussianMutation,
+    'polynomial': mutations.PolynomialMutation,
+    'uniform_reset': mutations.UniformResetMutation
+}
+
+INITIALISERS = {
+    'uniform': initialisers.UniformInitialiser,
+    'latin_hypercube': initialisers.LatinHypercubeInitialiser,
+    'halton': initialisers.HaltonInitialiser,
+    'sobol': initialisers.SobolInitialiser,
+    'opposition': initialisers.OppositionInitialiser
+}
+
+SIZES = [100, 1_000, 10_000, 100_000]
+DIMS = [2, 100, 10_000]
+
+
+def make_population(n_individuals, n_dims):
+
+    """
+    Creates a population with a positive fitness for each member.
+
+    Parameters
+    ----------
+    n_individuals : int
+        Number of individuals in the population.
+    n_dims : int
+        Number of dimensions of the search space.
+
+    Returns
+    -------
+    Population
+        Population with positions and fitness assigned.
+    """
+
+    bounds = make_bounds(n_dims, 1.0)
+    rng = np.random.default_rng(0)
+
+    population = Population(bounds, n_individuals, rng)
+    population.fitness[:] = (population.positions ** 2).sum(axis=1) + 1.0
+
+    return population
+
+
+class SelectionSuite:
+
+    """Throughput of selecting a full population of parents."""
+
+    params = (list(SELECTIONS), SIZES, DIMS)
+    param_names = ['selection', 'n_individuals', 'n_dims']
+
+    def setup(self, selection, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        self.population = make_population(n_individuals, n_dims)
+        self.selection = SELECTIONS[selection]()
+
+        self.generations = 1
+        self.evaluations = 0
+
+    def time_select(self, selection, n_individuals, n_dims):
+        self.selection.preprocess(self.population)
+        self.population.take(
+            self.selection.select_many(self.population, n_individuals)
+        )
+
+
+class CrossoverSuite:
+
+    """Throughput of crossing a full population of parents."""
+
+    params = (list(CROSSOVERS), SIZES, DIMS)
+    param_names = ['crossover', 'n_individuals', 'n_dims']
+
+    def setup(self, crossover, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        self.population = make_population(n_individuals, n_dims)
+        self.crossover = CROSSOVERS[crossover]()
+
+        self.generations = 1
+        self.evaluations = 0
+
+    def time_cross(self, crossover, n_individuals, n_dims):
+        positions = self.population.positions
+
+        self.crossover.cross_batch(
+            positions[0::2], positions[1::2],
+            self.population.lb, self.population.ub
+        )
+
+
+class MutationSuite:
+
+    """Throughput of mutating a full population of children."""
+
+    params = (list(MUTATIONS), SIZES, DIMS)
+    param_names = ['mutation', 'n_individuals', 'n_dims']
+
+    def setup(self, mutation, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        self.population = make_population(n_individuals, n_dims)
+        self.mutation = MUTATIONS[mutation]()
+
+        self.generations = 1
+        self.evaluations = 0
+
+    def time_mutate(self, mutation, n_individuals, n_dims):
+        self.mutation.mutate_batch(
+            self.population.positions,
+            self.population.lb, self.population.ub
+        )
+
+
+class InitialiserSuite:
+
+    """Throughput of generating a full initial population."""
+
+    params = (list(INITIALISERS), SIZES, DIMS)
+    param_names = ['initialiser', 'n_individuals', 'n_dims']
+
+    def setup(self, initialiser, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        self.lb = np.full(n_dims, -1.0)
+        self.ub = np.full(n_dims, 1.0)
+
+        try:
+            self.initialiser = INITIALISERS[initialiser]()
+        except ImportError:
+            raise NotImplementedError('Requires scipy.')
+
+        self.initialiser.rng = np.random.default_rng(0)
+
+        self.generations = 0
+        self.evaluations = 0
+
+    def time_initialise(self, initialiser, n_individuals, n_dims):
+        self.initialiser.initialise(n_individuals, self.lb, self.ub)
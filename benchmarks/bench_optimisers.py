@@ -0,0 +1,99 @@
+import numpy as np
+
+import pyga
+from pyga.utils.termination_manager import (
+    ErrorTerminationManager, EvaluationTerminationManager
+)
+
+from .common import FUNCTIONS, make_bounds, check_size, prepare
+from .bench_operators import INITIALISERS
+
+
+class OptimiserSuite:
+
+    """Throughput of a generation of each optimiser."""
+
+    params = (
+        ['SOGA', 'EliteSOGA', 'SSGA'],
+        [100, 1_000, 10_000, 100_000],
+        [2, 100, 10_000]
+    )
+    param_names = ['optimiser', 'n_individuals', 'n_dims']
+
+    def setup(self, optimiser, n_individuals, n_dims):
+        check_size(n_individuals, n_dims)
+
+        # SSGA breeds two children per step, so a generation of the
+        # population requires n_individuals / 2 steps.
+        if optimiser == 'SSGA' and n_individuals > 10_000:
+            raise NotImplementedError('Too slow to benchmark.')
+
+        fn, limit = FUNCTIONS['sphere']
+        bounds = make_bounds(n_dims, limit)
+
+        kwargs = dict(n_iterations=1, vectorized=True, seed=0)
+        if optimiser == 'EliteSOGA':
+            kwargs['n_elites'] = max(2, n_individuals // 10)
+
+        self.ga = getattr(pyga, optimiser)(bounds, n_individuals, **kwargs)
+
+        self.fn = fn
+        prepare(self.ga, fn)
+
+        self.n_steps = n_individuals // 2 if optimiser == 'SSGA' else 1
+
+        # work done per call of the timed method.
+        self.generations = 1
+        self.evaluations = n_individuals
+
+    def time_generation(self, optimiser, n_individuals, n_dims):
+        for _ in range(self.n_steps):
+            self.ga.step_optimise(self.fn)
+
+
+class InitialisationSuite:
+
+    """
+    Evaluations required by SOGA to reach the optimum from each initial
+    population design, averaged over a number of seeds.
+    """
+
+    params = (list(INITIALISERS), ['sphere', 'rastrigin'], [2, 5])
+    param_names = ['initialiser', 'function', 'n_dims']
+
+    n_seeds = 10
+    n_individuals = 50
+    max_evaluations = 50_000
+    threshold = 1e-1
+
+    def setup(self, initialiser, function, n_dims):
+        try:
+            INITIALISERS[initialiser]()
+        except ImportError:
+            raise NotImplementedError('Requires scipy.')
+
+        self.fn, limit = FUNCTIONS[function]
+        self.bounds = make_bounds(n_dims, limit)
+
+        self.generations = 0
+        self.evaluations = 0
+
+    def track_evaluations_to_target(self, initialiser, function, n_dims):
+        n_evaluations = []
+
+        for seed in range(self.n_seeds):
+            ga = pyga.SOGA(self.bounds, self.n_individuals,
+                           n_iterations=None, vectorized=True, seed=seed)
+
+            ga.initialiser = INITIALISERS[initialiser]()
+            ga.termination_manager = (
+                ErrorTerminationManager(ga, 0.0, self.threshold)
+                | EvaluationTerminationManager(ga, self.max_evaluations)
+            )
+
+            ga.optimise(self.fn)
+            n_evaluations.append(ga.n_evaluations)
+
+        return float(np.mean(n_evaluations))
+
+    track_evaluations_to_target.unit = 'evaluations'
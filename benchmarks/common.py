@@ -0,0 +1,79 @@
+import numpy as np
+
+from pyga.utils.functions import single_objective as fx
+
+# functions from single_objective defined for any number of dimensions.
+FUNCTIONS = {
+    'sphere': (fx.sphere, 100.0),
+    'rastrigin': (fx.rastrigin, 5.12),
+    'ackley': (fx.ackley, 32.0)
+}
+
+# largest population matrix (n_individuals * n_dims) which is benchmarked.
+MAX_SIZE = 10_000_000
+
+
+def make_bounds(n_dims, limit):
+
+    """
+    Creates a symmetric search space.
+
+    Parameters
+    ----------
+    n_dims : int
+        Number of dimensions of the search space.
+    limit : float
+        Magnitude of the lower and upper bound of each dimension.
+
+    Returns
+    -------
+    dict
+        Lower and upper bounds of the search space.
+    """
+
+    return {f'x{i}': [-limit, limit] for i in range(n_dims)}
+
+
+def check_size(n_individuals, n_dims):
+
+    """
+    Skips parameter combinations which are too large to benchmark.
+
+    Parameters
+    ----------
+    n_individuals : int
+        Number of individuals in the population.
+    n_dims : int
+        Number of dimensions of the search space.
+
+    Raises
+    ------
+    NotImplementedError
+        The combination is skipped, following the asv convention.
+    """
+
+    if n_individuals * n_dims > MAX_SIZE:
+        raise NotImplementedError('Population matrix too large.')
+
+
+def prepare(ga, fn):
+
+    """
+    Initialises and evaluates the population of an optimiser, ready for
+    step_optimise() to be timed.
+
+    Parameters
+    ----------
+    ga : BaseGA
+        Optimiser to prepare.
+    fn : function
+        Fitness function used to evaluate the fitness.
+    """
+
+    ga.reset_environment()
+    ga.bind_rng()
+    ga.initialise_population()
+    ga.evaluate_population(ga.population, fn)
+
+    best = np.argmin(ga.population.fitness)
+    ga.update_best(ga.population[best])
@@ -0,0 +1,206 @@
+"""
+Runs the benchmark suites without asv and writes the results as JSON.
+
+The suites follow the asv conventions - each class declares params and
+param_names, timed methods are prefixed with time_, tracked methods
+returning a value are prefixed with track_ and setup() raises
+NotImplementedError to skip a combination of parameters. Every timed
+result records the seconds per call and the generations / evaluations
+per second derived from the work attributes assigned in setup().
+
+Usage:
+    python -m benchmarks.run --output results.json --max-size 100000
+"""
+
+import sys
+import json
+import time
+import argparse
+import platform
+import itertools
+import importlib
+import numpy as np
+
+import pyga
+from . import common
+
+MODULES = ['bench_optimisers', 'bench_operators', 'bench_evaluators']
+
+
+def discover(pattern=None):
+
+    """
+    Finds the benchmark suites.
+
+    Parameters
+    ----------
+    pattern : str
+        Only suites whose name contains the pattern are returned.
+
+    Returns
+    -------
+    list
+        (name, class) of each suite.
+    """
+
+    suites = []
+    for module_name in MODULES:
+        module = importlib.import_module(f'{__package__}.{module_name}')
+
+        for name, obj in vars(module).items():
+            if not (isinstance(obj, type) and name.endswith('Suite')):
+                continue
+
+            qualname = f'{module_name}.{name}'
+            if pattern is None or pattern in qualname:
+                suites.append((qualname, obj))
+
+    return suites
+
+
+def time_call(method, args, repeat, min_time):
+
+    """
+    Times a benchmark method.
+
+    Parameters
+    ----------
+    method : function
+        Bound method to time.
+    args : tuple
+        Parameters passed to the method.
+    repeat : int
+        Number of repeats, the fastest is reported.
+    min_time : float
+        Minimum duration of each repeat in seconds.
+
+    Returns
+    -------
+    float
+        Seconds per call.
+    """
+
+    best = np.inf
+    for _ in range(repeat):
+        n_calls, elapsed = 0, 0.0
+
+        while elapsed < min_time:
+            t_start = time.perf_counter()
+            method(*args)
+            elapsed += time.perf_counter() - t_start
+            n_calls += 1
+
+        best = min(best, elapsed / n_calls)
+
+    return best
+
+
+def run_suite(name, cls, repeat, min_time):
+
+    """
+    Runs every combination of parameters of a benchmark suite.
+
+    Parameters
+    ----------
+    name : str
+        Name of the suite.
+    cls : type
+        Benchmark suite.
+    repeat : int
+        Number of repeats of each timing.
+    min_time : float
+        Minimum duration of each repeat in seconds.
+
+    Returns
+    -------
+    list
+        Result of each benchmark.
+    """
+
+    results = []
+    timed = [m for m in dir(cls) if m.startswith('time_')]
+    tracked = [m for m in dir(cls) if m.startswith('track_')]
+
+    for args in itertools.product(*cls.params):
+        params = dict(zip(cls.param_names, args))
+        suite = cls()
+
+        try:
+            suite.setup(*args)
+        except NotImplementedError as e:
+            results.append({'suite': name, 'params': params,
+                            'skipped': str(e)})
+            continue
+
+        try:
+            for method in timed:
+                seconds = time_call(getattr(suite, method), args,
+                                    repeat, min_time)
+
+                results.append({
+                    'suite': name,
+                    'benchmark': method,
+                    'params': params,
+                    'seconds': seconds,
+                    'generations_per_second': suite.generations / seconds,
+                    'evaluations_per_second': suite.evaluations / seconds
+                })
+
+                print(f'{name}.{method} {params}: {seconds:.3e} s',
+                      file=sys.stderr)
+
+            for method in tracked:
+                value = getattr(suite, method)(*args)
+
+                results.append({
+                    'suite': name,
+                    'benchmark': method,
+                    'params': params,
+                    'value': value
+                })
+
+                print(f'{name}.{method} {params}: {value}', file=sys.stderr)
+        finally:
+            if hasattr(suite, 'teardown'):
+                suite.teardown(*args)
+
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--output', default='-',
+                        help='file to write the JSON to, - for stdout')
+    parser.add_argument('--suite', default=None,
+                        help='only run suites whose name contains this')
+    parser.add_argument('--max-size', type=int, default=common.MAX_SIZE,
+                        help='largest n_individuals * n_dims to run')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.1)
+
+    args = parser.parse_args(argv)
+    common.MAX_SIZE = args.max_size
+
+    results = []
+    for name, cls in discover(args.suite):
+        results.extend(run_suite(name, cls, args.repeat, args.min_time))
+
+    report = {
+        'pyga': getattr(pyga, '__version__', None),
+        'numpy': np.__version__,
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'results': results
+    }
+
+    if args.output == '-':
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
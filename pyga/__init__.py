@@ -1,3 +1,5 @@
 from .opt.soga import SOGA
 from .opt.elite_soga import EliteSOGA
 from .opt.ssga import SSGA
+from .opt.async_ssga import AsyncSSGA
+from .opt.island_ga import IslandGA
@@ -1,4 +1,5 @@
 import abc
+import numpy as np
 
 
 class BaseConstraint(abc.ABC):
@@ -53,3 +54,170 @@ class PositionConstraint(BaseConstraint):
         """
 
         raise NotImplementedError('PositionConstraint::constrained()')
+
+    def constrain_batch(self, positions):
+
+        """
+        Determines which of a batch of positions satisfy the constraint.
+
+        Parameters
+        ----------
+        positions : NamedPositions
+            Positions of shape (n, d), columns accessible by name.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (n,), True if within constraints.
+
+        Raises
+        ------
+        NotImplementedError
+            No batch implementation, constrain() is used for each row.
+        """
+
+        raise NotImplementedError('PositionConstraint::constrain_batch()')
+
+    def violation_batch(self, positions):
+
+        """
+        Measures by how much each of a batch of positions violates the
+        constraint.
+
+        Parameters
+        ----------
+        positions : NamedPositions
+            Positions of shape (n, d), columns accessible by name.
+
+        Returns
+        -------
+        np.ndarray
+            Non-negative violation of shape (n,), zero if feasible.
+
+        Raises
+        ------
+        NotImplementedError
+            No measure of violation, each violation counts as one.
+        """
+
+        raise NotImplementedError('PositionConstraint::violation_batch()')
+
+
+class LinearConstraint(PositionConstraint):
+
+    """Linear inequality constraints of the form A @ x <= b."""
+
+    def __init__(self, A, b):
+
+        """
+        Initialises the LinearConstraint.
+
+        Parameters
+        ----------
+        A : array_like
+            Coefficients of shape (m, d), one row per inequality.
+        b : array_like
+            Upper limits of shape (m,).
+        """
+
+        self.A = np.atleast_2d(np.asarray(A, dtype=float))
+        self.b = np.atleast_1d(np.asarray(b, dtype=float))
+
+        if not self.A.shape[0] == self.b.shape[0]:
+            raise ValueError('A and b must have the same number of rows.')
+
+    def constrain(self, position):
+        values = np.fromiter(position.values(), dtype=float)
+        return bool(np.all(self.A @ values <= self.b))
+
+    def constrain_batch(self, positions):
+        return np.all(positions.values @ self.A.T <= self.b, axis=1)
+
+    def violation_batch(self, positions):
+        excess = positions.values @ self.A.T - self.b
+        return np.sum(np.maximum(excess, 0.0), axis=1)
+
+
+class BoxConstraint(PositionConstraint):
+
+    """Box constraints of the form lower <= x <= upper."""
+
+    def __init__(self, lower, upper):
+
+        """
+        Initialises the BoxConstraint.
+
+        Parameters
+        ----------
+        lower : array_like
+            Lower limit of each parameter, -np.inf if unconstrained.
+        upper : array_like
+            Upper limit of each parameter, np.inf if unconstrained.
+        """
+
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+
+    def constrain(self, position):
+        values = np.fromiter(position.values(), dtype=float)
+        return bool(np.all((self.lower <= values) & (values <= self.upper)))
+
+    def constrain_batch(self, positions):
+        values = positions.values
+        return np.all((self.lower <= values) & (values <= self.upper), axis=1)
+
+    def violation_batch(self, positions):
+        values = positions.values
+        excess = (np.maximum(self.lower - values, 0.0)
+                  + np.maximum(values - self.upper, 0.0))
+        return np.sum(excess, axis=1)
+
+
+class NamedPositions:
+
+    """Batch of positions with columns accessible by parameter name."""
+
+    def __init__(self, pnames, values):
+
+        """
+        Initialises NamedPositions.
+
+        Parameters
+        ----------
+        pnames : list
+            Parameter names of the columns.
+        values : np.ndarray
+            Positions of shape (n, d).
+        """
+
+        self.pnames = pnames
+        self.values = values
+
+        self._columns = {name: idx for idx, name in enumerate(pnames)}
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, name):
+        return self.values[:, self._columns[name]]
+
+    def keys(self):
+        return list(self.pnames)
+
+    def row(self, idx):
+
+        """
+        Provides a single position in dictionary form.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the row.
+
+        Returns
+        -------
+        dict
+            Parameter names mapped to the values of the position.
+        """
+
+        return dict(zip(self.pnames, self.values[idx]))
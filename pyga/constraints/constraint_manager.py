@@ -1,4 +1,7 @@
+import numpy as np
+
 from .base_constraints import BaseConstraint, PositionConstraint
+from .base_constraints import NamedPositions
 
 
 class ConstraintManager:
@@ -12,11 +15,29 @@ class ConstraintManager:
         ----------
         ga : SOGA
             Instance of SOGA to be used.
+
+        Attributes
+        ----------
+        handler : BaseConstraintHandler
+            Determines the fitness of infeasible individuals, if None
+            constraints only restrict the best individual.
+        repair : BaseRepair
+            Applied to positions before they are evaluated, if not None.
         """
 
         self.ga = ga
         self.constraints = []
 
+        self.handler = None
+        self.repair = None
+
+    def reset(self):
+
+        """Resets the handler at the start of an optimisation."""
+
+        if self.handler is not None:
+            self.handler.reset()
+
     def violates_position(self, individual):
 
         """
@@ -33,17 +54,198 @@ class ConstraintManager:
             True if position constraints are violated, False otherwise.
         """
 
-        position = dict(zip(self.ga.pnames, individual.position))
+        return not self.feasible(individual.position[np.newaxis])[0]
+
+    def feasible(self, positions):
+
+        """
+        Determines which positions satisfy all position constraints.
+
+        Rows found to be infeasible are not tested against subsequent
+        constraints.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (n,), True if within all constraints.
+        """
+
+        mask = np.ones(len(positions), dtype=bool)
 
-        within_constraints = True
         for constraint in self.constraints:
-            if isinstance(constraint, PositionConstraint):
-                within_constraints = constraint.constrain(position)
+            if not isinstance(constraint, PositionConstraint):
+                continue
+
+            rows = np.flatnonzero(mask)
+            if not len(rows):
+                break
+
+            named = NamedPositions(self.ga.pnames, positions[rows])
+            mask[rows] = self._constrain(constraint, named)
+
+        return mask
+
+    def violation(self, positions):
+
+        """
+        Measures the total violation of the position constraints.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Non-negative violation of shape (n,), zero if feasible.
+        """
+
+        named = NamedPositions(self.ga.pnames, positions)
+        total = np.zeros(len(positions))
+
+        for constraint in self.constraints:
+            if not isinstance(constraint, PositionConstraint):
+                continue
+
+            try:
+                total += constraint.violation_batch(named)
+            except NotImplementedError:
+                total += ~self._constrain(constraint, named)
+
+        return total
+
+    def evaluate(self, population, evaluate):
+
+        """
+        Sets the fitness of every member of the population, repairing
+        the members and handling those which are infeasible.
+
+        Parameters
+        ----------
+        population : Population
+            Population for which to assess the fitness.
+        evaluate : function
+            Maps positions of shape (k, d) to fitnesses of shape (k,).
+        """
+
+        required = self.prepare(population)
+
+        fitness = np.full(len(population), np.nan)
+        if np.all(required):
+            fitness[:] = evaluate(population.positions)
+        elif np.any(required):
+            fitness[required] = evaluate(population.positions[required])
+
+        population.fitness[:] = self.handle(fitness, population.violation)
+
+    def prepare(self, population):
+
+        """
+        Repairs the members of the population and measures their
+        violation, ready for their fitness to be evaluated.
+
+        Parameters
+        ----------
+        population : Population
+            Population to prepare.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (n,), True where the fitness function
+            must be evaluated.
+        """
+
+        if self.repair is not None:
+            population.positions[:] = self.repair.repair(
+                population.positions, population.lb, population.ub
+            )
+
+        if self.handler is not None:
+            population.violation[:] = self.violation(population.positions)
+
+        return self.requires_evaluation(population.violation)
+
+    def requires_evaluation(self, violation):
+
+        """
+        Determines the members whose fitness function must be evaluated,
+        evaluation is skipped for infeasible members when the handler
+        does not require their fitness.
+
+        Parameters
+        ----------
+        violation : np.ndarray
+            Violation of shape (n,), as measured by prepare().
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (n,), True where evaluation is required.
+        """
+
+        if self.handler is None or self.handler.requires_fitness:
+            return np.ones(len(violation), dtype=bool)
+
+        return violation == 0
+
+    def handle(self, fitness, violation):
+
+        """
+        Determines the fitness used for selection from the evaluated
+        fitness, using the handler when one is set.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness of shape (n,), NaN where evaluation was skipped.
+        violation : np.ndarray
+            Violation of shape (n,), as measured by prepare().
+
+        Returns
+        -------
+        np.ndarray
+            Fitness of shape (n,) with infeasible members handled.
+        """
+
+        if self.handler is None:
+            return fitness
+
+        return self.handler.apply(fitness, violation)
+
+    @staticmethod
+    def _constrain(constraint, named):
+
+        """
+        Tests a constraint against a batch of positions, using the batch
+        implementation of the constraint when available.
+
+        Parameters
+        ----------
+        constraint : PositionConstraint
+            Constraint to test.
+        named : NamedPositions
+            Positions of shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of shape (n,), True if within the constraint.
+        """
 
-            if not within_constraints:
-                return True
+        try:
+            within = constraint.constrain_batch(named)
+        except NotImplementedError:
+            within = [constraint.constrain(named.row(idx))
+                      for idx in range(len(named))]
 
-        return False
+        return np.asarray(within, dtype=bool)
 
     def register_constraint(self, constraint):
 
@@ -0,0 +1,167 @@
+import abc
+import numpy as np
+
+
+class BaseConstraintHandler(abc.ABC):
+
+    """Abstract Base Class for handling infeasible individuals."""
+
+    # whether the fitness function must be evaluated for infeasible
+    # individuals - evaluation is skipped for them when False.
+    requires_fitness = True
+
+    @abc.abstractmethod
+    def apply(self, fitness, violation):
+
+        """
+        Determines the fitness used for selection.
+
+        Parameters
+        ----------
+        fitness : np.ndarray
+            Fitness of shape (n,), NaN where evaluation was skipped.
+        violation : np.ndarray
+            Total constraint violation of shape (n,), zero if feasible.
+
+        Returns
+        -------
+        np.ndarray
+            Fitness of shape (n,) with infeasible members handled.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises when this function has not yet been implemented.
+        """
+
+        raise NotImplementedError('BaseConstraintHandler::apply()')
+
+    def reset(self):
+
+        """Discards any state, called at the start of an optimisation."""
+
+        pass
+
+
+class StaticPenalty(BaseConstraintHandler):
+
+    """Adds a fixed multiple of the violation to the fitness."""
+
+    def __init__(self, coefficient=1e3):
+
+        """
+        Initialises the StaticPenalty.
+
+        Parameters
+        ----------
+        coefficient : float
+            Penalty per unit of constraint violation.
+        """
+
+        if not coefficient > 0:
+            raise ValueError('coefficient must be > 0')
+
+        self.coefficient = coefficient
+
+    def apply(self, fitness, violation):
+        return fitness + self.coefficient * violation
+
+
+class AdaptivePenalty(StaticPenalty):
+
+    """
+    Penalty whose coefficient grows while too few members are feasible
+    and shrinks otherwise, updated once per window of handled members
+    so that the update does not depend on the size of each batch.
+    """
+
+    def __init__(self, coefficient=1.0, target=0.5, factor=1.5,
+                 window=100):
+
+        """
+        Initialises the AdaptivePenalty.
+
+        Parameters
+        ----------
+        coefficient : float
+            Initial penalty per unit of constraint violation.
+        target : float
+            Desired proportion of feasible members.
+        factor : float
+            Factor by which the coefficient is scaled per update.
+        window : int
+            Number of handled members between updates, e.g. the size
+            of the population.
+
+        Attributes
+        ----------
+        n_handled : int
+            Number of members handled since the last update.
+        n_feasible : int
+            Number of those members which were feasible.
+        """
+
+        super().__init__(coefficient)
+
+        if not 0 < target < 1:
+            raise ValueError('target must be within (0, 1)')
+
+        if not factor > 1:
+            raise ValueError('factor must be > 1')
+
+        if not window >= 1:
+            raise ValueError('window must be >= 1')
+
+        self.initial_coefficient = coefficient
+        self.target = target
+        self.factor = factor
+        self.window = window
+
+        self.n_handled = 0
+        self.n_feasible = 0
+
+    def apply(self, fitness, violation):
+        fitness = super().apply(fitness, violation)
+
+        self.n_handled += len(violation)
+        self.n_feasible += int(np.sum(violation == 0))
+
+        if self.n_handled >= self.window:
+            if self.n_feasible / self.n_handled < self.target:
+                self.coefficient *= self.factor
+            else:
+                self.coefficient /= self.factor
+
+            self.n_handled = 0
+            self.n_feasible = 0
+
+        return fitness
+
+    def reset(self):
+        self.coefficient = self.initial_coefficient
+        self.n_handled = 0
+        self.n_feasible = 0
+
+
+class FeasibilityRules(BaseConstraintHandler):
+
+    """
+    Deb's feasibility rules - a feasible member is preferred to an
+    infeasible one, feasible members are compared by fitness and
+    infeasible members by constraint violation.
+
+    Infeasible members are given an infinite fitness, so they rank
+    below every feasible member, and are ordered among themselves by
+    the violation stored on the population - see Population.rank_key().
+    The fitness function is never evaluated for infeasible members.
+    Selections weighting members by fitness cannot apply the rules,
+    a rank-based selection such as TournamentSelection is required.
+    """
+
+    requires_fitness = False
+
+    def apply(self, fitness, violation):
+        fitness = fitness.copy()
+        fitness[violation > 0] = np.inf
+
+        return fitness
@@ -0,0 +1,71 @@
+import abc
+import numpy as np
+
+
+class BaseRepair(abc.ABC):
+
+    """Abstract Base Class for all Repair functionality."""
+
+    @abc.abstractmethod
+    def repair(self, positions, lb, ub):
+
+        """
+        Moves a batch of positions towards the feasible region.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) to repair.
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        np.ndarray
+            Repaired positions of shape (n, d).
+
+        Raises
+        ------
+        NotImplementedError
+            Raises when this function has not yet been implemented.
+        """
+
+        raise NotImplementedError('BaseRepair::repair()')
+
+
+class ProjectionRepair(BaseRepair):
+
+    """Projects positions onto the bounds of the search space."""
+
+    def repair(self, positions, lb, ub):
+        return np.clip(positions, lb, ub)
+
+
+class FunctionRepair(BaseRepair):
+
+    """Repairs positions with a user provided function."""
+
+    def __init__(self, fn, vectorized=False):
+
+        """
+        Initialises the FunctionRepair.
+
+        Parameters
+        ----------
+        fn : function
+            Function returning the repaired position.
+        vectorized : bool
+            If True fn receives and returns the (n, d) position matrix,
+            otherwise it is called for each (d,) position.
+        """
+
+        self.fn = fn
+        self.vectorized = vectorized
+
+    def repair(self, positions, lb, ub):
+        if self.vectorized:
+            return self.fn(positions)
+
+        return np.array([self.fn(position) for position in positions])
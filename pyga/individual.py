@@ -3,37 +3,121 @@ import numpy as np
 
 class Individual:
 
-    def __init__(self, bounds):
+    __slots__ = ('_population', '_index')
+
+    def __init__(self, bounds, rng=None):
 
         """
         Class containing information about a population member.
 
+        The individual is a lightweight view into a row of a Population,
+        an individual created from bounds owns a single-row Population.
+
         Parameters
         ----------
         bounds : dict
             Parameter names mapped to upper / lower bounds.
+        rng : np.random.Generator
+            Generator used to draw the initial position.
 
         Attributes
         ----------
-        _pnames : list
-            Names assigned to the input bounds.
-        position : np.ndarray
-            Current position of the individual.
-        fitness : float
-            Fitness evaluation for the associated position.
+        _population : Population
+            Population holding the data for the individual.
+        _index : int
+            Row of the population corresponding to the individual.
         """
 
+        from .population import Population
+
         if not isinstance(bounds, dict):
             raise TypeError('bounds must be dict.')
 
-        self._pnames = list(bounds.keys())
-        _bounds = np.asarray(list(bounds.values()), dtype=np.float64)
+        self._population = Population(bounds, 1, rng)
+        self._index = 0
+
+    @classmethod
+    def view(cls, population, index):
+
+        """
+        Creates an individual viewing a row of a population.
+
+        Parameters
+        ----------
+        population : Population
+            Population holding the data for the individual.
+        index : int
+            Row of the population corresponding to the individual.
+
+        Returns
+        -------
+        Individual
+            View into the population, no data is copied.
+        """
+
+        individual = cls.__new__(cls)
+        individual._population = population
+        individual._index = index
+
+        return individual
+
+    def is_view_of(self, population, index):
+        return self._population is population and self._index == index
+
+    @property
+    def _pnames(self):
+        return self._population.pnames
+
+    @property
+    def lb(self):
+        return self._population.lb
+
+    @property
+    def ub(self):
+        return self._population.ub
+
+    @property
+    def position(self):
+        return self._population.positions[self._index]
+
+    @position.setter
+    def position(self, value):
+        self._population.positions[self._index] = value
+
+    @property
+    def fitness(self):
+        fitness = self._population.fitness[self._index]
+        return None if np.isnan(fitness) else float(fitness)
+
+    @fitness.setter
+    def fitness(self, value):
+        if value is None:
+            value = np.nan
+
+        self._population.fitness[self._index] = value
+
+    @property
+    def violation(self):
+        return float(self._population.violation[self._index])
+
+    def copy(self):
+
+        """
+        Creates an individual which owns a copy of this individual's data.
+
+        Returns
+        -------
+        Individual
+            Detached copy of the individual.
+        """
+
+        return Individual.view(self._population.take([self._index]), 0)
 
-        self.lb = _bounds[:, 0]
-        self.ub = _bounds[:, 1]
+    def __copy__(self):
+        return self.copy()
 
-        self.position = np.random.uniform(self.lb, self.ub)
-        self.fitness = None
+    def __deepcopy__(self, memo):
+        return self.copy()
 
     def __str__(self):
 
@@ -0,0 +1,260 @@
+import numpy as np
+import concurrent.futures as cf
+
+from .ssga import SSGA
+
+
+class AsyncSSGA(SSGA):
+
+    def __init__(self, bounds, n_individuals, n_iterations, n_in_flight=2,
+                 seed=None):
+
+        """
+        Initialiser for AsyncSSGA class.
+
+        Asynchronous steady-state GA - a number of evaluations are kept
+        in flight on the evaluator and each child is inserted into the
+        population as soon as its fitness is known, with a replacement
+        child bred immediately so that the workers never sit idle.
+
+        Parameters
+        ----------
+        bounds : dict
+            Lower and upper bounds of the search space.
+        n_individuals : int
+            Number of individuals for use in the population.
+        n_iterations : int
+            Number of children to insert into the population.
+        n_in_flight : int
+            Number of evaluations to keep in flight, this should be
+            at least the number of workers used by the evaluator.
+        seed : None, int, np.random.SeedSequence, np.random.Generator
+            Seed for the random number generator of the optimiser.
+
+        Attributes
+        ----------
+        pending : dict
+            Futures of the evaluations in flight mapped to the children.
+        brood : list
+            Children bred but not yet submitted for evaluation.
+        """
+
+        super().__init__(bounds, n_individuals, n_iterations, seed=seed)
+
+        if not n_in_flight >= 1:
+            raise ValueError('n_in_flight must be >= 1')
+
+        self.n_in_flight = n_in_flight
+
+        self.pending = {}
+        self.brood = []
+
+    def reset_environment(self):
+
+        """Responsible for resetting the optimisation environment."""
+
+        super().reset_environment()
+        self.cancel_pending()
+
+    def cancel_pending(self):
+
+        """
+        Cancels all evaluations which are still in flight, waiting for
+        those already running - these are counted as evaluations, as the
+        fitness function has been called.
+        """
+
+        for future in self.pending:
+            future.cancel()
+
+        running = [f for f in self.pending
+                   if not (f.cancelled() or getattr(f, 'completed', False))]
+        cf.wait(running)
+
+        for future in running:
+            self.n_evaluations += 1
+
+            if self.cache is not None and future.exception() is None:
+                self.cache.put(self.pending[future].position, future.result())
+
+        self.pending = {}
+        self.brood = []
+
+    def breed(self):
+
+        """
+        Provides the next child to evaluate, breeding a pair of children
+        from the current population when required.
+
+        Returns
+        -------
+        Individual
+            Child which has not yet been evaluated.
+        """
+
+        if not self.brood:
+            with self.timer.phase('selection'):
+                self.selection.preprocess(self.population)
+
+                pair = self.population.take(
+                    self.selection.select_many(self.population, 2)
+                )
+
+            self.cross_population(pair)
+            self.mutate_population(pair)
+            self.bound_population(pair)
+
+            with self.timer.phase('constraints'):
+                self.constraint_manager.prepare(pair)
+
+            self.brood.extend([pair[1], pair[0]])
+
+        return self.brood.pop()
+
+    def insert(self, child):
+
+        """
+        Inserts an evaluated child into the population, replacing a
+        randomly chosen member.
+
+        Parameters
+        ----------
+        child : Individual
+            Evaluated child to insert.
+        """
+
+        with self.timer.phase('constraints'):
+            feasible = self.constraint_manager.feasible(
+                child.position[np.newaxis]
+            )
+
+            if feasible[0] and child.fitness is not None:
+                self.update_best(child)
+
+        idx = self.rng.integers(len(self.population))
+        self.population[idx] = child
+
+    def submit(self, child, fn):
+
+        """
+        Submits a child for evaluation, a completed future is returned
+        when the fitness is already cached or the evaluation of the
+        infeasible child is skipped.
+
+        Parameters
+        ----------
+        child : Individual
+            Child to evaluate.
+        fn : function
+            Fitness function used to evaluate the fitness.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the fitness of the child.
+        """
+
+        required = self.constraint_manager.requires_evaluation(
+            np.array([child.violation])
+        )
+
+        if not required[0]:
+            return _completed(np.nan)
+
+        if self.cache is not None:
+            fitness = self.cache.get(child.position)
+
+            if fitness is not None:
+                return _completed(fitness)
+
+        return self.evaluator.submit(fn, child.position)
+
+    def step_optimise(self, fn):
+
+        """
+        Tops up the evaluations in flight and inserts the first child
+        whose evaluation completes.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        """
+
+        n_submit = min(self.n_in_flight, self.remaining_evaluations())
+
+        while len(self.pending) < n_submit:
+            child = self.breed()
+            self.pending[self.submit(child, fn)] = child
+
+        # nothing is in flight once the evaluation budget is spent.
+        if not self.pending:
+            return
+
+        with self.timer.phase('evaluation'):
+            done, _ = cf.wait(self.pending, return_when=cf.FIRST_COMPLETED)
+
+        future = next(iter(done))
+        child = self.pending.pop(future)
+        fitness = future.result()
+
+        if not getattr(future, 'completed', False):
+            self.n_evaluations += 1
+
+            if self.cache is not None:
+                self.cache.put(child.position, fitness)
+
+        child.fitness = self.constraint_manager.handle(
+            np.array([fitness]), np.array([child.violation])
+        )[0]
+
+        self.hooks.fire('on_evaluated', self, child.position[np.newaxis],
+                        np.array([child.fitness]))
+
+        self.insert(child)
+
+        with self.timer.phase('history'):
+            self.history.write_history()
+
+    def optimise(self, fn, resume_from=None):
+
+        """
+        Responsible for managing the optimisation process.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        resume_from : str
+            Checkpoint from which to resume the optimisation, children
+            in flight when the checkpoint was written are bred again.
+        """
+
+        try:
+            super().optimise(fn, resume_from)
+        finally:
+            self.cancel_pending()
+
+
+def _completed(fitness):
+
+    """
+    Creates a future which already holds a fitness, and so does not
+    count as an evaluation.
+
+    Parameters
+    ----------
+    fitness : float
+        Fitness held by the future.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Completed future.
+    """
+
+    future = cf.Future()
+    future.completed = True
+    future.set_result(fitness)
+
+    return future
@@ -1,9 +1,18 @@
 import abc
+import numpy as np
+
+from ..utils.evaluators import SerialEvaluator
+from ..utils.rng import check_rng, spawn_seeds
+from ..utils.hooks import HookRegistry
+from ..utils.callbacks import BaseCallback
+from ..utils.bounds import ClipBoundsHandler
+from ..utils.profiling import PhaseTimer
+from ..utils.checkpoint import save_checkpoint, load_checkpoint
 
 
 class BaseGA(abc.ABC):
 
-    def __init__(self, bounds, n_individuals):
+    def __init__(self, bounds, n_individuals, vectorized=False, seed=None):
 
         """
         Initialiser for the BaseGA class.
@@ -14,15 +23,51 @@ class BaseGA(abc.ABC):
             Lower and upper bounds of the search space.
         n_individuals : int
             Number of individuals for use in the population.
+        vectorized : bool
+            If True the fitness function receives the (n, d) position
+            matrix and returns an (n,) fitness vector.
+        seed : None, int, np.random.SeedSequence, np.random.Generator
+            Seed for the random number generator of the optimiser.
 
         Attributes
         ----------
         pnames : list
             Parameter names assigned to the bounds.
-        population : list
-            List of Individuals within the population.
+        population : Population
+            Positions and fitnesses of the population members.
         iteration : int
             Current iteration for the optimisation process.
+        n_evaluations : int
+            Number of fitness evaluations performed.
+        evaluator : BaseEvaluator
+            Evaluation engine used when not vectorized.
+        cache : FitnessCache
+            Optional cache of previously evaluated positions.
+        bounds_handler : BaseBoundsHandler
+            Returns offspring to the search space, None to disable.
+        initialiser : BaseInitialiser
+            Generates the initial population, uniform if None.
+        rng : np.random.Generator
+            Generator shared by the optimiser and its operators.
+        checkpoint_path : str
+            Location to which checkpoints are written, None to disable.
+        checkpoint_interval : int
+            Number of iterations between checkpoints.
+        timer : PhaseTimer
+            Time spent in each phase, enable with timer.enabled = True.
+        hooks : HookRegistry
+            Functions called at events of the optimisation, including
+            the methods of registered callbacks.
+        best_individual : Individual
+            The current best individual from the optimisation.
+        hall_of_fame : TopK, HallOfFame
+            Optional archive of the best solutions found.
+        warm_start_positions : np.ndarray
+            Positions seeded into the initial population, if not None.
+        warm_start_fitness : np.ndarray
+            Known fitness of the seeded positions, if not None.
+        stop_requested : bool
+            Whether the optimisation has been asked to stop early.
         """
 
         if not isinstance(bounds, dict):
@@ -35,9 +80,32 @@ class BaseGA(abc.ABC):
         self.pnames = list(bounds.keys())
 
         self.n_individuals = n_individuals
-        self.population = []
+        self.population = None
+        self.vectorized = vectorized
+        self.evaluator = SerialEvaluator()
+        self.cache = None
+        self.bounds_handler = ClipBoundsHandler()
+        self.initialiser = None
+        self.rng = check_rng(seed)
+
+        self.checkpoint_path = None
+        self.checkpoint_interval = 1
+
+        self.timer = PhaseTimer()
+        self.hooks = HookRegistry()
+
+        self.best_individual = None
+        self.hall_of_fame = None
+
+        self.warm_start_positions = None
+        self.warm_start_fitness = None
+        self._known_fitness = None
+        self._evaluated_population = None
+
+        self.stop_requested = False
 
         self.iteration = 0
+        self.n_evaluations = 0
 
     @abc.abstractmethod
     def reset_environment(self):
@@ -57,7 +125,7 @@ class BaseGA(abc.ABC):
     def initialise_population(self):
 
         """
-        Generates the population list of Individuals.
+        Generates the initial Population.
 
         Raises
         ------
@@ -67,6 +135,60 @@ class BaseGA(abc.ABC):
 
         raise NotImplementedError('BaseGA::initialise_population()')
 
+    def update_best(self, individual):
+
+        """
+        Updates the best_individual according to the fitness of the
+        individual which is passed as an argument.
+
+        Parameters
+        ----------
+        individual : Individual
+            Object to compare fitness with best_individual.
+        """
+
+        if self.best_individual is None:
+            self.best_individual = individual.copy()
+        elif individual.fitness < self.best_individual.fitness:
+            self.best_individual = individual.copy()
+
+        hall_of_fame = self.hall_of_fame
+        if hall_of_fame is not None and individual.fitness is not None:
+            hall_of_fame.push(individual.position, individual.fitness)
+
+    def update_best_population(self, population, feasible=None):
+
+        """
+        Updates the best_individual with the best member of the
+        population, copying only the winning row.
+
+        Parameters
+        ----------
+        population : Population
+            Population of evaluated members.
+        feasible : np.ndarray
+            Boolean mask of the members which may be the best, all
+            evaluated members are considered when None.
+        """
+
+        candidates = ~np.isnan(population.fitness)
+        if feasible is not None:
+            candidates &= feasible
+
+        rows = np.flatnonzero(candidates)
+        if not len(rows):
+            return
+
+        fitness = population.fitness[rows]
+        idx = rows[np.argmin(fitness)]
+
+        best = self.best_individual
+        if best is None or population.fitness[idx] < best.fitness:
+            self.best_individual = population[idx].copy()
+
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.update(population.positions[rows], fitness)
+
     @staticmethod
     @abc.abstractmethod
     def evaluate_fitness(individual, fn):
@@ -89,6 +211,485 @@ class BaseGA(abc.ABC):
 
         raise NotImplementedError('BaseGA::evaluate_fitness()')
 
+    def bind_rng(self):
+
+        """Assigns the generator of the optimiser to its operators."""
+
+        names = ('selection', 'death_selection', 'crossover', 'mutation',
+                 'bounds_handler', 'initialiser')
+
+        for name in names:
+            operator = getattr(self, name, None)
+
+            if operator is not None:
+                operator.rng = self.rng
+
+    def spawn_seeds(self, n):
+
+        """
+        Spawns independent seed sequences for parallel workers.
+
+        Parameters
+        ----------
+        n : int
+            Number of seed sequences to spawn.
+
+        Returns
+        -------
+        list
+            Independent np.random.SeedSequence objects.
+        """
+
+        return spawn_seeds(self.rng, n)
+
+    def checkpoint(self):
+
+        """Writes a checkpoint if one is due at the current iteration."""
+
+        if self.checkpoint_path is None:
+            return
+
+        if self.iteration % self.checkpoint_interval == 0:
+            with self.timer.phase('checkpoint'):
+                save_checkpoint(self, self.checkpoint_path)
+
+    def resume(self, path):
+
+        """
+        Restores the optimisation state from a checkpoint.
+
+        Parameters
+        ----------
+        path : str
+            Location of the checkpoint file.
+        """
+
+        self._known_fitness = None
+        load_checkpoint(self, path)
+
+    def warm_start(self, positions, fitness=None):
+
+        """
+        Seeds the initial population of subsequent optimisations with
+        known positions, the remaining members are drawn at random.
+
+        Parameters
+        ----------
+        positions : array_like
+            Positions of shape (m, d), if m exceeds the number of
+            individuals the best (or first) positions are used.
+        fitness : array_like
+            Fitness of shape (m,) of the positions, which are then not
+            evaluated again - NaN marks positions to evaluate.
+        """
+
+        positions = np.atleast_2d(np.asarray(positions, dtype=np.float64))
+
+        if not positions.shape[1] == len(self.bounds):
+            raise ValueError('positions do not match the search space.')
+
+        if fitness is not None:
+            fitness = np.asarray(fitness, dtype=np.float64)
+
+            if not fitness.shape == (len(positions),):
+                raise ValueError('fitness must have a value per position.')
+
+            # prefer the best positions when there are too many.
+            order = np.argsort(fitness, kind='stable')
+            positions, fitness = positions[order], fitness[order]
+
+        self.warm_start_positions = positions[:self.n_individuals]
+        self.warm_start_fitness = (None if fitness is None
+                                   else fitness[:self.n_individuals])
+
+    def warm_start_from(self, path):
+
+        """
+        Seeds the initial population from the population of a
+        checkpoint or the solutions of a saved HallOfFame.
+
+        The fitness stored in a checkpoint belongs to the parents of
+        the population, so positions from a checkpoint are evaluated
+        again, whereas archived solutions keep their fitness.
+
+        Parameters
+        ----------
+        path : str
+            Location of the checkpoint or HallOfFame file.
+        """
+
+        with np.load(path) as data:
+            positions = data['positions']
+            fitness = None if 'iteration' in data.files else data['fitness']
+
+        self.warm_start(positions, fitness)
+
+    def apply_warm_start(self, population):
+
+        """
+        Writes the warm start positions into the leading members of the
+        initial population.
+
+        Parameters
+        ----------
+        population : Population
+            Initial population to seed.
+        """
+
+        self._known_fitness = None
+
+        if self.warm_start_positions is None:
+            return
+
+        n_seed = len(self.warm_start_positions)
+        population.positions[:n_seed] = self.warm_start_positions
+
+        if self.bounds_handler is not None:
+            population.positions[:n_seed] = self.bounds_handler.apply(
+                population.positions[:n_seed], population.lb, population.ub
+            )
+
+        if self.warm_start_fitness is not None:
+            population.fitness[:n_seed] = self.warm_start_fitness
+
+            self._known_fitness = np.zeros(len(population), dtype=bool)
+            self._known_fitness[:n_seed] = ~np.isnan(self.warm_start_fitness)
+
+    def run_generation(self, fn):
+
+        """
+        Progresses the optimisation by a single iteration, calling the
+        generation hooks and writing any checkpoint which is due.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        """
+
+        self.hooks.fire('on_generation_start', self)
+
+        self.step_optimise(fn)
+        self.iteration += 1
+
+        if self.hooks.fire('on_generation_end', self):
+            self.request_stop()
+
+        self.checkpoint()
+
+    def register_callback(self, callback):
+
+        """
+        Adds a callback to observe the optimisation, registering its
+        methods named after events as hooks.
+
+        Parameters
+        ----------
+        callback : BaseCallback
+            The callback to add.
+        """
+
+        if not isinstance(callback, BaseCallback):
+            raise TypeError('callback must inherit from BaseCallback')
+
+        for event in self.hooks.events:
+            fn = getattr(callback, event, None)
+
+            if fn is not None:
+                self.hooks.register(event, fn)
+
+    def request_stop(self):
+
+        """Stops the optimisation after the current generation."""
+
+        self.stop_requested = True
+
+    def is_finished(self):
+
+        """
+        Checks whether the optimisation should end.
+
+        Returns
+        -------
+        bool
+            True if a stop was requested or termination criteria met.
+        """
+
+        return (self.stop_requested
+                or self.termination_manager.termination_check())
+
+    def evaluate_initial_population(self, fn):
+
+        """
+        Prepares the fitness of the initial population, called when
+        not resuming from a checkpoint - the population is evaluated
+        within step_optimise() by default, so nothing is done here.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        """
+
+        pass
+
+    def evaluate_population(self, population, fn):
+
+        """
+        Sets the fitness of every member of the population.
+
+        Parameters
+        ----------
+        population : Population
+            Population for which to assess the fitness.
+        fn : function
+            Fitness function used to evaluate the fitness.
+        """
+
+        # members seeded with a known fitness skip their first evaluation.
+        if self._known_fitness is not None and population is self.population:
+            rows = np.flatnonzero(~self._known_fitness)
+            self._known_fitness = None
+
+            if len(rows):
+                subset = population.take(rows)
+                self.evaluate_population(subset, fn)
+                population.put(rows, subset)
+
+            self._evaluated_population = population
+            return
+
+        constraint_manager = getattr(self, 'constraint_manager', None)
+
+        with self.timer.phase('evaluation'):
+            if constraint_manager is None:
+                population.fitness[:] = self._evaluate_objective(
+                    population.positions, fn
+                )
+            else:
+                constraint_manager.evaluate(
+                    population,
+                    lambda positions: self._evaluate_objective(positions, fn)
+                )
+
+        if population is self.population:
+            self._evaluated_population = population
+
+        self.hooks.fire('on_evaluated', self, population.positions,
+                        population.fitness)
+
+    def evaluate_pending(self, fn):
+
+        """
+        Evaluates the population if it holds offspring awaiting
+        evaluation, whose fitness is still that of their parents. The
+        next generation then skips the evaluation of these members.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        """
+
+        if self.population is self._evaluated_population:
+            return
+
+        self.evaluate_population(self.population, fn)
+        self._known_fitness = np.ones(len(self.population), dtype=bool)
+
+    def _evaluate_objective(self, positions, fn):
+
+        """
+        Evaluates the fitness at each of the positions, through the
+        cache when one is set.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) at which to evaluate fn.
+        fn : function
+            Fitness function used to evaluate the fitness.
+
+        Returns
+        -------
+        np.ndarray
+            Fitnesses of shape (n,).
+        """
+
+        if self.cache is None:
+            return self._evaluate_budget(positions, fn)
+
+        fitness, _ = self.cache.evaluate(
+            positions, lambda p: self._evaluate_budget(p, fn)
+        )
+
+        return fitness
+
+    def _evaluate_budget(self, positions, fn):
+
+        """
+        Evaluates the fitness at as many of the positions as the
+        evaluation budget allows, counting the evaluations performed.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) at which to evaluate fn.
+        fn : function
+            Fitness function used to evaluate the fitness.
+
+        Returns
+        -------
+        np.ndarray
+            Fitnesses of shape (n,), np.inf for positions beyond the
+            budget so that they are never preferred.
+        """
+
+        n_evaluate = min(len(positions), self.remaining_evaluations())
+
+        if n_evaluate == len(positions):
+            fitness = self._evaluate_positions(positions, fn)
+        else:
+            fitness = np.full(len(positions), np.inf)
+            if n_evaluate:
+                fitness[:n_evaluate] = self._evaluate_positions(
+                    positions[:n_evaluate], fn
+                )
+
+        self.n_evaluations += n_evaluate
+        return fitness
+
+    def remaining_evaluations(self):
+
+        """
+        Provides the number of evaluations left in the budget of the
+        termination manager.
+
+        Returns
+        -------
+        int or float
+            Evaluations remaining, np.inf if the budget is unlimited.
+        """
+
+        budget = self.termination_manager.evaluation_budget
+
+        if budget is None:
+            return np.inf
+
+        return max(budget - self.n_evaluations, 0)
+
+    def _evaluate_positions(self, positions, fn):
+
+        """
+        Evaluates the fitness function at each of the positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) at which to evaluate fn.
+        fn : function
+            Fitness function used to evaluate the fitness.
+
+        Returns
+        -------
+        np.ndarray
+            Fitnesses of shape (n,).
+
+        Raises
+        ------
+        ValueError
+            If a vectorized fn does not return a fitness per position.
+        """
+
+        if self.vectorized:
+            fitness = np.asarray(fn(positions), dtype=np.float64)
+
+            if not fitness.shape == (len(positions),):
+                raise ValueError(
+                    f'vectorized fn must return shape ({len(positions)},), '
+                    f'got {fitness.shape}.'
+                )
+
+            return fitness
+
+        return self.evaluator.evaluate(fn, positions)
+
+    def cross_population(self, population, start=0):
+
+        """
+        Applies the crossover in place to consecutive pairs of members,
+        using the batch implementation of the crossover when available.
+
+        Parameters
+        ----------
+        population : Population
+            Population holding the pairs of parents.
+        start : int
+            Index of the first member to cross.
+        """
+
+        with self.timer.phase('crossover'):
+            parents_a = population.positions[start::2]
+            parents_b = population.positions[start + 1::2]
+
+            try:
+                parents_a[:], parents_b[:] = self.crossover.cross_batch(
+                    parents_a, parents_b, population.lb, population.ub
+                )
+            except NotImplementedError:
+                for i in range(start, len(population), 2):
+                    population[i], population[i + 1] = self.crossover.cross(
+                        population[i], population[i + 1]
+                    )
+
+    def mutate_population(self, population, start=0):
+
+        """
+        Applies the mutation in place to the members of the population,
+        using the batch implementation of the mutation when available.
+
+        Parameters
+        ----------
+        population : Population
+            Population holding the members to mutate.
+        start : int
+            Index of the first member to mutate.
+        """
+
+        with self.timer.phase('mutation'):
+            positions = population.positions[start:]
+
+            try:
+                positions[:] = self.mutation.mutate_batch(
+                    positions, population.lb, population.ub
+                )
+            except NotImplementedError:
+                for i in range(start, len(population)):
+                    population[i] = self.mutation.mutate(population[i])
+
+    def bound_population(self, population, start=0):
+
+        """
+        Returns the members of the population to the search space using
+        the bounds handler of the optimiser.
+
+        Parameters
+        ----------
+        population : Population
+            Population holding the members to bound.
+        start : int
+            Index of the first member to bound.
+        """
+
+        if self.bounds_handler is None:
+            return
+
+        with self.timer.phase('bounds'):
+            positions = population.positions[start:]
+            positions[:] = self.bounds_handler.apply(
+                positions, population.lb, population.ub
+            )
+
     @abc.abstractmethod
     def step_optimise(self, fn):
 
@@ -108,8 +709,7 @@ class BaseGA(abc.ABC):
 
         raise NotImplementedError('BaseGA::step_optimise()')
 
-    @abc.abstractmethod
-    def optimise(self, fn):
+    def optimise(self, fn, resume_from=None):
 
         """
         Responsible for managing the optimisation process.
@@ -118,11 +718,26 @@ class BaseGA(abc.ABC):
         ----------
         fn : function
             Fitness function used to evaluate the fitness.
-
-        Raises
-        ------
-        NotImplementedError
-            Method has not yet been implemented.
+        resume_from : str
+            Checkpoint from which to resume the optimisation.
         """
 
-        raise NotImplementedError('BaseGA::optimise()')
+        self.reset_environment()
+        self.bind_rng()
+        self.initialise_population()
+
+        if resume_from is not None:
+            self.resume(resume_from)
+        else:
+            self.evaluate_initial_population(fn)
+
+        self.stop_requested = False
+
+        self.hooks.fire('on_optimise_start', self)
+
+        while not self.is_finished():
+            self.run_generation(fn)
+
+        self.history.flush()
+
+        self.hooks.fire('on_optimise_end', self)
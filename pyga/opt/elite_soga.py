@@ -1,7 +1,7 @@
-import copy
+import numpy as np
 
 from .base_ga import BaseGA
-from ..individual import Individual
+from ..population import Population
 from ..constraints.constraint_manager import ConstraintManager
 
 from ..utils.history import GeneralHistory
@@ -13,7 +13,8 @@ from ..utils.termination_manager import IterationTerminationManager
 
 class EliteSOGA(BaseGA):
 
-    def __init__(self, bounds, n_individuals, n_elites, n_iterations):
+    def __init__(self, bounds, n_individuals, n_elites, n_iterations,
+                 vectorized=False, seed=None):
 
         """
         Initialiser for EliteSOGA class.
@@ -28,6 +29,11 @@ class EliteSOGA(BaseGA):
             Number of elites to maintain at each iteration.
         n_iterations : int
             Number of iterations to optimise for.
+        vectorized : bool
+            If True the fitness function is evaluated on the whole
+            position matrix in a single call.
+        seed : None, int, np.random.SeedSequence, np.random.Generator
+            Seed for the random number generator of the optimiser.
 
         Attributes
         ----------
@@ -47,15 +53,13 @@ class EliteSOGA(BaseGA):
             Manager to determine if imposed constraints are violated.
         """
 
-        super().__init__(bounds, n_individuals)
+        super().__init__(bounds, n_individuals, vectorized, seed)
 
         if not n_elites % 2 == 0:
             raise ValueError('Number of elites must be even.')
 
         self.n_elites = n_elites
         self.n_iterations = n_iterations
-        self.best_individual = None
-
         self.mutation = RandomMutation()
         self.selection = TournamentSelection()
         self.crossover = OnePointCrossover()
@@ -69,32 +73,24 @@ class EliteSOGA(BaseGA):
         """Responsible for resetting the optimisation environment."""
 
         self.iteration = 0
-        self.population = []
+        self.n_evaluations = 0
+        self.population = None
         self.best_individual = None
 
-    def initialise_population(self):
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.clear()
 
-        """Generates the population list of Individuals."""
+        self.constraint_manager.reset()
 
-        for _ in range(self.n_individuals):
-            self.population.append(Individual(self.bounds))
-
-    def update_best(self, individual):
+    def initialise_population(self):
 
-        """
-        Updates the best_individual according to the fitness of the
-        individual which is passed as an argument.
+        """Generates the initial Population."""
 
-        Parameters
-        ----------
-        individual : Individual
-            Object to compare fitness with best_individual.
-        """
+        self.population = Population(
+            self.bounds, self.n_individuals, self.rng, self.initialiser
+        )
 
-        if self.best_individual is None:
-            self.best_individual = copy.deepcopy(individual)
-        elif individual.fitness < self.best_individual.fitness:
-            self.best_individual = copy.deepcopy(individual)
+        self.apply_warm_start(self.population)
 
     @staticmethod
     def evaluate_fitness(individual, fn):
@@ -123,45 +119,36 @@ class EliteSOGA(BaseGA):
             Fitness function used to evaluate the fitness.
         """
 
-        for individual in self.population:
-            self.evaluate_fitness(individual, fn)
+        self.evaluate_population(self.population, fn)
 
-            if not self.constraint_manager.violates_position(individual):
-                self.update_best(individual)
+        with self.timer.phase('constraints'):
+            feasible = self.constraint_manager.feasible(
+                self.population.positions
+            )
 
-        self.selection.preprocess(self.population)
+            self.update_best_population(self.population, feasible)
 
-        _ps = sorted(self.population, key=lambda x: x.fitness)
-        _population = _ps[:self.n_elites]
+        # recorded before the population is replaced by the offspring,
+        # whose fitness is not known until the next generation.
+        with self.timer.phase('history'):
+            self.history.write_history()
 
-        for i in range((self.n_individuals - self.n_elites) // 2):
-            parent_a = self.selection.select(self.population)
-            parent_b = self.selection.select(self.population)
+        with self.timer.phase('selection'):
+            self.selection.preprocess(self.population)
 
-            child_a, child_b = self.crossover.cross(parent_a, parent_b)
+            _order = np.argsort(self.population.rank_key(), kind='stable')
+            _selected = self.selection.select_many(
+                self.population, self.n_individuals - self.n_elites
+            )
 
-            child_a = self.mutation.mutate(child_a)
-            child_b = self.mutation.mutate(child_b)
+            offspring = self.population.take(
+                np.concatenate([_order[:self.n_elites], _selected])
+            )
 
-            _population.extend([child_a, child_b])
+        self.cross_population(offspring, start=self.n_elites)
 
-        self.population = _population
-        self.history.write_history()
-
-    def optimise(self, fn):
-
-        """
-        Responsible for managing the optimisation process.
-
-        Parameters
-        ----------
-        fn : function
-            Fitness function used to evaluate the fitness.
-        """
+        self.mutate_population(offspring, start=self.n_elites)
 
-        self.reset_environment()
-        self.initialise_population()
+        self.bound_population(offspring, start=self.n_elites)
 
-        while not self.termination_manager.termination_check():
-            self.step_optimise(fn)
-            self.iteration += 1
+        self.population = offspring
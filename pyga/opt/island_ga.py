@@ -0,0 +1,362 @@
+import traceback
+import numpy as np
+import multiprocessing as mp
+
+from ..utils.rng import check_rng, spawn_seeds
+
+
+class IslandGA:
+
+    topologies = ('ring', 'full', 'random')
+
+    def __init__(self, factory, n_islands, migration_interval=10,
+                 n_migrants=2, topology='ring', seed=None):
+
+        """
+        Initialiser for IslandGA class.
+
+        Runs independent optimisers (islands) in separate processes and
+        periodically migrates the fittest members between them.
+
+        Parameters
+        ----------
+        factory : function
+            Picklable callable returning a new SOGA / EliteSOGA when
+            called as factory(seed=seed), e.g. functools.partial(SOGA,
+            bounds, n_individuals, n_iterations).
+        n_islands : int
+            Number of islands, each run in its own process.
+        migration_interval : int
+            Number of iterations between migrations.
+        n_migrants : int
+            Number of individuals received by each island per migration.
+        topology : str
+            Migration topology, one of 'ring', 'full' or 'random'.
+        seed : None, int, np.random.SeedSequence, np.random.Generator
+            Root seed from which the seed of each island is spawned.
+
+        Attributes
+        ----------
+        best_individual : Individual
+            The best individual found across all of the islands.
+        arr_best_fitness : list
+            Best fitness across all islands after each migration.
+        hall_of_fame : TopK, HallOfFame
+            Optional archive of the best solutions of the islands.
+        """
+
+        if not n_islands >= 2:
+            raise ValueError('n_islands must be >= 2')
+
+        if topology not in self.topologies:
+            raise ValueError(f'topology must be one of {self.topologies}')
+
+        if not migration_interval >= 1:
+            raise ValueError('migration_interval must be >= 1')
+
+        self.factory = factory
+        self.n_islands = n_islands
+        self.migration_interval = migration_interval
+        self.n_migrants = n_migrants
+        self.topology = topology
+        self.rng = check_rng(seed)
+
+        self.best_individual = None
+        self.arr_best_fitness = []
+        self.hall_of_fame = None
+
+    def sources(self, idx):
+
+        """
+        Determines the islands from which an island receives migrants.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the receiving island.
+
+        Returns
+        -------
+        list
+            Indices of the islands sending migrants.
+        """
+
+        if self.topology == 'ring':
+            return [(idx - 1) % self.n_islands]
+
+        others = [i for i in range(self.n_islands) if i != idx]
+
+        if self.topology == 'full':
+            return others
+
+        return [others[self.rng.integers(len(others))]]
+
+    def migrate(self, emigrants):
+
+        """
+        Routes the emigrants of each island according to the topology.
+
+        Parameters
+        ----------
+        emigrants : list
+            (positions, fitness) of the emigrants of each island.
+
+        Returns
+        -------
+        list
+            (positions, fitness) of the immigrants for each island.
+        """
+
+        immigrants = []
+        for idx in range(self.n_islands):
+            src = self.sources(idx)
+
+            positions = np.concatenate([emigrants[i][0] for i in src])
+            fitness = np.concatenate([emigrants[i][1] for i in src])
+
+            _order = np.argsort(fitness, kind='stable')[:self.n_migrants]
+            immigrants.append((positions[_order], fitness[_order]))
+
+        return immigrants
+
+    def update_best(self, individual):
+
+        """
+        Updates the best_individual with the best of an island.
+
+        Parameters
+        ----------
+        individual : Individual
+            Best individual of an island.
+        """
+
+        if individual is None:
+            return
+
+        if self.best_individual is None:
+            self.best_individual = individual
+        elif individual.fitness < self.best_individual.fitness:
+            self.best_individual = individual
+
+    def optimise(self, fn):
+
+        """
+        Responsible for managing the optimisation process.
+
+        Parameters
+        ----------
+        fn : function
+            Picklable fitness function used to evaluate the fitness.
+        """
+
+        self.best_individual = None
+        self.arr_best_fitness = []
+
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.clear()
+
+        ctx = mp.get_context()
+        seeds = spawn_seeds(self.rng, self.n_islands)
+
+        pipes, processes = [], []
+        for seed in seeds:
+            conn, child_conn = ctx.Pipe()
+            process = ctx.Process(
+                target=_island_worker,
+                args=(child_conn, self.factory, seed, fn,
+                      self.migration_interval, self.n_migrants),
+                daemon=True
+            )
+            process.start()
+            child_conn.close()
+
+            pipes.append(conn)
+            processes.append(process)
+
+        try:
+            immigrants = [None] * self.n_islands
+            active = [True] * self.n_islands
+
+            while any(active):
+                for conn, imm in zip(pipes, immigrants):
+                    conn.send(('step', imm))
+
+                replies = [_receive(conn) for conn in pipes]
+
+                for idx, (emigrants, best, done) in enumerate(replies):
+                    self.update_best(best)
+
+                    if self.hall_of_fame is not None:
+                        self.hall_of_fame.update(*emigrants)
+                    active[idx] = not done
+
+                # no island may have found a feasible member yet.
+                best = self.best_individual
+                self.arr_best_fitness.append(
+                    np.nan if best is None else best.fitness
+                )
+                immigrants = self.migrate([r[0] for r in replies])
+
+            for conn in pipes:
+                conn.send(('stop', None))
+
+        finally:
+            for conn in pipes:
+                conn.close()
+
+            for process in processes:
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+
+
+def _receive(conn):
+
+    """
+    Receives a reply from an island, raising any error it reports.
+
+    Parameters
+    ----------
+    conn : multiprocessing.connection.Connection
+        Connection to the island.
+
+    Returns
+    -------
+    tuple
+        Emigrants, best individual and whether the island has finished.
+    """
+
+    status, payload = conn.recv()
+
+    if status == 'error':
+        raise RuntimeError(f'Island failed with:\n{payload}')
+
+    return payload
+
+
+def _island_worker(conn, factory, seed, fn, migration_interval, n_migrants):
+
+    """
+    Runs a single island, stepping the optimiser between migrations.
+
+    Parameters
+    ----------
+    conn : multiprocessing.connection.Connection
+        Connection to the IslandGA.
+    factory : function
+        Callable returning the optimiser for the island.
+    seed : np.random.SeedSequence
+        Seed for the optimiser of the island.
+    fn : function
+        Fitness function used to evaluate the fitness.
+    migration_interval : int
+        Number of iterations between migrations.
+    n_migrants : int
+        Number of individuals to send per migration.
+    """
+
+    try:
+        ga = factory(seed=seed)
+
+        ga.reset_environment()
+        ga.bind_rng()
+        ga.initialise_population()
+        ga.evaluate_initial_population(fn)
+
+        emigrants = _Emigrants(n_migrants, len(ga.pnames))
+        ga.hooks.register('on_evaluated', emigrants)
+
+        while True:
+            command, immigrants = conn.recv()
+
+            if command == 'stop':
+                break
+
+            if (immigrants is not None and len(immigrants[1])
+                    and not ga.is_finished()):
+                # immigrants replace the worst members by their fitness.
+                ga.evaluate_pending(fn)
+
+                population = ga.population
+                positions, fitness = immigrants
+                worst = np.argsort(population.rank_key())[::-1][:len(fitness)]
+
+                population.positions[worst] = positions
+                population.fitness[worst] = fitness
+
+            for _ in range(migration_interval):
+                if ga.is_finished():
+                    break
+
+                ga.run_generation(fn)
+
+            done = ga.is_finished()
+
+            conn.send(('ok', (emigrants.pop(), ga.best_individual, done)))
+
+    except EOFError:
+        pass
+
+    except Exception:
+        conn.send(('error', traceback.format_exc()))
+
+    finally:
+        conn.close()
+
+
+class _Emigrants:
+
+    """
+    Keeps the best feasible members evaluated by an island since the
+    last migration, registered as an on_evaluated hook.
+    """
+
+    def __init__(self, n_migrants, n_dims):
+
+        """
+        Initialises the _Emigrants.
+
+        Parameters
+        ----------
+        n_migrants : int
+            Number of members to keep.
+        n_dims : int
+            Number of dimensions of the search space.
+        """
+
+        self.n_migrants = n_migrants
+        self.n_dims = n_dims
+
+        self.positions = np.empty((0, n_dims))
+        self.fitness = np.empty(0)
+
+    def __call__(self, ga, positions, fitness):
+        keep = np.isfinite(fitness)
+
+        constraint_manager = getattr(ga, 'constraint_manager', None)
+        if constraint_manager is not None:
+            keep &= constraint_manager.feasible(positions)
+
+        positions = np.concatenate([self.positions, positions[keep]])
+        fitness = np.concatenate([self.fitness, fitness[keep]])
+
+        best = np.argsort(fitness, kind='stable')[:self.n_migrants]
+        self.positions, self.fitness = positions[best], fitness[best]
+
+    def pop(self):
+
+        """
+        Provides the members kept since the last migration.
+
+        Returns
+        -------
+        tuple
+            (positions, fitness) of the emigrants, possibly empty.
+        """
+
+        emigrants = (self.positions, self.fitness)
+
+        self.positions = np.empty((0, self.n_dims))
+        self.fitness = np.empty(0)
+
+        return emigrants
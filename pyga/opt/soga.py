@@ -1,7 +1,5 @@
-import copy
-
 from .base_ga import BaseGA
-from ..individual import Individual
+from ..population import Population
 from ..constraints.constraint_manager import ConstraintManager
 
 from ..utils.history import GeneralHistory
@@ -13,7 +11,8 @@ from ..utils.termination_manager import IterationTerminationManager
 
 class SOGA(BaseGA):
 
-    def __init__(self, bounds, n_individuals, n_iterations):
+    def __init__(self, bounds, n_individuals, n_iterations,
+                 vectorized=False, seed=None):
 
         """
         Initialiser for SOGA class.
@@ -26,6 +25,11 @@ class SOGA(BaseGA):
             Number of individuals for use in the population.
         n_iterations : int
             Number of iterations to optimise for.
+        vectorized : bool
+            If True the fitness function is evaluated on the whole
+            position matrix in a single call.
+        seed : None, int, np.random.SeedSequence, np.random.Generator
+            Seed for the random number generator of the optimiser.
 
         Attributes
         ----------
@@ -45,11 +49,9 @@ class SOGA(BaseGA):
             Manager to determine if imposed constraints are violated.
         """
 
-        super().__init__(bounds, n_individuals)
+        super().__init__(bounds, n_individuals, vectorized, seed)
 
         self.n_iterations = n_iterations
-        self.best_individual = None
-
         self.mutation = RandomMutation()
         self.selection = TournamentSelection()
         self.crossover = OnePointCrossover()
@@ -63,32 +65,24 @@ class SOGA(BaseGA):
         """Responsible for resetting the optimisation environment."""
 
         self.iteration = 0
-        self.population = []
+        self.n_evaluations = 0
+        self.population = None
         self.best_individual = None
 
-    def initialise_population(self):
-
-        """Generates the population list of Individuals."""
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.clear()
 
-        for _ in range(self.n_individuals):
-            self.population.append(Individual(self.bounds))
+        self.constraint_manager.reset()
 
-    def update_best(self, individual):
+    def initialise_population(self):
 
-        """
-        Updates the best_individual according to the fitness of the
-        individual which is passed as an argument.
+        """Generates the initial Population."""
 
-        Parameters
-        ----------
-        individual : Individual
-            Object to compare fitness with best_individual.
-        """
+        self.population = Population(
+            self.bounds, self.n_individuals, self.rng, self.initialiser
+        )
 
-        if self.best_individual is None:
-            self.best_individual = copy.deepcopy(individual)
-        elif individual.fitness < self.best_individual.fitness:
-            self.best_individual = copy.deepcopy(individual)
+        self.apply_warm_start(self.population)
 
     @staticmethod
     def evaluate_fitness(individual, fn):
@@ -117,43 +111,32 @@ class SOGA(BaseGA):
             Fitness function used to evaluate the fitness.
         """
 
-        for individual in self.population:
-            self.evaluate_fitness(individual, fn)
-
-            if not self.constraint_manager.violates_position(individual):
-                self.update_best(individual)
-
-        self.selection.preprocess(self.population)
+        self.evaluate_population(self.population, fn)
 
-        _population = []
-        for i in range(self.n_individuals // 2):
-            parent_a = self.selection.select(self.population)
-            parent_b = self.selection.select(self.population)
+        with self.timer.phase('constraints'):
+            feasible = self.constraint_manager.feasible(
+                self.population.positions
+            )
 
-            child_a, child_b = self.crossover.cross(parent_a, parent_b)
+            self.update_best_population(self.population, feasible)
 
-            child_a = self.mutation.mutate(child_a)
-            child_b = self.mutation.mutate(child_b)
+        # recorded before the population is replaced by the offspring,
+        # whose fitness is not known until the next generation.
+        with self.timer.phase('history'):
+            self.history.write_history()
 
-            _population.extend([child_a, child_b])
+        with self.timer.phase('selection'):
+            self.selection.preprocess(self.population)
 
-        self.population = _population
-        self.history.write_history()
+            offspring = self.population.take(
+                self.selection.select_many(self.population,
+                                           self.n_individuals)
+            )
 
-    def optimise(self, fn):
-
-        """
-        Responsible for managing the optimisation process.
+        self.cross_population(offspring)
 
-        Parameters
-        ----------
-        fn : function
-            Fitness function used to evaluate the fitness.
-        """
+        self.mutate_population(offspring)
 
-        self.reset_environment()
-        self.initialise_population()
+        self.bound_population(offspring)
 
-        while not self.termination_manager.termination_check():
-            self.step_optimise(fn)
-            self.iteration += 1
+        self.population = offspring
@@ -1,8 +1,5 @@
-import copy
-import numpy as np
-
 from .base_ga import BaseGA
-from ..individual import Individual
+from ..population import Population
 from ..constraints.constraint_manager import ConstraintManager
 
 from ..utils.history import GeneralHistory
@@ -14,12 +11,11 @@ from ..utils.termination_manager import IterationTerminationManager
 
 class SSGA(BaseGA):
 
-    def __init__(self, bounds, n_individuals, n_iterations):
-        super().__init__(bounds, n_individuals)
+    def __init__(self, bounds, n_individuals, n_iterations,
+                 vectorized=False, seed=None):
+        super().__init__(bounds, n_individuals, vectorized, seed)
 
         self.n_iterations = n_iterations
-        self.best_individual = None
-
         self.mutation = RandomMutation()
         self.selection = TournamentSelection()
         self.death_selection = RandomSelection()
@@ -34,32 +30,24 @@ class SSGA(BaseGA):
         """Responsible for resetting the optimisation environment."""
 
         self.iteration = 0
-        self.population = []
+        self.n_evaluations = 0
+        self.population = None
         self.best_individual = None
 
-    def initialise_population(self):
+        if self.hall_of_fame is not None:
+            self.hall_of_fame.clear()
 
-        """Generates the population list of Individuals."""
+        self.constraint_manager.reset()
 
-        for _ in range(self.n_individuals):
-            self.population.append(Individual(self.bounds))
-
-    def update_best(self, individual):
+    def initialise_population(self):
 
-        """
-        Updates the best_individual according to the fitness of the
-        individual which is passed as an argument.
+        """Generates the initial Population."""
 
-        Parameters
-        ----------
-        individual : Individual
-            Object to compare fitness with best_individual.
-        """
+        self.population = Population(
+            self.bounds, self.n_individuals, self.rng, self.initialiser
+        )
 
-        if self.best_individual is None:
-            self.best_individual = copy.deepcopy(individual)
-        elif individual.fitness < self.best_individual.fitness:
-            self.best_individual = copy.deepcopy(individual)
+        self.apply_warm_start(self.population)
 
     @staticmethod
     def evaluate_fitness(individual, fn):
@@ -88,36 +76,41 @@ class SSGA(BaseGA):
             Fitness function used to evaluate the fitness.
         """
 
-        parent_a = self.selection.select(self.population)
-        parent_b = self.selection.select(self.population)
+        with self.timer.phase('selection'):
+            self.selection.preprocess(self.population)
 
-        child_a, child_b = self.crossover.cross(parent_a, parent_b)
+            offspring = self.population.take(
+                self.selection.select_many(self.population, 2)
+            )
 
-        child_a = self.mutation.mutate(child_a)
-        child_b = self.mutation.mutate(child_b)
+        self.cross_population(offspring)
 
-        self.evaluate_fitness(child_a, fn)
-        self.update_best(child_a)
+        self.mutate_population(offspring)
 
-        self.evaluate_fitness(child_b, fn)
-        self.update_best(child_b)
+        self.bound_population(offspring)
 
-        idx_pd = np.random.randint(0, len(self.population))
-        idx_pe = np.random.randint(0, len(self.population))
+        idx_pd = self.rng.integers(len(self.population))
+        idx_pe = self.rng.integers(len(self.population))
 
         while idx_pd == idx_pe:
-            idx_pe = np.random.randint(0, len(self.population))
+            idx_pe = self.rng.integers(len(self.population))
 
-        for i in sorted([idx_pd, idx_pe], reverse=True):
-            self.population.pop(i)
+        self.evaluate_population(offspring, fn)
 
-        self.population.extend([child_a, child_b])
-        self.history.write_history()
+        with self.timer.phase('constraints'):
+            feasible = self.constraint_manager.feasible(offspring.positions)
 
-    def optimise(self, fn):
+            self.update_best_population(offspring, feasible)
+
+        self.population.put([idx_pd, idx_pe], offspring)
+        with self.timer.phase('history'):
+            self.history.write_history()
+
+    def evaluate_initial_population(self, fn):
 
         """
-        Responsible for managing the optimisation process.
+        Evaluates the initial population, as children are evaluated
+        before they are inserted into the population.
 
         Parameters
         ----------
@@ -125,15 +118,10 @@ class SSGA(BaseGA):
             Fitness function used to evaluate the fitness.
         """
 
-        self.reset_environment()
-        self.initialise_population()
-
-        for individual in self.population:
-            self.evaluate_fitness(individual, fn)
+        self.evaluate_population(self.population, fn)
 
-            if not self.constraint_manager.violates_position(individual):
-                self.update_best(individual)
+        feasible = self.constraint_manager.feasible(
+            self.population.positions
+        )
 
-        while not self.termination_manager.termination_check():
-            self.step_optimise(fn)
-            self.iteration += 1
+        self.update_best_population(self.population, feasible)
@@ -0,0 +1,199 @@
+import copy
+import numpy as np
+
+from .individual import Individual
+from .utils.rng import get_rng
+
+
+class Population:
+
+    def __init__(self, bounds, n_individuals, rng=None, initialiser=None):
+
+        """
+        Class containing the positions and fitnesses of a population.
+
+        Parameters
+        ----------
+        bounds : dict
+            Parameter names mapped to upper / lower bounds.
+        n_individuals : int
+            Number of individuals in the population.
+        rng : np.random.Generator
+            Generator used to draw the initial positions.
+        initialiser : BaseInitialiser
+            Generates the initial positions, if None they are drawn
+            uniformly at random using rng.
+
+        Attributes
+        ----------
+        pnames : list
+            Names assigned to the input bounds.
+        lb : np.ndarray
+            Lower bound, shared by all members of the population.
+        ub : np.ndarray
+            Upper bound, shared by all members of the population.
+        positions : np.ndarray
+            Contiguous (n_individuals, n_dims) array of positions.
+        fitness : np.ndarray
+            Fitness of each member, np.nan where not yet evaluated.
+        violation : np.ndarray
+            Total constraint violation of each member, zero if feasible
+            or if the violation is not measured.
+        """
+
+        if not isinstance(bounds, dict):
+            raise TypeError('bounds must be dict.')
+
+        self.pnames = list(bounds.keys())
+        _bounds = np.asarray(list(bounds.values()), dtype=np.float64)
+
+        self.lb = _bounds[:, 0]
+        self.ub = _bounds[:, 1]
+
+        if initialiser is None:
+            self.positions = get_rng(rng).uniform(
+                self.lb, self.ub, size=(n_individuals, len(self.pnames))
+            )
+        else:
+            self.positions = initialiser.initialise(
+                n_individuals, self.lb, self.ub
+            )
+
+        self.fitness = np.full(n_individuals, np.nan)
+        self.violation = np.zeros(n_individuals)
+
+    @property
+    def n_dims(self):
+        return self.positions.shape[1]
+
+    def __len__(self):
+        return self.positions.shape[0]
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield Individual.view(self, idx)
+
+    def __getitem__(self, idx):
+
+        """
+        Provides a view of a single member of the population.
+
+        Parameters
+        ----------
+        idx : int
+            Row index of the member.
+
+        Returns
+        -------
+        Individual
+            Lightweight view into the row of the population.
+        """
+
+        if idx < 0:
+            idx += len(self)
+
+        if not 0 <= idx < len(self):
+            raise IndexError('Population index out of range.')
+
+        return Individual.view(self, idx)
+
+    def __setitem__(self, idx, individual):
+
+        """
+        Copies the position and fitness of an individual into a row.
+
+        Parameters
+        ----------
+        idx : int
+            Row index of the member to overwrite.
+        individual : Individual
+            Individual from which to copy position and fitness.
+        """
+
+        if individual.is_view_of(self, idx):
+            return
+
+        self.positions[idx] = individual.position
+        self.fitness[idx] = individual._population.fitness[individual._index]
+        self.violation[idx] = individual.violation
+
+    def put(self, indices, population):
+
+        """
+        Overwrites the selected rows with the members of a population.
+
+        Parameters
+        ----------
+        indices : array_like
+            Row indices to overwrite.
+        population : Population
+            Population providing the new positions and fitnesses.
+        """
+
+        self.positions[indices] = population.positions
+        self.fitness[indices] = population.fitness
+        self.violation[indices] = population.violation
+
+    def take(self, indices):
+
+        """
+        Creates a new population from the selected rows.
+
+        Parameters
+        ----------
+        indices : array_like
+            Row indices to copy into the new population.
+
+        Returns
+        -------
+        Population
+            Population sharing bounds with the original.
+        """
+
+        population = copy.copy(self)
+        population.positions = self.positions[indices]
+        population.fitness = self.fitness[indices]
+        population.violation = self.violation[indices]
+
+        return population
+
+    def copy(self):
+
+        """
+        Creates a copy of the population, sharing the bounds.
+
+        Returns
+        -------
+        Population
+            Copy of the population.
+        """
+
+        population = copy.copy(self)
+        population.positions = self.positions.copy()
+        population.fitness = self.fitness.copy()
+        population.violation = self.violation.copy()
+
+        return population
+
+    def rank_key(self):
+
+        """
+        Provides a key ordering the members from best to worst, the
+        fitness with ties broken by the constraint violation - this
+        orders the infeasible members given an infinite fitness.
+
+        Returns
+        -------
+        np.ndarray
+            Key of shape (n,), lower is better.
+        """
+
+        if not np.any(self.violation):
+            return self.fitness
+
+        order = np.lexsort((self.violation, self.fitness))
+
+        key = np.empty(len(self))
+        key[order] = np.arange(len(self))
+
+        return key
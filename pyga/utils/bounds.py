@@ -0,0 +1,107 @@
+import abc
+import numpy as np
+
+from .rng import RngMixin, get_rng
+
+
+class BaseBoundsHandler(RngMixin, abc.ABC):
+
+    """Abstract Base Class for returning positions to the bounds."""
+
+    def apply(self, positions, lb, ub):
+
+        """
+        Returns every out of bounds gene to the search space.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        np.ndarray
+            Positions of shape (n, d) within the bounds.
+        """
+
+        below, above = positions < lb, positions > ub
+
+        if not (below.any() or above.any()):
+            return positions
+
+        return self._handle(positions, lb, ub, below | above)
+
+    @abc.abstractmethod
+    def _handle(self, positions, lb, ub, mask):
+
+        """
+        Returns the out of bounds genes to the search space.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+        mask : np.ndarray
+            Boolean mask of shape (n, d), True where out of bounds.
+
+        Returns
+        -------
+        np.ndarray
+            Positions of shape (n, d) within the bounds.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises when this function has not yet been implemented.
+        """
+
+        raise NotImplementedError('BaseBoundsHandler::_handle()')
+
+
+class ClipBoundsHandler(BaseBoundsHandler):
+
+    """Moves out of bounds genes to the nearest bound."""
+
+    def _handle(self, positions, lb, ub, mask):
+        return np.clip(positions, lb, ub)
+
+
+class ReflectBoundsHandler(BaseBoundsHandler):
+
+    """Reflects out of bounds genes back from the bounds."""
+
+    def _handle(self, positions, lb, ub, mask):
+        span = ub - lb
+
+        # reflection is periodic over twice the range of the gene
+        offset = np.mod(positions - lb, 2 * span)
+        reflected = lb + np.where(offset > span, 2 * span - offset, offset)
+
+        return np.where(mask, reflected, positions)
+
+
+class WrapBoundsHandler(BaseBoundsHandler):
+
+    """Wraps out of bounds genes around to the opposite bound."""
+
+    def _handle(self, positions, lb, ub, mask):
+        wrapped = lb + np.mod(positions - lb, ub - lb)
+        return np.where(mask, wrapped, positions)
+
+
+class ResampleBoundsHandler(BaseBoundsHandler):
+
+    """Resamples out of bounds genes uniformly within the bounds."""
+
+    def _handle(self, positions, lb, ub, mask):
+        rng = get_rng(self.rng)
+        resampled = rng.uniform(lb, ub, size=positions.shape)
+        return np.where(mask, resampled, positions)
@@ -0,0 +1,176 @@
+import numpy as np
+from collections import OrderedDict
+
+
+class FitnessCache:
+
+    def __init__(self, maxsize=10_000, decimals=None):
+
+        """
+        Memoises fitness evaluations keyed on the position, evicting
+        the least recently used entry once maxsize is reached.
+
+        The cache assumes a deterministic fitness function and must
+        not be shared between different fitness functions.
+
+        Parameters
+        ----------
+        maxsize : int
+            Maximum number of fitnesses to store.
+        decimals : int
+            If provided, positions are rounded to this number of decimal
+            places before lookup so that near-identical positions share
+            a single evaluation.
+
+        Attributes
+        ----------
+        hits : int
+            Number of fitnesses provided by the cache.
+        misses : int
+            Number of fitnesses which required evaluation.
+        """
+
+        if not maxsize >= 1:
+            raise ValueError('maxsize must be >= 1')
+
+        self.maxsize = maxsize
+        self.decimals = decimals
+
+        self.hits = 0
+        self.misses = 0
+
+        self._store = OrderedDict()
+
+    def __len__(self):
+        return len(self._store)
+
+    def _key(self, position):
+
+        """
+        Generates the lookup key for a position.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position for which to generate the key.
+
+        Returns
+        -------
+        bytes
+            Raw bytes of the (quantised) position.
+        """
+
+        position = np.asarray(position, dtype=np.float64)
+
+        if self.decimals is not None:
+            position = np.round(position, self.decimals)
+
+        # adding 0.0 maps -0.0 to 0.0 so both share a key.
+        return (position + 0.0).tobytes()
+
+    def _insert(self, key, fitness):
+        self._store[key] = fitness
+        self._store.move_to_end(key)
+
+        if len(self._store) > self.maxsize:
+            self._store.popitem(last=False)
+
+    def get(self, position):
+
+        """
+        Retrieves the fitness of a position from the cache.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position for which to retrieve the fitness.
+
+        Returns
+        -------
+        float
+            Cached fitness, None if the position is not cached.
+        """
+
+        key = self._key(position)
+
+        if key not in self._store:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._store.move_to_end(key)
+
+        return self._store[key]
+
+    def put(self, position, fitness):
+
+        """
+        Stores the fitness of a position.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position which has been evaluated.
+        fitness : float
+            Fitness of the position.
+        """
+
+        self._insert(self._key(position), fitness)
+
+    def evaluate(self, positions, evaluate):
+
+        """
+        Provides the fitness of each position, evaluating only those
+        positions which are not cached - duplicates within positions
+        are evaluated once.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+        evaluate : function
+            Maps an (m, d) array of positions to an (m,) fitness array.
+
+        Returns
+        -------
+        fitness : np.ndarray
+            Fitness of each position.
+        n_evaluated : int
+            Number of positions which were passed to evaluate.
+        """
+
+        fitness = np.empty(len(positions), dtype=np.float64)
+        missing = OrderedDict()
+
+        for idx, position in enumerate(positions):
+            key = self._key(position)
+
+            if key in self._store:
+                self._store.move_to_end(key)
+                fitness[idx] = self._store[key]
+            else:
+                missing.setdefault(key, []).append(idx)
+
+        if missing:
+            rows = [idxs[0] for idxs in missing.values()]
+            values = evaluate(positions[rows])
+
+            for (key, idxs), value in zip(missing.items(), values):
+                fitness[idxs] = value
+
+                # non-finite values may mark positions left unevaluated.
+                if np.isfinite(value):
+                    self._insert(key, value)
+
+        self.misses += len(missing)
+        self.hits += len(positions) - len(missing)
+
+        return fitness, len(missing)
+
+    def clear(self):
+
+        """Removes all entries and resets the counters."""
+
+        self._store.clear()
+        self.hits = 0
+        self.misses = 0
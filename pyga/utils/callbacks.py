@@ -0,0 +1,95 @@
+class BaseCallback:
+
+    """
+    Base Class for callbacks observing the optimisation.
+
+    A callback groups hooks - its methods named after the events of the
+    HookRegistry are registered with the optimiser. Callbacks receive
+    the optimiser itself, so the population is accessed through
+    ga.population.positions and ga.population.fitness without copying.
+    A callback may end the optimisation by returning True from
+    on_generation_end() or by calling ga.request_stop().
+    """
+
+    def on_optimise_start(self, ga):
+
+        """
+        Called once the population has been initialised.
+
+        Parameters
+        ----------
+        ga : BaseGA
+            Optimiser being run.
+        """
+
+        pass
+
+    def on_generation_end(self, ga):
+
+        """
+        Called after each generation of the optimisation.
+
+        Parameters
+        ----------
+        ga : BaseGA
+            Optimiser being run.
+
+        Returns
+        -------
+        bool
+            True to stop the optimisation.
+        """
+
+        return False
+
+    def on_optimise_end(self, ga):
+
+        """
+        Called when the optimisation has finished.
+
+        Parameters
+        ----------
+        ga : BaseGA
+            Optimiser being run.
+        """
+
+        pass
+
+
+class LambdaCallback(BaseCallback):
+
+    """Callback built from functions rather than a subclass."""
+
+    def __init__(self, on_optimise_start=None, on_generation_end=None,
+                 on_optimise_end=None):
+
+        """
+        Initialises the LambdaCallback.
+
+        Parameters
+        ----------
+        on_optimise_start : function
+            Called as on_optimise_start(ga), if not None.
+        on_generation_end : function
+            Called as on_generation_end(ga), returning True to stop.
+        on_optimise_end : function
+            Called as on_optimise_end(ga), if not None.
+        """
+
+        self._on_optimise_start = on_optimise_start
+        self._on_generation_end = on_generation_end
+        self._on_optimise_end = on_optimise_end
+
+    def on_optimise_start(self, ga):
+        if self._on_optimise_start is not None:
+            self._on_optimise_start(ga)
+
+    def on_generation_end(self, ga):
+        if self._on_generation_end is not None:
+            return self._on_generation_end(ga)
+
+        return False
+
+    def on_optimise_end(self, ga):
+        if self._on_optimise_end is not None:
+            self._on_optimise_end(ga)
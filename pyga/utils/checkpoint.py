@@ -0,0 +1,126 @@
+import os
+import json
+import numpy as np
+
+from ..individual import Individual
+
+
+def save_checkpoint(ga, path):
+
+    """
+    Writes the state of the optimiser to an uncompressed .npz file.
+
+    The file is written alongside the target and then moved into place
+    so that an interrupted write never corrupts an existing checkpoint.
+
+    Parameters
+    ----------
+    ga : BaseGA
+        Optimiser for which to save the state.
+    path : str
+        Location of the checkpoint file.
+    """
+
+    best = ga.best_individual
+
+    state = {
+        'positions': ga.population.positions,
+        'fitness': ga.population.fitness,
+        'violation': ga.population.violation,
+        'iteration': np.array(ga.iteration),
+        'n_evaluations': np.array(ga.n_evaluations),
+        'best_position': (np.full(ga.population.n_dims, np.nan)
+                          if best is None else best.position),
+        'best_fitness': np.array(np.nan if best is None else best.fitness),
+        'rng_state': np.array(json.dumps(ga.rng.bit_generator.state)),
+    }
+
+    for prefix, obj in _stateful(ga):
+        for k, v in obj.state_dict().items():
+            state[f'{prefix}.{k}'] = np.asarray(v)
+
+    tmp_path = f'{path}.tmp'
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, **state)
+
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(ga, path):
+
+    """
+    Restores the state of the optimiser from a checkpoint file.
+
+    Parameters
+    ----------
+    ga : BaseGA
+        Optimiser for which to restore the state, the population must
+        have been initialised with matching dimensions.
+    path : str
+        Location of the checkpoint file.
+    """
+
+    with np.load(path) as data:
+        state = {k: data[k] for k in data.files}
+
+    if not state['positions'].shape[1] == ga.population.n_dims:
+        raise ValueError('Checkpoint does not match the search space.')
+
+    population = ga.population.take(np.arange(len(state['fitness'])))
+    population.positions[:] = state['positions']
+    population.fitness[:] = state['fitness']
+    population.violation[:] = state['violation']
+
+    ga.population = population
+    ga.iteration = int(state['iteration'])
+    ga.n_evaluations = int(state['n_evaluations'])
+
+    if np.isnan(state['best_fitness']):
+        ga.best_individual = None
+    else:
+        ga.best_individual = Individual.view(population.take([0]), 0)
+        ga.best_individual.position = state['best_position']
+        ga.best_individual.fitness = float(state['best_fitness'])
+
+    rng_state = json.loads(str(state['rng_state']))
+    bit_generator = getattr(np.random, rng_state['bit_generator'])()
+    bit_generator.state = rng_state
+
+    ga.rng = np.random.Generator(bit_generator)
+    ga.bind_rng()
+
+    for prefix, obj in _stateful(ga):
+        obj_state = {
+            k[len(prefix) + 1:]: v for k, v in state.items()
+            if k.startswith(f'{prefix}.')
+        }
+
+        # components without a saved state, such as an archive assigned
+        # after the checkpoint was written, are left as they are.
+        if obj_state:
+            obj.load_state_dict(obj_state)
+
+
+def _stateful(ga):
+
+    """
+    Provides the components of the optimiser which hold state.
+
+    Parameters
+    ----------
+    ga : BaseGA
+        Optimiser for which to find the components.
+
+    Returns
+    -------
+    list
+        (prefix, component) of each component with a state_dict().
+    """
+
+    stateful = [('history', ga.history),
+                ('termination', ga.termination_manager)]
+
+    if ga.hall_of_fame is not None:
+        stateful.append(('hall_of_fame', ga.hall_of_fame))
+
+    return stateful
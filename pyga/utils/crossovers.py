@@ -1,8 +1,10 @@
 import abc
 import numpy as np
 
+from .rng import RngMixin, get_rng
 
-class BaseCrossover(abc.ABC):
+
+class BaseCrossover(RngMixin, abc.ABC):
 
     """Abstract Base Class for all Crossover functionality."""
 
@@ -29,13 +31,69 @@ class BaseCrossover(abc.ABC):
 
         raise NotImplementedError('BaseCrossover::cross()')
 
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+
+        """
+        Performs crossover method on a batch of pairs of parents.
+
+        Parameters
+        ----------
+        parents_a : np.ndarray
+            First parent of each pair, of shape (n_pairs, d).
+        parents_b : np.ndarray
+            Second parent of each pair, of shape (n_pairs, d).
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        children_a : np.ndarray
+            First child of each pair, of shape (n_pairs, d).
+        children_b : np.ndarray
+            Second child of each pair, of shape (n_pairs, d).
+
+        Raises
+        ------
+        NotImplementedError
+            No batch implementation, cross() is used for each pair.
+        """
+
+        raise NotImplementedError('BaseCrossover::cross_batch()')
+
+    @staticmethod
+    def _swap(parents_a, parents_b, mask):
+
+        """
+        Swaps the genes of each pair of parents where mask is True.
+
+        Parameters
+        ----------
+        parents_a : np.ndarray
+            First parent of each pair, of shape (n_pairs, d).
+        parents_b : np.ndarray
+            Second parent of each pair, of shape (n_pairs, d).
+        mask : np.ndarray
+            Boolean array of shape (n_pairs, d).
+
+        Returns
+        -------
+        tuple
+            Children of each pair.
+        """
+
+        return (np.where(mask, parents_b, parents_a),
+                np.where(mask, parents_a, parents_b))
+
 
 class OnePointCrossover(BaseCrossover):
 
     """Crossover class implementing 'one-point crossover' method."""
 
     def cross(self, parent_a, parent_b):
-        c = np.random.randint(0, len(parent_a.position) + 1)
+        rng = get_rng(self.rng)
+        c = rng.integers(0, len(parent_a.position) + 1)
 
         if c != 0:
             for i in range(c, len(parent_a.position)):
@@ -44,14 +102,23 @@ class OnePointCrossover(BaseCrossover):
 
         return parent_a, parent_b
 
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+        rng = get_rng(self.rng)
+        n_pairs, d = parents_a.shape
+        c = rng.integers(0, d + 1, size=(n_pairs, 1))
+
+        mask = (np.arange(d) >= c) & (c != 0)
+        return self._swap(parents_a, parents_b, mask)
+
 
 class TwoPointCrossover(BaseCrossover):
 
     """Crossover class implementing 'two-point crossover' method."""
 
     def cross(self, parent_a, parent_b):
-        c = np.random.randint(1, len(parent_a.position) + 1)
-        d = np.random.randint(1, len(parent_a.position) + 1)
+        rng = get_rng(self.rng)
+        c = rng.integers(1, len(parent_a.position) + 1)
+        d = rng.integers(1, len(parent_a.position) + 1)
 
         if c > d:
             c, d = d, c
@@ -63,6 +130,18 @@ class TwoPointCrossover(BaseCrossover):
 
         return parent_a, parent_b
 
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+        rng = get_rng(self.rng)
+        n_pairs, d = parents_a.shape
+        c = rng.integers(1, d + 1, size=(n_pairs, 1))
+        e = rng.integers(1, d + 1, size=(n_pairs, 1))
+
+        c, e = np.minimum(c, e), np.maximum(c, e)
+
+        genes = np.arange(d)
+        mask = (genes >= c) & (genes < e)
+        return self._swap(parents_a, parents_b, mask)
+
 
 class UniformCrossover(BaseCrossover):
 
@@ -85,19 +164,31 @@ class UniformCrossover(BaseCrossover):
             raise ValueError('p_swap must be <= 0.5')
 
     def cross(self, parent_a, parent_b):
+        rng = get_rng(self.rng)
 
         if self.p_swap is None:
             self.p_swap = 1 / len(parent_a.position)
         if len(parent_a.position) == 1:
             self.p_swap = 0.5
 
-        for i in range(1, len(parent_a.position)):
-            if self.p_swap >= np.random.uniform():
+        for i in range(len(parent_a.position)):
+            if self.p_swap >= rng.uniform():
                 parent_a.position[i], parent_b.position[i] = \
                     parent_b.position[i], parent_a.position[i].copy()
 
         return parent_a, parent_b
 
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+        rng = get_rng(self.rng)
+        n_pairs, d = parents_a.shape
+
+        p_swap = self.p_swap or 1 / d
+        if d == 1:
+            p_swap = 0.5
+
+        mask = rng.uniform(size=(n_pairs, d)) < p_swap
+        return self._swap(parents_a, parents_b, mask)
+
 
 class KVectorUniformCrossover(BaseCrossover):
 
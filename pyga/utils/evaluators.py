@@ -0,0 +1,267 @@
+import abc
+import numpy as np
+import concurrent.futures as cf
+
+
+class BaseEvaluator(abc.ABC):
+
+    """Abstract Base Class for all fitness evaluation functionality."""
+
+    @abc.abstractmethod
+    def evaluate(self, fn, positions):
+
+        """
+        Evaluates the fitness function at each of the positions.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        positions : np.ndarray
+            Positions of shape (n, d) at which to evaluate fn.
+
+        Returns
+        -------
+        np.ndarray
+            Fitnesses of shape (n,), in the order of the positions.
+        """
+
+        raise NotImplementedError('BaseEvaluator::evaluate()')
+
+    def submit(self, fn, position):
+
+        """
+        Schedules the evaluation of the fitness function at a position.
+
+        Parameters
+        ----------
+        fn : function
+            Fitness function used to evaluate the fitness.
+        position : np.ndarray
+            Position of shape (d,) at which to evaluate fn.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the fitness, completed immediately by
+            evaluators which do not run asynchronously.
+        """
+
+        future = cf.Future()
+
+        try:
+            future.set_result(self.evaluate(fn, position[np.newaxis])[0])
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+    def close(self):
+
+        """Releases any resources held by the evaluator."""
+
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class SerialEvaluator(BaseEvaluator):
+
+    """Evaluates the fitness function for each position in turn."""
+
+    def evaluate(self, fn, positions):
+        return np.array([fn(p) for p in positions], dtype=np.float64)
+
+
+class PoolEvaluator(BaseEvaluator):
+
+    """Base Class for evaluators backed by a concurrent.futures pool."""
+
+    def __init__(self, max_workers=None, chunksize=1):
+
+        """
+        Initialises the PoolEvaluator Class.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of workers, defaults to the executor default.
+        chunksize : int
+            Number of positions sent to a worker in a single task.
+
+        Attributes
+        ----------
+        executor : concurrent.futures.Executor
+            Pool of workers, created upon first use.
+        """
+
+        if not chunksize >= 1:
+            raise ValueError('chunksize must be >= 1')
+
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+        self.executor = None
+
+    @abc.abstractmethod
+    def _make_executor(self):
+
+        """
+        Creates the pool of workers.
+
+        Returns
+        -------
+        concurrent.futures.Executor
+            Pool of workers used for the evaluations.
+        """
+
+        raise NotImplementedError('PoolEvaluator::_make_executor()')
+
+    def _chunk_seeds(self, n_chunks):
+
+        """
+        Provides the seed used by the worker for each chunk.
+
+        Parameters
+        ----------
+        n_chunks : int
+            Number of chunks to be evaluated.
+
+        Returns
+        -------
+        list
+            Seed for each chunk, None for no seeding.
+        """
+
+        return [None] * n_chunks
+
+    def evaluate(self, fn, positions):
+
+        if self.executor is None:
+            self.executor = self._make_executor()
+
+        idx = range(self.chunksize, len(positions), self.chunksize)
+        chunks = np.split(positions, idx)
+        seeds = self._chunk_seeds(len(chunks))
+
+        results = self.executor.map(
+            _evaluate_chunk, [fn] * len(chunks), chunks, seeds
+        )
+
+        return np.concatenate(list(results))
+
+    def submit(self, fn, position):
+
+        if self.executor is None:
+            self.executor = self._make_executor()
+
+        return self.executor.submit(
+            _evaluate_position, fn, position, self._chunk_seeds(1)[0]
+        )
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+class ThreadPoolEvaluator(PoolEvaluator):
+
+    """
+    Evaluates the fitness function using a pool of threads - suitable
+    for objectives which release the GIL or wait on external programs.
+    """
+
+    def _make_executor(self):
+        return cf.ThreadPoolExecutor(max_workers=self.max_workers)
+
+
+class ProcessPoolEvaluator(PoolEvaluator):
+
+    """
+    Evaluates the fitness function using a pool of processes, the
+    fitness function must be picklable.
+    """
+
+    def __init__(self, max_workers=None, chunksize=1, seed=None):
+
+        """
+        Initialises the ProcessPoolEvaluator Class.
+
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of processes, defaults to the number of CPUs.
+        chunksize : int
+            Number of positions sent to a process in a single task.
+        seed : int, np.random.SeedSequence
+            Root seed from which each chunk's seed is spawned, this
+            makes stochastic objectives reproducible irrespective of
+            which process evaluates the chunk.
+        """
+
+        super().__init__(max_workers, chunksize)
+
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+
+        self.seed_sequence = seed
+
+    def _make_executor(self):
+        return cf.ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _chunk_seeds(self, n_chunks):
+        return [int(s.generate_state(1)[0])
+                for s in self.seed_sequence.spawn(n_chunks)]
+
+
+def _evaluate_chunk(fn, positions, seed):
+
+    """
+    Evaluates the fitness function for a chunk of positions.
+
+    Parameters
+    ----------
+    fn : function
+        Fitness function used to evaluate the fitness.
+    positions : np.ndarray
+        Positions of shape (n, d) at which to evaluate fn.
+    seed : int
+        Seed for the global NumPy random state, None for no seeding.
+
+    Returns
+    -------
+    np.ndarray
+        Fitnesses of shape (n,).
+    """
+
+    if seed is not None:
+        np.random.seed(seed)
+
+    return np.array([fn(p) for p in positions], dtype=np.float64)
+
+
+def _evaluate_position(fn, position, seed):
+
+    """
+    Evaluates the fitness function at a single position.
+
+    Parameters
+    ----------
+    fn : function
+        Fitness function used to evaluate the fitness.
+    position : np.ndarray
+        Position of shape (d,) at which to evaluate fn.
+    seed : int
+        Seed for the global NumPy random state, None for no seeding.
+
+    Returns
+    -------
+    float
+        Fitness at the position.
+    """
+
+    return _evaluate_chunk(fn, position[np.newaxis], seed)[0]
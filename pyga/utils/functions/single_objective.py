@@ -12,22 +12,23 @@ def ackley(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
     if not np.logical_and(position >= -32, position <= 32).all():
         raise ValueError('Input for Ackley function must be within [-32, 32].')
 
-    dims = position.shape[0]
+    dims = position.shape[-1]
     val = (-20.0 * np.exp(-0.2 * np.sqrt((1 / dims)
-                                         * (position ** 2).sum(axis=0)))
+                                         * (position ** 2).sum(axis=-1)))
            - np.exp((1 / float(dims))
-                    * np.cos(2 * np.pi * position).sum(axis=0))
+                    * np.cos(2 * np.pi * position).sum(axis=-1))
            + 20.0
            + np.exp(1))
 
@@ -45,21 +46,22 @@ def beale(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Beale function only takes two-dimensional input.')
     if not np.logical_and(position >= -4.5, position <= 4.5).all():
         raise ValueError('Input for Beale function must be within [-4.5, 4.5].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = ((1.5 - x + x * y) ** 2.0
            + (2.25 - x + x * y ** 2.0) ** 2.0
            + (2.625 - x + x * y ** 3.0) ** 2.0)
@@ -78,21 +80,22 @@ def booth(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Booth function only takes two-dimensional input.')
     if not np.logical_and(position >= -10, position <= 10).all():
         raise ValueError('Input for Booth function must be within [-10, 10].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = (x + 2 * y - 7) ** 2.0 + (2 * x + y - 5) ** 2.0
 
     return val
@@ -109,22 +112,23 @@ def goldsteinprice(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    if not position.shape[0] == 2:
+    if not position.shape[-1] == 2:
         raise IndexError('Goldstein function only takes two-dimensional input.')
     if not np.logical_and(position >= -2, position <= 2).all():
         raise ValueError('Input for Goldstein-Price '
                          'function must be within [-2, 2].')
 
-    x = position[0]
-    y = position[1]
+    x = position[..., 0]
+    y = position[..., 1]
     val = ((1
            + (x + y + 1) ** 2.0
            * (19
@@ -159,21 +163,22 @@ def rastrigin(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
     if not np.logical_and(position >= -5.12, position <= 5.12).all():
         raise ValueError('Input for Rastrigin function '
                          'must be within [-5.12, 5.12].')
 
-    dims = position.shape[0]
+    dims = position.shape[-1]
     val = 10.0 * dims + (position ** 2.0
-                         - 10.0 * np.cos(2.0 * np.pi * position)).sum(axis=0)
+                         - 10.0 * np.cos(2.0 * np.pi * position)).sum(axis=-1)
 
     return val
 
@@ -189,13 +194,14 @@ def sphere(position):
     Parameters
     ----------
     position : np.ndarray
-        Position at which to evaluate the function.
+        Position at which to evaluate the function, either a single
+        position of shape (d,) or a batch of positions of shape (n, d).
 
     Returns
     -------
-    val : float
-        Function evaluation, f(position)
+    val : float, np.ndarray
+        Function evaluation, f(position), of shape (n,) for a batch.
     """
 
-    val = np.sum(np.square(position))
+    val = np.sum(np.square(position), axis=-1)
     return val
@@ -0,0 +1,484 @@
+import heapq
+import itertools
+import numpy as np
+
+
+class TopK:
+
+    """
+    Bounded record of the k best solutions found, kept in a heap with
+    the worst recorded solution at its root. A position is recorded at
+    most once, so re-evaluated members such as elites are not repeated.
+    """
+
+    def __init__(self, k):
+
+        """
+        Initialises TopK.
+
+        Parameters
+        ----------
+        k : int
+            Number of solutions to keep.
+        """
+
+        if not k >= 1:
+            raise ValueError('k must be >= 1')
+
+        self.k = k
+
+        self._heap = []
+        self._keys = set()
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    @property
+    def worst_fitness(self):
+
+        """
+        Fitness a solution must beat to be recorded.
+
+        Returns
+        -------
+        float
+            Worst recorded fitness, np.inf until k solutions are held.
+        """
+
+        if len(self._heap) < self.k:
+            return np.inf
+
+        return -self._heap[0][0]
+
+    def update(self, positions, fitness):
+
+        """
+        Records any of a batch of solutions which are among the best.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+        fitness : np.ndarray
+            Fitness of shape (n,).
+        """
+
+        candidates = np.flatnonzero(fitness < self.worst_fitness)
+
+        # better solutions first, so that repeated positions within the
+        # batch do not take the place of distinct ones.
+        candidates = candidates[np.argsort(fitness[candidates],
+                                           kind='stable')]
+
+        for idx in candidates:
+            if not fitness[idx] < self.worst_fitness:
+                break
+
+            self.push(positions[idx], fitness[idx])
+
+    def push(self, position, fitness):
+
+        """
+        Records a single solution if it is among the best.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position of shape (d,).
+        fitness : float
+            Fitness of the position.
+
+        Returns
+        -------
+        bool
+            True if the solution was recorded.
+        """
+
+        if not fitness < self.worst_fitness:
+            return False
+
+        position = np.array(position, dtype=np.float64)
+        key = position.tobytes()
+
+        if key in self._keys:
+            return False
+
+        # ties in fitness are broken by insertion order.
+        item = (-float(fitness), -next(self._counter), position)
+
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        else:
+            evicted = heapq.heapreplace(self._heap, item)
+            self._keys.discard(evicted[2].tobytes())
+
+        self._keys.add(key)
+        return True
+
+    def best(self):
+
+        """
+        Provides the recorded solutions, best first.
+
+        Returns
+        -------
+        positions : np.ndarray
+            Positions of shape (m, d), m <= k.
+        fitness : np.ndarray
+            Fitness of shape (m,).
+        """
+
+        items = sorted(self._heap, reverse=True)
+
+        positions = np.array([item[2] for item in items])
+        fitness = np.array([-item[0] for item in items])
+
+        return positions, fitness
+
+    def state_dict(self):
+
+        """
+        Provides the recorded solutions for checkpointing.
+
+        Returns
+        -------
+        dict
+            Names mapped to array_like values.
+        """
+
+        positions, fitness = self.best()
+        return {'positions': positions, 'fitness': fitness}
+
+    def load_state_dict(self, state):
+
+        """
+        Restores the recorded solutions from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            Names mapped to np.ndarray values, as from state_dict().
+        """
+
+        self.clear()
+        self.update(state['positions'], state['fitness'])
+
+    def clear(self):
+
+        """Removes all recorded solutions."""
+
+        self._heap = []
+        self._keys = set()
+
+
+class HallOfFame:
+
+    """
+    Bounded archive of the best distinct solutions found.
+
+    Solutions within tolerance of an archived solution in every gene
+    are near-duplicates and only the better of the two is kept. The
+    archive is indexed by a grid, with cells the size of the tolerance
+    over the first few genes, so that near-duplicates are found among
+    the neighbouring cells rather than by scanning the archive.
+    """
+
+    def __init__(self, k, tolerance=1e-6, n_index_dims=3):
+
+        """
+        Initialises the HallOfFame.
+
+        Parameters
+        ----------
+        k : int
+            Number of solutions to keep.
+        tolerance : float
+            Distance in every gene within which solutions are
+            near-duplicates.
+        n_index_dims : int
+            Number of leading genes used to index the archive, the
+            number of cells searched per insertion is 3 ** n_index_dims.
+        """
+
+        if not k >= 1:
+            raise ValueError('k must be >= 1')
+
+        if not tolerance > 0:
+            raise ValueError('tolerance must be > 0')
+
+        self.k = k
+        self.tolerance = tolerance
+        self.n_index_dims = n_index_dims
+
+        self.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def worst_fitness(self):
+
+        """
+        Fitness a solution must beat to be archived.
+
+        Returns
+        -------
+        float
+            Worst archived fitness, np.inf until k solutions are held.
+        """
+
+        if len(self._entries) < self.k:
+            return np.inf
+
+        self._discard_stale()
+        return -self._heap[0][0]
+
+    def _cell(self, position):
+        lead = position[:self.n_index_dims]
+        return tuple(np.floor(lead / self.tolerance).astype(np.int64))
+
+    def _neighbours(self, position):
+
+        """
+        Finds the archived solutions which are near-duplicates.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position of shape (d,).
+
+        Returns
+        -------
+        list
+            Keys of the near-duplicate entries.
+        """
+
+        cell = self._cell(position)
+        offsets = itertools.product((-1, 0, 1), repeat=len(cell))
+
+        found = []
+        for offset in offsets:
+            key = tuple(c + o for c, o in zip(cell, offset))
+
+            for entry in self._grid.get(key, ()):
+                other = self._entries[entry][0]
+                if np.all(np.abs(other - position) <= self.tolerance):
+                    found.append(entry)
+
+        return found
+
+    def _remove(self, entry):
+        position, _ = self._entries.pop(entry)
+
+        cell = self._grid[self._cell(position)]
+        cell.remove(entry)
+
+        if not cell:
+            del self._grid[self._cell(position)]
+
+    def _discard_stale(self):
+
+        # entries removed as near-duplicates are left in the heap.
+        while self._heap and self._heap[0][2] not in self._entries:
+            heapq.heappop(self._heap)
+
+    def update(self, positions, fitness):
+
+        """
+        Archives any of a batch of solutions which are among the best.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d).
+        fitness : np.ndarray
+            Fitness of shape (n,).
+        """
+
+        candidates = np.flatnonzero(fitness < self.worst_fitness)
+
+        # better solutions first, so duplicates within the batch lose.
+        candidates = candidates[np.argsort(fitness[candidates],
+                                           kind='stable')]
+
+        for idx in candidates:
+            if not fitness[idx] < self.worst_fitness:
+                break
+
+            self.push(positions[idx], fitness[idx])
+
+    def push(self, position, fitness):
+
+        """
+        Archives a single solution if it is among the best and better
+        than any near-duplicates.
+
+        Parameters
+        ----------
+        position : np.ndarray
+            Position of shape (d,).
+        fitness : float
+            Fitness of the position.
+
+        Returns
+        -------
+        bool
+            True if the solution was archived.
+        """
+
+        if not fitness < self.worst_fitness:
+            return False
+
+        position = np.array(position, dtype=np.float64)
+        duplicates = self._neighbours(position)
+
+        if any(self._entries[e][1] <= fitness for e in duplicates):
+            return False
+
+        for entry in duplicates:
+            self._remove(entry)
+
+        entry = next(self._counter)
+
+        self._entries[entry] = (position, float(fitness))
+        self._grid.setdefault(self._cell(position), []).append(entry)
+        heapq.heappush(self._heap, (-float(fitness), -entry, entry))
+
+        if len(self._entries) > self.k:
+            self._discard_stale()
+            self._remove(heapq.heappop(self._heap)[2])
+
+        # rebuild the heap once stale entries dominate it.
+        if len(self._heap) > 2 * self.k:
+            self._heap = [item for item in self._heap
+                          if item[2] in self._entries]
+            heapq.heapify(self._heap)
+
+        return True
+
+    def best(self):
+
+        """
+        Provides the archived solutions, best first.
+
+        Returns
+        -------
+        positions : np.ndarray
+            Positions of shape (m, d), m <= k.
+        fitness : np.ndarray
+            Fitness of shape (m,).
+        """
+
+        entries = sorted(self._entries.items(),
+                         key=lambda item: (item[1][1], item[0]))
+
+        positions = np.array([position for _, (position, _) in entries])
+        fitness = np.array([f for _, (_, f) in entries])
+
+        return positions, fitness
+
+    def seed(self, population):
+
+        """
+        Copies the archived solutions into the leading members of a
+        population, so that a new run starts from them.
+
+        Parameters
+        ----------
+        population : Population
+            Population to seed, must match the dimensions.
+
+        Returns
+        -------
+        int
+            Number of members seeded.
+        """
+
+        positions, fitness = self.best()
+        n_seed = min(len(positions), len(population))
+
+        population.positions[:n_seed] = positions[:n_seed]
+        population.fitness[:n_seed] = fitness[:n_seed]
+
+        return n_seed
+
+    def save(self, path):
+
+        """
+        Writes the archive to an .npz file.
+
+        Parameters
+        ----------
+        path : str
+            Location of the file.
+        """
+
+        positions, fitness = self.best()
+
+        np.savez(path, positions=positions, fitness=fitness,
+                 k=self.k, tolerance=self.tolerance,
+                 n_index_dims=self.n_index_dims)
+
+    @classmethod
+    def load(cls, path):
+
+        """
+        Reads an archive written by save().
+
+        Parameters
+        ----------
+        path : str
+            Location of the file.
+
+        Returns
+        -------
+        HallOfFame
+            The restored archive.
+        """
+
+        with np.load(path) as data:
+            hall_of_fame = cls(int(data['k']), float(data['tolerance']),
+                               int(data['n_index_dims']))
+
+            for position, fitness in zip(data['positions'], data['fitness']):
+                hall_of_fame.push(position, fitness)
+
+        return hall_of_fame
+
+    def state_dict(self):
+
+        """
+        Provides the archived solutions for checkpointing.
+
+        Returns
+        -------
+        dict
+            Names mapped to array_like values.
+        """
+
+        positions, fitness = self.best()
+        return {'positions': positions, 'fitness': fitness}
+
+    def load_state_dict(self, state):
+
+        """
+        Restores the archived solutions from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            Names mapped to np.ndarray values, as from state_dict().
+        """
+
+        self.clear()
+        self.update(state['positions'], state['fitness'])
+
+    def clear(self):
+
+        """Removes all archived solutions."""
+
+        self._entries = {}
+        self._grid = {}
+        self._heap = []
+        self._counter = itertools.count()
@@ -1,4 +1,6 @@
+import os
 import abc
+import time
 import numpy as np
 
 
@@ -11,6 +13,38 @@ class BaseHistory(abc.ABC):
     def write_history(self):
         raise NotImplementedError('BaseHistory::write_history()')
 
+    def state_dict(self):
+
+        """
+        Provides the recorded history for checkpointing.
+
+        Returns
+        -------
+        dict
+            Names mapped to array_like values.
+        """
+
+        return {}
+
+    def load_state_dict(self, state):
+
+        """
+        Restores the recorded history from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            Names mapped to np.ndarray values, as from state_dict().
+        """
+
+        pass
+
+    def flush(self):
+
+        """Writes any buffered history to its destination."""
+
+        pass
+
 
 class GeneralHistory(BaseHistory):
 
@@ -22,8 +56,346 @@ class GeneralHistory(BaseHistory):
 
     def write_history(self):
 
-        best_fitness = self.ga.best_individual.fitness
+        best = self.ga.best_individual
+
+        # no feasible individual may have been found under constraints
+        best_fitness = np.nan if best is None else best.fitness
         self.arr_best_fitness.append(best_fitness)
 
-        mean_fitness = np.mean([i.fitness for i in self.ga.population])
+        mean_fitness = np.mean(self.ga.population.fitness)
         self.arr_mean_fitness.append(mean_fitness)
+
+    def state_dict(self):
+        return {
+            'arr_best_fitness': self.arr_best_fitness,
+            'arr_mean_fitness': self.arr_mean_fitness
+        }
+
+    def load_state_dict(self, state):
+        self.arr_best_fitness = state['arr_best_fitness'].tolist()
+        self.arr_mean_fitness = state['arr_mean_fitness'].tolist()
+
+
+class ColumnarHistory(BaseHistory):
+
+    """
+    History stored in preallocated NumPy columns, optionally streamed
+    to a file so that memory use is bounded for long optimisations.
+    """
+
+    dtype = np.dtype([
+        ('iteration', np.int64),
+        ('n_evaluations', np.int64),
+        ('best_fitness', np.float64),
+        ('mean_fitness', np.float64),
+        ('std_fitness', np.float64),
+        ('min_fitness', np.float64),
+        ('max_fitness', np.float64),
+        ('time', np.float64)
+    ])
+
+    def __init__(self, ga, capacity=1024, stream=None, buffer_size=4096):
+
+        """
+        Initialises the ColumnarHistory.
+
+        Parameters
+        ----------
+        ga : BaseGA
+            Optimiser for which to record the history.
+        capacity : int
+            Number of rows to preallocate, doubled whenever it is full.
+        stream : str
+            File to which rows are streamed - a .csv file is written as
+            text, any other file as raw records which can be read with
+            ColumnarHistory.read(). If None, all rows are kept in memory.
+        buffer_size : int
+            Number of rows held in memory before streaming to the file.
+
+        Attributes
+        ----------
+        data : np.ndarray
+            Structured array of the rows held in memory.
+        n_flushed : int
+            Number of rows written to the stream.
+        """
+
+        super().__init__(ga)
+
+        if not capacity >= 1:
+            raise ValueError('capacity must be >= 1')
+
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self.n_flushed = 0
+
+        self._rows = np.empty(capacity, dtype=self.dtype)
+        self._n_rows = 0
+        self._t_start = None
+
+    @property
+    def data(self):
+        return self._rows[:self._n_rows]
+
+    @property
+    def arr_best_fitness(self):
+        return self.data['best_fitness']
+
+    @property
+    def arr_mean_fitness(self):
+        return self.data['mean_fitness']
+
+    def __len__(self):
+        return self.n_flushed + self._n_rows
+
+    def write_history(self):
+
+        if self._t_start is None:
+            self._t_start = time.perf_counter()
+
+        if self._n_rows == len(self._rows):
+            rows = np.empty(2 * len(self._rows), dtype=self.dtype)
+            rows[:self._n_rows] = self._rows
+            self._rows = rows
+
+        fitness = self.ga.population.fitness
+        best = self.ga.best_individual
+
+        self._rows[self._n_rows] = (
+            self.ga.iteration,
+            self.ga.n_evaluations,
+            np.nan if best is None else best.fitness,
+            fitness.mean(),
+            fitness.std(),
+            fitness.min(),
+            fitness.max(),
+            time.perf_counter() - self._t_start
+        )
+
+        self._n_rows += 1
+
+        if self.stream is not None and self._n_rows >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self.stream is None or self._n_rows == 0:
+            return
+
+        mode = 'a' if self.n_flushed else 'w'
+
+        if os.path.splitext(self.stream)[1] == '.csv':
+            with open(self.stream, mode) as f:
+                header = '' if self.n_flushed else ','.join(self.dtype.names)
+                np.savetxt(f, self.data, delimiter=',', header=header,
+                           comments='', fmt=['%d', '%d'] + ['%.17g'] * 6)
+        else:
+            with open(self.stream, mode + 'b') as f:
+                self.data.tofile(f)
+
+        self.n_flushed += self._n_rows
+        self._n_rows = 0
+
+    @classmethod
+    def read(cls, path):
+
+        """
+        Reads a streamed history.
+
+        Parameters
+        ----------
+        path : str
+            File to which the history was streamed.
+
+        Returns
+        -------
+        np.ndarray
+            Structured array of the rows, memory-mapped for raw records.
+        """
+
+        if os.path.splitext(path)[1] == '.csv':
+            return np.genfromtxt(path, delimiter=',', names=True,
+                                 dtype=cls.dtype)
+
+        return np.memmap(path, dtype=cls.dtype, mode='r')
+
+    def state_dict(self):
+        state = {name: self.data[name] for name in self.dtype.names}
+        state['n_flushed'] = self.n_flushed
+
+        return state
+
+    def load_state_dict(self, state):
+        n_rows = len(state['iteration'])
+
+        self._rows = np.empty(max(n_rows, len(self._rows)), dtype=self.dtype)
+        self._n_rows = n_rows
+
+        for name in self.dtype.names:
+            self._rows[name][:n_rows] = state[name]
+
+        self.n_flushed = int(state['n_flushed'])
+
+        if self.stream is not None and os.path.exists(self.stream):
+            self._truncate_stream()
+
+    def _truncate_stream(self):
+
+        """
+        Discards the rows streamed after the checkpoint was written, so
+        that the rows of the resumed optimisation follow on.
+        """
+
+        if os.path.splitext(self.stream)[1] == '.csv':
+            with open(self.stream, 'r+b') as f:
+                # the header precedes the rows.
+                for _ in range(self.n_flushed + 1):
+                    if not f.readline():
+                        break
+
+                f.truncate()
+        else:
+            os.truncate(self.stream, self.n_flushed * self.dtype.itemsize)
+
+
+class TrajectoryHistory(BaseHistory):
+
+    """
+    Records the positions and fitness of the whole population at every
+    generation into memory-mapped files, so that long optimisations can
+    be recorded without holding the trajectory in memory.
+    """
+
+    def __init__(self, ga, path, n_generations=None):
+
+        """
+        Initialises the TrajectoryHistory.
+
+        Parameters
+        ----------
+        ga : BaseGA
+            Optimiser for which to record the trajectory.
+        path : str
+            Directory in which to write the trajectory.
+        n_generations : int
+            Number of generations to preallocate on disk, defaults to
+            the number of iterations of the optimiser. The files are
+            extended by doubling when more generations are written.
+
+        Attributes
+        ----------
+        n_written : int
+            Number of generations written.
+        """
+
+        super().__init__(ga)
+
+        if n_generations is None:
+            n_generations = getattr(ga, 'n_iterations', 0) + 1
+
+        if not n_generations >= 1:
+            raise ValueError('n_generations must be >= 1')
+
+        self.path = path
+        self.n_generations = n_generations
+        self.n_written = 0
+
+        self._positions = None
+        self._fitness = None
+
+    def _open(self, mode, n_individuals, n_dims):
+        self._positions = np.memmap(
+            os.path.join(self.path, 'positions.dat'), dtype=np.float64,
+            mode=mode, shape=(self.n_generations, n_individuals, n_dims)
+        )
+
+        self._fitness = np.memmap(
+            os.path.join(self.path, 'fitness.dat'), dtype=np.float64,
+            mode=mode, shape=(self.n_generations, n_individuals)
+        )
+
+    def write_history(self):
+        population = self.ga.population
+        n_individuals, n_dims = population.positions.shape
+
+        if self._positions is None:
+            os.makedirs(self.path, exist_ok=True)
+
+            # a resumed optimisation continues the existing files.
+            mode = 'r+' if self.n_written else 'w+'
+            self._open(mode, n_individuals, n_dims)
+
+        if not self._positions.shape[1:] == (n_individuals, n_dims):
+            raise ValueError('Population does not match the trajectory.')
+
+        if self.n_written == self.n_generations:
+            self.flush()
+            self.n_generations *= 2
+            self._open('r+', n_individuals, n_dims)
+
+        self._positions[self.n_written] = population.positions
+        self._fitness[self.n_written] = population.fitness
+
+        self.n_written += 1
+
+    def flush(self):
+        if self._positions is None:
+            return
+
+        self._positions.flush()
+        self._fitness.flush()
+
+        n_individuals, n_dims = self._positions.shape[1:]
+        meta = np.array([self.n_written, n_individuals, n_dims])
+        np.save(os.path.join(self.path, 'meta.npy'), meta)
+
+    def state_dict(self):
+        self.flush()
+
+        return {
+            'n_written': self.n_written,
+            'n_generations': self.n_generations
+        }
+
+    def load_state_dict(self, state):
+        self.n_written = int(state['n_written'])
+        self.n_generations = int(state['n_generations'])
+
+        self._positions = None
+        self._fitness = None
+
+    @staticmethod
+    def read(path):
+
+        """
+        Opens a recorded trajectory for reading.
+
+        Generations are only loaded from disk when sliced.
+
+        Parameters
+        ----------
+        path : str
+            Directory in which the trajectory was written.
+
+        Returns
+        -------
+        positions : np.memmap
+            Positions of shape (n_generations, n_individuals, n_dims).
+        fitness : np.memmap
+            Fitness of shape (n_generations, n_individuals).
+        """
+
+        n_written, n_individuals, n_dims = (
+            int(v) for v in np.load(os.path.join(path, 'meta.npy'))
+        )
+
+        positions = np.memmap(
+            os.path.join(path, 'positions.dat'), dtype=np.float64,
+            mode='r', shape=(n_written, n_individuals, n_dims)
+        )
+
+        fitness = np.memmap(
+            os.path.join(path, 'fitness.dat'), dtype=np.float64,
+            mode='r', shape=(n_written, n_individuals)
+        )
+
+        return positions, fitness
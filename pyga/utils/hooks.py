@@ -0,0 +1,83 @@
+class HookRegistry:
+
+    """Registry of functions called at events of the optimisation."""
+
+    # events, with the arguments passed to the registered functions:
+    #   on_optimise_start(ga)
+    #   on_generation_start(ga)
+    #   on_evaluated(ga, positions, fitness)
+    #   on_generation_end(ga) - returning True stops the optimisation
+    #   on_optimise_end(ga)
+    events = ('on_optimise_start', 'on_generation_start', 'on_evaluated',
+              'on_generation_end', 'on_optimise_end')
+
+    def __init__(self):
+
+        """
+        Initialises the HookRegistry.
+
+        Attributes
+        ----------
+        hooks : dict
+            Event names mapped to the list of registered functions.
+        """
+
+        self.hooks = {event: [] for event in self.events}
+
+    def register(self, event, fn):
+
+        """
+        Registers a function to be called at an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event, one of HookRegistry.events.
+        fn : function
+            Function to call.
+        """
+
+        if event not in self.hooks:
+            raise ValueError(f'event must be one of {self.events}')
+
+        self.hooks[event].append(fn)
+
+    def remove(self, event, fn):
+
+        """
+        Removes a registered function.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        fn : function
+            Function to remove.
+        """
+
+        self.hooks[event].remove(fn)
+
+    def fire(self, event, *args):
+
+        """
+        Calls every function registered for an event.
+
+        Parameters
+        ----------
+        event : str
+            Name of the event.
+        args : tuple
+            Arguments passed to each function.
+
+        Returns
+        -------
+        bool
+            True if any function returned True, which requests that
+            the optimisation stops.
+        """
+
+        stop = False
+        for fn in self.hooks[event]:
+            stop |= bool(fn(*args))
+
+        return stop
@@ -0,0 +1,226 @@
+import abc
+import warnings
+import numpy as np
+
+from .rng import RngMixin, get_rng
+
+
+class BaseInitialiser(RngMixin, abc.ABC):
+
+    """Abstract Base Class for all Initialiser functionality."""
+
+    def initialise(self, n_individuals, lb, ub):
+
+        """
+        Generates the positions of an initial population.
+
+        Parameters
+        ----------
+        n_individuals : int
+            Number of positions to generate.
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        np.ndarray
+            Positions of shape (n_individuals, d) within the bounds.
+        """
+
+        unit = self._sample(n_individuals, len(lb))
+        return lb + unit * (ub - lb)
+
+    @abc.abstractmethod
+    def _sample(self, n_individuals, n_dims):
+
+        """
+        Generates points in the unit hypercube.
+
+        Parameters
+        ----------
+        n_individuals : int
+            Number of points to generate.
+        n_dims : int
+            Number of dimensions of the points.
+
+        Returns
+        -------
+        np.ndarray
+            Points of shape (n_individuals, n_dims) within [0, 1).
+
+        Raises
+        ------
+        NotImplementedError
+            Raises when this function has not yet been implemented.
+        """
+
+        raise NotImplementedError('BaseInitialiser::_sample()')
+
+
+class UniformInitialiser(BaseInitialiser):
+
+    """Draws each gene uniformly at random."""
+
+    def _sample(self, n_individuals, n_dims):
+        return get_rng(self.rng).uniform(size=(n_individuals, n_dims))
+
+
+class LatinHypercubeInitialiser(BaseInitialiser):
+
+    """
+    Latin hypercube sampling - the range of each gene is split into
+    n_individuals strata and every stratum holds exactly one member.
+    """
+
+    def _sample(self, n_individuals, n_dims):
+        rng = get_rng(self.rng)
+
+        # an independent permutation of the strata for each gene.
+        strata = rng.uniform(size=(n_individuals, n_dims)).argsort(axis=0)
+
+        jitter = rng.uniform(size=(n_individuals, n_dims))
+        return (strata + jitter) / n_individuals
+
+
+class HaltonInitialiser(BaseInitialiser):
+
+    """
+    Halton sequence, using the radical inverse of the member index in
+    a distinct prime base for each gene.
+    """
+
+    def __init__(self, scramble=True):
+
+        """
+        Initialises the HaltonInitialiser.
+
+        Parameters
+        ----------
+        scramble : bool
+            Whether to randomly shift the sequence (modulo one) so that
+            each optimisation starts from a different design.
+        """
+
+        self.scramble = scramble
+
+    @staticmethod
+    def _primes(n):
+
+        """
+        Provides the first n prime numbers.
+
+        Parameters
+        ----------
+        n : int
+            Number of primes.
+
+        Returns
+        -------
+        np.ndarray
+            The first n primes.
+        """
+
+        # upper bound on the n-th prime, valid for n >= 6.
+        if n < 6:
+            limit = 15
+        else:
+            limit = int(n * (np.log(n) + np.log(np.log(n)))) + 1
+
+        sieve = np.ones(limit + 1, dtype=bool)
+        sieve[:2] = False
+
+        for i in range(2, int(limit ** 0.5) + 1):
+            if sieve[i]:
+                sieve[i * i::i] = False
+
+        return np.flatnonzero(sieve)[:n]
+
+    def _sample(self, n_individuals, n_dims):
+        bases = self._primes(n_dims)
+
+        # the first point of the sequence is the origin, so it is skipped.
+        indices = np.tile(np.arange(1, n_individuals + 1)[:, np.newaxis],
+                          (1, n_dims))
+
+        points = np.zeros((n_individuals, n_dims))
+        scale = np.ones(n_dims) / bases
+
+        while np.any(indices > 0):
+            points += scale * (indices % bases)
+            indices //= bases
+            scale /= bases
+
+        if self.scramble:
+            shift = get_rng(self.rng).uniform(size=n_dims)
+            points = np.mod(points + shift, 1.0)
+
+        return points
+
+
+class SobolInitialiser(BaseInitialiser):
+
+    """Scrambled Sobol sequence, requires scipy >= 1.7."""
+
+    def __init__(self):
+
+        """
+        Initialises the SobolInitialiser.
+
+        Raises
+        ------
+        ImportError
+            If scipy >= 1.7 is not installed.
+        """
+
+        try:
+            import scipy.stats.qmc  # noqa: F401
+        except ImportError:
+            raise ImportError(
+                'SobolInitialiser requires scipy >= 1.7, install it with '
+                '`pip install PyGAopt[sobol]`.'
+            )
+
+    def _sample(self, n_individuals, n_dims):
+        from scipy.stats import qmc
+
+        sampler = qmc.Sobol(n_dims, scramble=True, seed=get_rng(self.rng))
+
+        # the balance of the sequence is only guaranteed for powers of
+        # two, scipy warns otherwise.
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            return sampler.random(n_individuals)
+
+
+class OppositionInitialiser(BaseInitialiser):
+
+    """
+    Opposition-based initialisation - half of the population is drawn
+    by a base initialiser and the remainder are the opposite points,
+    reflected through the centre of the search space.
+    """
+
+    def __init__(self, base=None):
+
+        """
+        Initialises the OppositionInitialiser.
+
+        Parameters
+        ----------
+        base : BaseInitialiser
+            Initialiser drawing the first half of the population,
+            UniformInitialiser if None.
+        """
+
+        self.base = UniformInitialiser() if base is None else base
+
+    def _sample(self, n_individuals, n_dims):
+        self.base.rng = self.rng
+
+        n_base = (n_individuals + 1) // 2
+        points = self.base._sample(n_base, n_dims)
+
+        opposite = 1.0 - points[:n_individuals - n_base]
+        return np.concatenate([points, opposite])
@@ -1,8 +1,10 @@
 import abc
 import numpy as np
 
+from .rng import RngMixin, get_rng
 
-class BaseMutation(abc.ABC):
+
+class BaseMutation(RngMixin, abc.ABC):
 
     """Abstract Base Class for all Mutation functionality."""
 
@@ -25,6 +27,33 @@ class BaseMutation(abc.ABC):
 
         raise NotImplementedError('BaseMutation::mutate()')
 
+    def mutate_batch(self, positions, lb, ub):
+
+        """
+        Mutates a batch of positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) to mutate.
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        np.ndarray
+            Mutated positions of shape (n, d).
+
+        Raises
+        ------
+        NotImplementedError
+            No batch implementation, mutate() is used for each member.
+        """
+
+        raise NotImplementedError('BaseMutation::mutate_batch()')
+
 
 class RandomMutation(BaseMutation):
 
@@ -49,5 +78,168 @@ class RandomMutation(BaseMutation):
             Individual with mutated position.
         """
 
-        individual.position *= np.random.uniform(self.lower, self.upper)
+        rng = get_rng(self.rng)
+
+        individual.position *= rng.uniform(self.lower, self.upper)
+        return individual
+
+    def mutate_batch(self, positions, lb, ub):
+        rng = get_rng(self.rng)
+        scale = rng.uniform(self.lower, self.upper, (len(positions), 1))
+        return positions * scale
+
+
+class GeneMutation(BaseMutation):
+
+    """Base Class for mutations applied independently to each gene."""
+
+    def __init__(self, p_gene=None):
+
+        """
+        Initialises the GeneMutation Class.
+
+        Parameters
+        ----------
+        p_gene : float
+            Probability of mutating each gene, defaults to 1 / d.
+        """
+
+        if p_gene is not None and not 0 < p_gene <= 1:
+            raise ValueError('p_gene must be within (0, 1]')
+
+        self.p_gene = p_gene
+
+    def mutate(self, individual):
+
+        """
+        Mutates the provided individual.
+
+        Parameters
+        ----------
+        individual : Individual
+            Individual for which to mutate.
+
+        Returns
+        -------
+        Individual
+            Individual with mutated position.
+        """
+
+        individual.position = self.mutate_batch(
+            individual.position[np.newaxis], individual.lb, individual.ub
+        )[0]
+
         return individual
+
+    def mutate_batch(self, positions, lb, ub):
+        rng = get_rng(self.rng)
+        p_gene = self.p_gene or 1 / positions.shape[1]
+        mask = rng.uniform(size=positions.shape) < p_gene
+
+        mutated = self._mutate_genes(positions, lb, ub)
+        return np.where(mask, mutated, positions)
+
+    @abc.abstractmethod
+    def _mutate_genes(self, positions, lb, ub):
+
+        """
+        Mutates every gene of the positions.
+
+        Parameters
+        ----------
+        positions : np.ndarray
+            Positions of shape (n, d) to mutate.
+        lb : np.ndarray
+            Lower bound of the search space.
+        ub : np.ndarray
+            Upper bound of the search space.
+
+        Returns
+        -------
+        np.ndarray
+            Mutated positions of shape (n, d), within bounds.
+        """
+
+        raise NotImplementedError('GeneMutation::_mutate_genes()')
+
+
+class GaussianMutation(GeneMutation):
+
+    """Adds gaussian noise, scaled to the range of each gene."""
+
+    def __init__(self, sigma=0.1, p_gene=None):
+
+        """
+        Initialises the GaussianMutation Class.
+
+        Parameters
+        ----------
+        sigma : float
+            Standard deviation as a fraction of the range of each gene.
+        p_gene : float
+            Probability of mutating each gene, defaults to 1 / d.
+        """
+
+        super().__init__(p_gene)
+
+        if not sigma > 0:
+            raise ValueError('sigma must be > 0')
+
+        self.sigma = sigma
+
+    def _mutate_genes(self, positions, lb, ub):
+        rng = get_rng(self.rng)
+        noise = rng.normal(0.0, self.sigma, size=positions.shape)
+        return np.clip(positions + noise * (ub - lb), lb, ub)
+
+
+class PolynomialMutation(GeneMutation):
+
+    """Implementation of bounded 'polynomial mutation'."""
+
+    def __init__(self, eta=20.0, p_gene=None):
+
+        """
+        Initialises the PolynomialMutation Class.
+
+        Parameters
+        ----------
+        eta : float
+            Distribution index, larger values give smaller mutations.
+        p_gene : float
+            Probability of mutating each gene, defaults to 1 / d.
+        """
+
+        super().__init__(p_gene)
+
+        if not eta >= 0:
+            raise ValueError('eta must be >= 0')
+
+        self.eta = eta
+
+    def _mutate_genes(self, positions, lb, ub):
+        rng = get_rng(self.rng)
+        positions = np.clip(positions, lb, ub)
+
+        span = ub - lb
+        delta_l = (positions - lb) / span
+        delta_u = (ub - positions) / span
+
+        r = rng.uniform(size=positions.shape)
+        power = 1.0 / (self.eta + 1.0)
+
+        lower = (2.0 * r + (1.0 - 2.0 * r)
+                 * (1.0 - delta_l) ** (self.eta + 1.0)) ** power - 1.0
+        upper = 1.0 - (2.0 * (1.0 - r) + 2.0 * (r - 0.5)
+                       * (1.0 - delta_u) ** (self.eta + 1.0)) ** power
+
+        delta_q = np.where(r < 0.5, lower, upper)
+        return np.clip(positions + delta_q * span, lb, ub)
+
+
+class UniformResetMutation(GeneMutation):
+
+    """Resets genes to a value drawn uniformly within the bounds."""
+
+    def _mutate_genes(self, positions, lb, ub):
+        return get_rng(self.rng).uniform(lb, ub, size=positions.shape)
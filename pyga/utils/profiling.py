@@ -0,0 +1,145 @@
+import json
+import time
+
+
+class _NullPhase:
+
+    """Context manager which does nothing, used when timing is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+
+    """Context manager adding its duration to a PhaseTimer."""
+
+    __slots__ = ('timer', 'name', 't_start')
+
+    def __init__(self, timer, name):
+        self.timer = timer
+        self.name = name
+
+    def __enter__(self):
+        self.t_start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timer.add(self.name, time.perf_counter() - self.t_start)
+        return False
+
+
+class PhaseTimer:
+
+    """Accumulates the time spent in each phase of the optimisation."""
+
+    def __init__(self, enabled=False):
+
+        """
+        Initialises the PhaseTimer.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether phases are timed, no time is recorded when False.
+
+        Attributes
+        ----------
+        totals : dict
+            Phase names mapped to the total time spent in seconds.
+        counts : dict
+            Phase names mapped to the number of times entered.
+        """
+
+        self.enabled = enabled
+
+        self.totals = {}
+        self.counts = {}
+
+    def phase(self, name):
+
+        """
+        Times the enclosed block as part of a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+
+        Returns
+        -------
+        context manager
+            Records the duration of the block on exit.
+        """
+
+        if not self.enabled:
+            return _NULL_PHASE
+
+        return _Phase(self, name)
+
+    def add(self, name, seconds):
+
+        """
+        Adds a duration to a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+        seconds : float
+            Duration to add.
+        """
+
+        self.totals[name] = self.totals.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def reset(self):
+
+        """Discards all recorded timings."""
+
+        self.totals = {}
+        self.counts = {}
+
+    def summary(self):
+
+        """
+        Provides the aggregated timings of each phase.
+
+        Returns
+        -------
+        dict
+            Phase names mapped to the total and mean seconds, the
+            number of calls and the fraction of the total time.
+        """
+
+        overall = sum(self.totals.values()) or 1.0
+
+        return {
+            name: {
+                'total': total,
+                'calls': self.counts[name],
+                'mean': total / self.counts[name],
+                'fraction': total / overall
+            }
+            for name, total in self.totals.items()
+        }
+
+    def export(self, path):
+
+        """
+        Writes the summary of the timings to a JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Location of the file.
+        """
+
+        with open(path, 'w') as f:
+            json.dump(self.summary(), f, indent=2)
@@ -1,4 +1,6 @@
 import numpy as np
+
+from .rng import get_rng
 from .crossovers import BaseCrossover
 
 
@@ -23,30 +25,49 @@ class BaseRecombination(BaseCrossover):
             raise ValueError('p must be > 0')
 
     def cross(self, parent_a, parent_b):
-        raise NotImplementedError('BaseRecombination::cross()')
+        children = self.cross_batch(
+            parent_a.position[np.newaxis], parent_b.position[np.newaxis],
+            parent_a.lb, parent_a.ub
+        )
+
+        parent_a.position, parent_b.position = children[0][0], children[1][0]
+        return parent_a, parent_b
 
-    @staticmethod
-    def _in_bounds(v, lb, ub):
+    def _recombine(self, parents_a, parents_b, a, b, lb, ub):
 
         """
-        Determines whether vector is within defined bounds.
+        Recombines each pair of parents, genes are only changed where
+        both of the recombined values are within bounds.
 
         Parameters
         ----------
-        v : np.ndarray
-            Array to determine if within bounds.
+        parents_a : np.ndarray
+            First parent of each pair, of shape (n_pairs, d).
+        parents_b : np.ndarray
+            Second parent of each pair, of shape (n_pairs, d).
+        a : np.ndarray
+            Weights of the first parent, broadcastable to (n_pairs, d).
+        b : np.ndarray
+            Weights of the second parent, broadcastable to (n_pairs, d).
         lb : np.ndarray
-            Lower bound.
+            Lower bound of the search space.
         ub : np.ndarray
-            Upper bound.
+            Upper bound of the search space.
 
         Returns
         -------
-        bool
-            True if v is within the prescribed bounds.
+        tuple
+            Children of each pair.
         """
 
-        return np.logical_and(v >= lb, v <= ub).all()
+        t = a * parents_a + (1 - a) * parents_b
+        s = b * parents_b + (1 - b) * parents_a
+
+        if lb is None or ub is None:
+            return t, s
+
+        mask = (t >= lb) & (t <= ub) & (s >= lb) & (s <= ub)
+        return np.where(mask, t, parents_a), np.where(mask, s, parents_b)
 
 
 class LineRecombination(BaseRecombination):
@@ -56,21 +77,12 @@ class LineRecombination(BaseRecombination):
     def __init__(self, p=0.25):
         super().__init__(p)
 
-    def cross(self, parent_a, parent_b):
-        lb, ub = parent_a.lb, parent_b.ub
-
-        a = np.random.uniform(-self.p, 1 + self.p)
-        b = np.random.uniform(-self.p, 1 + self.p)
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+        rng = get_rng(self.rng)
+        a = rng.uniform(-self.p, 1 + self.p, size=(len(parents_a), 1))
+        b = rng.uniform(-self.p, 1 + self.p, size=(len(parents_a), 1))
 
-        for i in range(len(parent_a.position)):
-            t = a * parent_a.position[i] + (1 - a) * parent_b.position[i]
-            s = b * parent_b.position[i] + (1 - b) * parent_a.position[i]
-
-            if self._in_bounds(t, lb, ub) and self._in_bounds(s, lb, ub):
-                parent_a.position[i] = t
-                parent_b.position[i] = s
-
-        return parent_a, parent_b
+        return self._recombine(parents_a, parents_b, a, b, lb, ub)
 
 
 class IntermediateRecombination(BaseRecombination):
@@ -80,18 +92,9 @@ class IntermediateRecombination(BaseRecombination):
     def __init__(self, p=0.25):
         super().__init__(p)
 
-    def cross(self, parent_a, parent_b):
-        lb, ub = parent_a.lb, parent_b.ub
-
-        for i in range(len(parent_a.position)):
-            a = np.random.uniform(-self.p, 1 + self.p)
-            b = np.random.uniform(-self.p, 1 + self.p)
+    def cross_batch(self, parents_a, parents_b, lb=None, ub=None):
+        rng = get_rng(self.rng)
+        a = rng.uniform(-self.p, 1 + self.p, size=parents_a.shape)
+        b = rng.uniform(-self.p, 1 + self.p, size=parents_a.shape)
 
-            t = a * parent_a.position[i] + (1 - a) * parent_b.position[i]
-            s = b * parent_b.position[i] + (1 - b) * parent_a.position[i]
-
-            if self._in_bounds(t, lb, ub) and self._in_bounds(s, lb, ub):
-                parent_a.position[i] = t
-                parent_b.position[i] = s
-
-        return parent_a, parent_b
+        return self._recombine(parents_a, parents_b, a, b, lb, ub)
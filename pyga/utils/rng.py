@@ -0,0 +1,82 @@
+import numpy as np
+
+_default_rng = np.random.default_rng()
+
+
+class RngMixin:
+
+    """
+    Provides the rng attribute of a random operator, the generator is
+    assigned by the optimiser and the module default generator is used
+    when None - see get_rng().
+    """
+
+    rng = None
+
+
+def check_rng(seed=None):
+
+    """
+    Creates a random number generator from the provided seed.
+
+    Parameters
+    ----------
+    seed : None, int, np.random.SeedSequence, np.random.Generator
+        Seed for a new generator, an existing generator is returned
+        as is - None provides a fresh, unpredictable generator.
+
+    Returns
+    -------
+    np.random.Generator
+        Random number generator.
+    """
+
+    if isinstance(seed, np.random.Generator):
+        return seed
+
+    return np.random.default_rng(seed)
+
+
+def get_rng(rng=None):
+
+    """
+    Provides the generator to use for a random operation.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Generator assigned to the caller, may be None.
+
+    Returns
+    -------
+    np.random.Generator
+        rng if provided, otherwise a module-wide default generator.
+    """
+
+    return _default_rng if rng is None else rng
+
+
+def spawn_seeds(rng, n):
+
+    """
+    Spawns independent seed sequences from a generator, suitable for
+    seeding parallel workers.
+
+    The root sequence is seeded by a draw from the generator, as the
+    seed sequence of a bit generator is only exposed from numpy 1.25.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Generator from which to spawn the child streams.
+    n : int
+        Number of seed sequences to spawn.
+
+    Returns
+    -------
+    list
+        Independent np.random.SeedSequence objects.
+    """
+
+    root = np.random.SeedSequence(int(rng.integers(2 ** 63)))
+    return root.spawn(n)
@@ -1,10 +1,10 @@
 import abc
-import copy
 import numpy as np
-import itertools as it
 
+from .rng import RngMixin, get_rng
 
-class BaseSelection(abc.ABC):
+
+class BaseSelection(RngMixin, abc.ABC):
 
     """Abstract Base Class for all Selection functionality."""
 
@@ -18,13 +18,53 @@ class BaseSelection(abc.ABC):
 
         Parameters
         ----------
-        population : list
-            List of individuals.
+        population : Population
+            Population from which individuals will be selected.
         """
 
         raise NotImplementedError('BaseSelection::preprocess()')
 
     @abc.abstractmethod
+    def select_index(self, population):
+
+        """
+        Selects an individual from the population.
+
+        Parameters
+        ----------
+        population : Population
+            Population from which to select an individual.
+
+        Returns
+        -------
+        int
+            Index of the individual selected from the population.
+        """
+
+        raise NotImplementedError('BaseSelection::select_index()')
+
+    def select_many(self, population, k):
+
+        """
+        Selects k individuals from the population.
+
+        Parameters
+        ----------
+        population : Population
+            Population from which to select the individuals.
+        k : int
+            Number of individuals to select.
+
+        Returns
+        -------
+        np.ndarray
+            Indices of the individuals selected from the population,
+            the offspring can then be created with population.take().
+        """
+
+        return np.array([self.select_index(population) for _ in range(k)],
+                        dtype=np.intp)
+
     def select(self, population):
 
         """
@@ -32,16 +72,17 @@ class BaseSelection(abc.ABC):
 
         Parameters
         ----------
-        population : list
-            List from which to select an individual.
+        population : Population
+            Population from which to select an individual.
 
         Returns
         -------
         Individual
-            Copy of the individual selected from the population.
+            View of the individual selected from the population, copy
+            the individual before modifying it.
         """
 
-        raise NotImplementedError('BaseSelection::select()')
+        return population[self.select_index(population)]
 
 
 class RandomSelection(BaseSelection):
@@ -51,8 +92,11 @@ class RandomSelection(BaseSelection):
     def preprocess(self, population):
         pass
 
-    def select(self, population):
-        return copy.deepcopy(np.random.choice(population))
+    def select_index(self, population):
+        return get_rng(self.rng).integers(len(population))
+
+    def select_many(self, population, k):
+        return get_rng(self.rng).integers(len(population), size=k)
 
 
 class TournamentSelection(BaseSelection):
@@ -78,13 +122,14 @@ class TournamentSelection(BaseSelection):
     def preprocess(self, population):
         pass
 
-    def select(self, population):
-        best = copy.deepcopy(np.random.choice(population))
-        for i in range(1, self.t_size):
-            nxt = copy.deepcopy(np.random.choice(population))
-            if nxt.fitness < best.fitness:
-                best = nxt
-        return best
+    def select_index(self, population):
+        return self.select_many(population, 1)[0]
+
+    def select_many(self, population, k):
+        rng = get_rng(self.rng)
+        contestants = rng.integers(len(population), size=(k, self.t_size))
+        winners = np.argmin(population.rank_key()[contestants], axis=1)
+        return contestants[np.arange(k), winners]
 
 
 class FitnessProportionateSelection(BaseSelection):
@@ -98,34 +143,63 @@ class FitnessProportionateSelection(BaseSelection):
 
         Attributes
         ----------
-        cdf : list
+        cdf : np.ndarray
             Cumulative fitness for the population.
         """
 
         self.cdf = None
 
     def preprocess(self, population):
-        flist = [1 / i.fitness for i in population]
-        self.cdf = list(it.accumulate(flist, lambda x, y: x + y))
+        self.cdf = np.cumsum(1 / population.fitness)
 
-    def select(self, population):
-        n = np.random.uniform(0, self.cdf[-1])
-        for i in range(1, len(self.cdf)):
-            if self.cdf[i - 1] < n <= self.cdf[i]:
-                return copy.deepcopy(population[i])
+    def select_index(self, population):
+        return self.select_many(population, 1)[0]
 
-        return copy.deepcopy(population[0])
+    def select_many(self, population, k):
+        rng = get_rng(self.rng)
+        n = rng.uniform(0, self.cdf[-1], size=k)
+        idx = np.searchsorted(self.cdf, n)
+        return np.minimum(idx, len(self.cdf) - 1)
 
 
 class TruncationSelection(BaseSelection):
 
     """Implementation of 'truncation selection'."""
 
+    def __init__(self, proportion=0.5):
+
+        """
+        Initialises the TruncationSelection Class.
+
+        Parameters
+        ----------
+        proportion : float
+            Proportion of the fittest individuals eligible for selection.
+
+        Attributes
+        ----------
+        candidates : np.ndarray
+            Indices of the individuals eligible for selection.
+        """
+
+        if not 0 < proportion <= 1:
+            raise ValueError('proportion must be within (0, 1]')
+
+        self.proportion = proportion
+        self.candidates = None
+
     def preprocess(self, population):
-        pass
+        n_candidates = max(1, int(self.proportion * len(population)))
+        _order = np.argsort(population.rank_key(), kind='stable')
+        self.candidates = _order[:n_candidates]
 
-    def select(self, population):
-        pass
+    def select_index(self, population):
+        return self.select_many(population, 1)[0]
+
+    def select_many(self, population, k):
+        rng = get_rng(self.rng)
+        idx = rng.integers(len(self.candidates), size=k)
+        return self.candidates[idx]
 
 
 class StochasticUniversalSamplingSelection(BaseSelection):
@@ -139,60 +213,40 @@ class StochasticUniversalSamplingSelection(BaseSelection):
 
         Attributes
         ----------
-        population : list
-            Holds the current population.
-        flist : list
+        indices : np.ndarray
+            Shuffled indices of the current population.
+        flist : np.ndarray
             Fitnesses of all members of the population.
-        cdf : list
+        cdf : np.ndarray
             Cumulative fitness for the population.
-        index : int
-            Current index from which to select a population member.
         value : float
-            Value used to determine the index from which to sample.
+            Position of the next pointer used by select_index.
         """
 
-        self.population = None
+        self.indices = None
         self.flist = None
         self.cdf = None
-        self.index = None
         self.value = None
 
     def preprocess(self, population):
-        self.population = self._shuffle(copy.deepcopy(population))
-        self.flist = [1 / i.fitness for i in self.population]
-        self.cdf = list(it.accumulate(self.flist, lambda x, y: x + y))
-        self.index = 0
-        self.value = np.random.uniform(0, self.cdf[-1] / len(self.population))
-
-    def select(self, population):
-        while self.index < self.value:
-            self.index += 1
-        self.value += self.cdf[-1] / len(self.population)
-
-        if self.index > len(self.population) - 1:
-            return self.population[-1]
-
-        return self.population[self.index]
+        rng = get_rng(self.rng)
+        self.indices = rng.permutation(len(population))
+        self.flist = 1 / population.fitness[self.indices]
+        self.cdf = np.cumsum(self.flist)
+        self.value = rng.uniform(0, self.cdf[-1] / len(self.indices))
 
-    @staticmethod
-    def _shuffle(population):
+    def select_index(self, population):
+        idx = min(np.searchsorted(self.cdf, self.value), len(self.cdf) - 1)
+        self.value += self.cdf[-1] / len(self.indices)
 
-        """
-        Randomly shuffles the members of the provided population.
-
-        Parameters
-        ----------
-        population : list
-            The population list for which to randomly shuffle.
+        return self.indices[idx]
 
-        Returns
-        -------
-        population : list
-            Shuffled population.
-        """
+    def select_many(self, population, k):
+        rng = get_rng(self.rng)
+        step = self.cdf[-1] / k
+        pointers = rng.uniform(0, step) + step * np.arange(k)
 
-        for i in range(len(population) - 1, 1, -1):
-            j = np.random.randint(0, i + 1)
-            population[i], population[j] = population[j], population[i]
+        idx = np.searchsorted(self.cdf, pointers)
+        idx = np.minimum(idx, len(self.cdf) - 1)
 
-        return population
+        return rng.permutation(self.indices[idx])
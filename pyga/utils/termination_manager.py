@@ -1,5 +1,6 @@
 import abc
 import time
+import numpy as np
 
 
 class BaseTerminationManager(abc.ABC):
@@ -20,6 +21,53 @@ class BaseTerminationManager(abc.ABC):
             'BaseTerminationManager::termination_check()'
         )
 
+    @property
+    def evaluation_budget(self):
+
+        """
+        Maximum number of fitness evaluations allowed by the manager,
+        the optimiser truncates evaluation once it is reached.
+
+        Returns
+        -------
+        int
+            Number of evaluations, None if unlimited.
+        """
+
+        return None
+
+    def __or__(self, other):
+        return AnyTerminationManager(self, other)
+
+    def __and__(self, other):
+        return AllTerminationManager(self, other)
+
+    def state_dict(self):
+
+        """
+        Provides the state of the manager for checkpointing.
+
+        Returns
+        -------
+        dict
+            Names mapped to array_like values.
+        """
+
+        return {}
+
+    def load_state_dict(self, state):
+
+        """
+        Restores the state of the manager from a checkpoint.
+
+        Parameters
+        ----------
+        state : dict
+            Names mapped to np.ndarray values, as from state_dict().
+        """
+
+        pass
+
 
 class IterationTerminationManager(BaseTerminationManager):
 
@@ -79,10 +127,23 @@ class TimeTerminationManager(BaseTerminationManager):
         else:
             return False
 
+    def state_dict(self):
+        if self.t_start is None:
+            return {}
+
+        return {'t_elapsed': time.time() - self.t_start}
+
+    def load_state_dict(self, state):
+        if 't_elapsed' in state:
+            self.t_start = time.time() - float(state['t_elapsed'])
+
 
 class EvaluationTerminationManager(BaseTerminationManager):
 
-    """Terminates optimisation process after N function evaluations."""
+    """
+    Terminates optimisation process after N function evaluations, the
+    final batch of evaluations is truncated to stop exactly at N.
+    """
 
     def __init__(self, ga, n_evaluations):
 
@@ -97,11 +158,18 @@ class EvaluationTerminationManager(BaseTerminationManager):
             Total number of function evaluations allowed.
         """
 
+        if not n_evaluations >= 1:
+            raise ValueError('n_evaluations must be >= 1')
+
         self.ga = ga
-        self.n_iterations = n_evaluations // ga.n_individuals
+        self.n_evaluations = n_evaluations
+
+    @property
+    def evaluation_budget(self):
+        return self.n_evaluations
 
     def termination_check(self):
-        if self.ga.iteration > self.n_iterations:
+        if self.ga.n_evaluations >= self.n_evaluations:
             return True
         else:
             return False
@@ -156,3 +224,206 @@ class ErrorTerminationManager(BaseTerminationManager):
         """
 
         return self.target - self.threshold < val < self.target + self.threshold
+
+
+class StagnationTerminationManager(BaseTerminationManager):
+
+    """
+    Terminates optimisation process when the best fitness has not
+    improved for a number of generations.
+    """
+
+    def __init__(self, ga, n_generations, rtol=0.0, atol=0.0):
+
+        """
+        Initialises StagnationTerminationManager.
+
+        Parameters
+        ----------
+        ga : SOGA
+            Genetic algorithm to manage.
+        n_generations : int
+            Number of generations without improvement before stopping.
+        rtol : float
+            Improvement relative to the best fitness required to reset.
+        atol : float
+            Absolute improvement required to reset.
+
+        Attributes
+        ----------
+        best_fitness : float
+            Best fitness at the last improvement.
+        n_stagnant : int
+            Number of generations since the last improvement.
+        """
+
+        if not n_generations >= 1:
+            raise ValueError('n_generations must be >= 1')
+
+        self.ga = ga
+        self.n_generations = n_generations
+        self.rtol = rtol
+        self.atol = atol
+
+        self.best_fitness = np.inf
+        self.n_stagnant = 0
+
+        self._iteration = None
+
+    def termination_check(self):
+        best = self.ga.best_individual
+
+        # a new optimisation has started.
+        if self._iteration is not None and self.ga.iteration < self._iteration:
+            self.best_fitness = np.inf
+            self.n_stagnant = 0
+            self._iteration = None
+
+        # only count each generation once, however often checked.
+        if best is None or self.ga.iteration == self._iteration:
+            return self.n_stagnant >= self.n_generations
+
+        self._iteration = self.ga.iteration
+
+        tolerance = max(self.atol, self.rtol * abs(self.best_fitness))
+        if np.isinf(self.best_fitness):
+            tolerance = 0.0
+
+        if best.fitness < self.best_fitness - tolerance:
+            self.best_fitness = best.fitness
+            self.n_stagnant = 0
+        else:
+            self.n_stagnant += 1
+
+        return self.n_stagnant >= self.n_generations
+
+    def state_dict(self):
+        return {'best_fitness': self.best_fitness,
+                'n_stagnant': self.n_stagnant}
+
+    def load_state_dict(self, state):
+        if 'n_stagnant' in state:
+            self.best_fitness = float(state['best_fitness'])
+            self.n_stagnant = int(state['n_stagnant'])
+            self._iteration = self.ga.iteration
+
+
+class DiversityTerminationManager(BaseTerminationManager):
+
+    """
+    Terminates optimisation process when the population has collapsed,
+    measured as the mean standard deviation of each gene relative to
+    the range of the gene.
+    """
+
+    def __init__(self, ga, threshold=1e-6):
+
+        """
+        Initialises DiversityTerminationManager.
+
+        Parameters
+        ----------
+        ga : SOGA
+            Genetic algorithm to manage.
+        threshold : float
+            Diversity below which to terminate.
+        """
+
+        self.ga = ga
+        self.threshold = threshold
+
+    def diversity(self):
+
+        """
+        Measures the diversity of the population.
+
+        Returns
+        -------
+        float
+            Mean standard deviation of the genes relative to their range.
+        """
+
+        population = self.ga.population
+        spread = population.positions.std(axis=0) / (population.ub
+                                                     - population.lb)
+
+        return float(np.mean(spread))
+
+    def termination_check(self):
+        if self.ga.population is None:
+            return False
+
+        return self.diversity() < self.threshold
+
+
+class _CompositeTerminationManager(BaseTerminationManager):
+
+    """Base Class for combinations of termination managers."""
+
+    def __init__(self, *managers):
+
+        """
+        Initialises the combination of termination managers.
+
+        Parameters
+        ----------
+        managers : BaseTerminationManager
+            Termination managers to combine.
+        """
+
+        if not managers:
+            raise ValueError('At least one manager must be provided.')
+
+        self.managers = list(managers)
+
+    def _checks(self):
+
+        # every manager is checked so that stateful managers update.
+        return [manager.termination_check() for manager in self.managers]
+
+    def state_dict(self):
+        return {
+            f'{idx}.{k}': v
+            for idx, manager in enumerate(self.managers)
+            for k, v in manager.state_dict().items()
+        }
+
+    def load_state_dict(self, state):
+        for idx, manager in enumerate(self.managers):
+            prefix = f'{idx}.'
+            manager.load_state_dict({
+                k[len(prefix):]: v for k, v in state.items()
+                if k.startswith(prefix)
+            })
+
+
+class AnyTerminationManager(_CompositeTerminationManager):
+
+    """Terminates when any of the managers terminates, manager | other."""
+
+    @property
+    def evaluation_budget(self):
+        budgets = [m.evaluation_budget for m in self.managers
+                   if m.evaluation_budget is not None]
+
+        return min(budgets) if budgets else None
+
+    def termination_check(self):
+        return any(self._checks())
+
+
+class AllTerminationManager(_CompositeTerminationManager):
+
+    """Terminates when all of the managers terminate, manager & other."""
+
+    @property
+    def evaluation_budget(self):
+        budgets = [m.evaluation_budget for m in self.managers]
+
+        if None in budgets:
+            return None
+
+        return max(budgets)
+
+    def termination_check(self):
+        return all(self._checks())
@@ -15,8 +15,10 @@ setup(
     author='Daniel Kelshaw',
     author_email='daniel.j.kelshaw@gmail.com',
     url='https://github.com/danielkelshaw/PyGA',
-    packages=find_packages(exclude=['tests']),
+    packages=find_packages(exclude=['tests', 'benchmarks']),
     install_requires=requirements,
+    extras_require={'sobol': ['scipy>=1.7']},
+    python_requires='>=3.6',
     license='MIT License',
     test_suite='tests'
 )
@@ -4,7 +4,11 @@ import numpy as np
 from pyga.opt.soga import SOGA
 from pyga.individual import Individual
 from pyga.constraints.base_constraints import PositionConstraint
+from pyga.constraints.base_constraints import LinearConstraint, BoxConstraint
+from pyga.constraints.base_constraints import NamedPositions
 from pyga.constraints.constraint_manager import ConstraintManager
+from pyga.constraints.handlers import FeasibilityRules
+from pyga.constraints.repairs import ProjectionRepair
 
 
 class TestConstraintManager:
@@ -52,3 +56,107 @@ class TestConstraintManager:
         cm.register_constraint(position_constraint)
 
         assert len(cm.constraints) == 1
+
+    @pytest.fixture
+    def batch_constraint(self):
+
+        class Constraint(PositionConstraint):
+
+            def constrain(self, position):
+                return position['x0'] < 5.0
+
+            def constrain_batch(self, positions):
+                return positions['x0'] < 5.0
+
+        return Constraint()
+
+    def test_feasible(self, position_constraint, batch_constraint, soga):
+
+        positions = np.array([
+            [2.0, 7.0],
+            [6.0, 7.0],
+            [2.0, 3.0]
+        ])
+
+        cm = ConstraintManager(soga)
+        cm.register_constraint(batch_constraint)
+        cm.register_constraint(position_constraint)
+
+        assert list(cm.feasible(positions)) == [True, False, False]
+
+    def test_linear_box(self, soga):
+
+        positions = np.array([
+            [2.0, 7.0],
+            [6.0, 7.0],
+            [-1.0, 3.0]
+        ])
+
+        linear = LinearConstraint([[1.0, 1.0]], [12.0])
+        box = BoxConstraint([0.0, 0.0], [np.inf, 10.0])
+
+        assert list(linear.constrain_batch(
+            NamedPositions(soga.pnames, positions)
+        )) == [True, False, True]
+
+        cm = ConstraintManager(soga)
+        cm.register_constraint(linear)
+        cm.register_constraint(box)
+
+        assert list(cm.feasible(positions)) == [True, False, False]
+        assert box.constrain({'x0': 2.0, 'x1': 7.0})
+
+    def test_violation(self, position_constraint, soga):
+
+        positions = np.array([
+            [2.0, 7.0],
+            [6.0, 7.0],
+            [-1.0, 13.0]
+        ])
+
+        cm = ConstraintManager(soga)
+        cm.register_constraint(position_constraint)
+        cm.register_constraint(BoxConstraint([0.0, 0.0], [10.0, 10.0]))
+
+        assert list(cm.violation(positions)) == [0.0, 1.0, 4.0]
+
+    def test_evaluate_skips_infeasible(self, soga):
+
+        soga.initialise_population()
+        soga.population.positions[:5, 0] = 1.0
+        soga.population.positions[5:, 0] = 9.0
+
+        cm = soga.constraint_manager
+        cm.register_constraint(BoxConstraint([0.0, 0.0], [5.0, 10.0]))
+        cm.handler = FeasibilityRules()
+
+        evaluated = []
+
+        def fn(position):
+            evaluated.append(position)
+            return 1.0
+
+        soga.evaluate_population(soga.population, fn)
+
+        assert len(evaluated) == soga.n_evaluations == 5
+        assert np.all(soga.population.fitness[:5] == 1.0)
+        assert np.all(soga.population.fitness[5:] == np.inf)
+        assert np.all(soga.population.violation[5:] == 4.0)
+
+    def test_optimise(self):
+
+        bounds = {
+            'x0': [0.0, 10.0],
+            'x1': [0.0, 10.0]
+        }
+
+        soga = SOGA(bounds, n_individuals=20, n_iterations=20, seed=0)
+
+        cm = soga.constraint_manager
+        cm.register_constraint(LinearConstraint([[1.0, 1.0]], [4.0]))
+        cm.handler = FeasibilityRules()
+        cm.repair = ProjectionRepair()
+
+        soga.optimise(lambda x: -sum(x))
+
+        assert sum(soga.best_individual.position) <= 4.0
@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+
+from pyga.opt.ssga import SSGA
+from pyga.population import Population
+from pyga.constraints.handlers import *
+
+
+class TestStaticPenalty:
+
+    def test_apply(self):
+
+        handler = StaticPenalty(coefficient=10.0)
+
+        fitness = handler.apply(np.array([1.0, 2.0]), np.array([0.0, 0.5]))
+        assert list(fitness) == [1.0, 7.0]
+
+    def test_raise(self):
+
+        with pytest.raises(ValueError):
+            StaticPenalty(coefficient=0.0)
+
+
+class TestAdaptivePenalty:
+
+    def test_apply(self):
+
+        handler = AdaptivePenalty(coefficient=1.0, target=0.5, factor=2.0,
+                                  window=4)
+
+        fitness = handler.apply(np.zeros(4), np.array([0.0, 1.0, 1.0, 1.0]))
+        assert list(fitness) == [0.0, 1.0, 1.0, 1.0]
+        assert handler.coefficient == 2.0
+
+        handler.apply(np.zeros(4), np.zeros(4))
+        assert handler.coefficient == 1.0
+
+    def test_window(self):
+
+        handler = AdaptivePenalty(coefficient=1.0, target=0.5, factor=2.0,
+                                  window=4)
+
+        # single members are pooled until the window is full.
+        for violation in [1.0, 0.0, 0.0]:
+            handler.apply(np.zeros(1), np.array([violation]))
+            assert handler.coefficient == 1.0
+
+        handler.apply(np.zeros(1), np.array([1.0]))
+        assert handler.coefficient == 0.5
+
+        handler.apply(np.zeros(1), np.array([1.0]))
+        handler.reset()
+
+        assert handler.coefficient == 1.0
+        assert handler.n_handled == 0
+
+    def test_reset_environment(self):
+
+        ga = SSGA({'x0': [0.0, 1.0]}, n_individuals=10, n_iterations=10)
+        ga.constraint_manager.handler = AdaptivePenalty(window=2)
+        ga.constraint_manager.handler.coefficient = 8.0
+
+        ga.reset_environment()
+        assert ga.constraint_manager.handler.coefficient == 1.0
+
+
+class TestFeasibilityRules:
+
+    def test_apply(self):
+
+        handler = FeasibilityRules()
+
+        fitness = np.array([3.0, np.nan, 1.0, np.nan])
+        violation = np.array([0.0, 2.0, 0.0, 0.5])
+
+        fitness = handler.apply(fitness, violation)
+
+        assert list(fitness) == [3.0, np.inf, 1.0, np.inf]
+
+    def test_rank(self):
+
+        # an infeasible member ranks below a feasible member found later.
+        population = Population({'x0': [0.0, 1.0]}, 4)
+        population.violation[:] = [0.5, 0.0, 2.0, 0.0]
+        population.fitness[:] = FeasibilityRules().apply(
+            np.array([np.nan, 10.0, np.nan, 1.0]), population.violation
+        )
+
+        order = np.argsort(population.rank_key(), kind='stable')
+        assert list(order) == [3, 1, 0, 2]
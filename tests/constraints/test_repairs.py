@@ -0,0 +1,30 @@
+import numpy as np
+
+from pyga.constraints.repairs import *
+
+
+class TestProjectionRepair:
+
+    def test_repair(self):
+
+        positions = np.array([[-1.0, 5.0], [2.0, 12.0]])
+        lb, ub = np.zeros(2), np.full(2, 10.0)
+
+        repaired = ProjectionRepair().repair(positions, lb, ub)
+        assert np.array_equal(repaired, [[0.0, 5.0], [2.0, 10.0]])
+
+
+class TestFunctionRepair:
+
+    def test_repair(self):
+
+        positions = np.array([[-1.0, 5.0], [2.0, 12.0]])
+        lb, ub = np.zeros(2), np.full(2, 10.0)
+
+        repair = FunctionRepair(np.abs)
+        assert np.array_equal(repair.repair(positions, lb, ub),
+                              [[1.0, 5.0], [2.0, 12.0]])
+
+        repair = FunctionRepair(lambda p: p[:, ::-1], vectorized=True)
+        assert np.array_equal(repair.repair(positions, lb, ub),
+                              [[5.0, -1.0], [12.0, 2.0]])
@@ -0,0 +1,99 @@
+import time
+import pytest
+import numpy as np
+from pyga.opt.async_ssga import AsyncSSGA
+from pyga.utils.evaluators import ThreadPoolEvaluator
+from pyga.constraints.base_constraints import BoxConstraint
+from pyga.constraints.handlers import FeasibilityRules
+from pyga.utils.termination_manager import EvaluationTerminationManager
+
+
+def slow_sphere(position):
+    time.sleep(np.random.uniform(0.0, 0.002))
+    return np.sum(np.square(position))
+
+
+class TestAsyncSSGA:
+
+    @pytest.fixture
+    def ga(self):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        return AsyncSSGA(bounds, n_individuals=10, n_iterations=50,
+                         n_in_flight=4)
+
+    def test_init_raise(self):
+        with pytest.raises(ValueError):
+            AsyncSSGA({'x0': [0.0, 1.0]}, 10, 10, n_in_flight=0)
+
+    def test_breed(self, ga):
+
+        ga.initialise_population()
+        ga.evaluate_population(ga.population, slow_sphere)
+
+        child_a = ga.breed()
+        child_b = ga.breed()
+
+        assert len(ga.brood) == 0
+        assert child_a.position is not child_b.position
+
+    def test_optimise(self, ga):
+
+        evaluated = []
+
+        def fn(position):
+            evaluated.append(position)
+            return slow_sphere(position)
+
+        with ThreadPoolEvaluator(max_workers=4) as ga.evaluator:
+            ga.optimise(fn)
+
+        assert ga.pending == {}
+        assert ga.n_evaluations == len(evaluated)
+        assert ga.n_evaluations >= ga.n_individuals + ga.n_iterations + 1
+        assert ga.best_individual.fitness == pytest.approx(
+            slow_sphere(ga.best_individual.position)
+        )
+        expected = np.sum(np.square(ga.population.positions), axis=1)
+        assert np.allclose(ga.population.fitness, expected)
+
+    def test_optimise_constrained(self, ga):
+
+        evaluated = []
+
+        def fn(position):
+            evaluated.append(position.copy())
+            return slow_sphere(position)
+
+        cm = ga.constraint_manager
+        cm.register_constraint(BoxConstraint([5.0, -10.0], [10.0, 10.0]))
+        cm.handler = FeasibilityRules()
+
+        with ThreadPoolEvaluator(max_workers=4) as ga.evaluator:
+            ga.optimise(fn)
+
+        # infeasible children are never evaluated, nor the best.
+        assert np.all(np.array(evaluated)[:, 0] >= 5.0)
+        assert ga.n_evaluations == len(evaluated)
+        assert ga.best_individual.position[0] >= 5.0
+
+        infeasible = ga.population.violation > 0
+        assert np.all(ga.population.fitness[infeasible] == np.inf)
+
+    def test_step_optimise_spent(self, ga):
+
+        ga.initialise_population()
+        ga.evaluate_initial_population(slow_sphere)
+        ga.termination_manager = EvaluationTerminationManager(
+            ga, ga.n_evaluations
+        )
+
+        population = ga.population.copy()
+        ga.step_optimise(slow_sphere)
+
+        assert ga.pending == {}
+        assert np.array_equal(ga.population.positions, population.positions)
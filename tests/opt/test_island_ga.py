@@ -0,0 +1,128 @@
+import pytest
+import functools
+import numpy as np
+from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
+from pyga.opt.elite_soga import EliteSOGA
+from pyga.opt.island_ga import IslandGA
+from pyga.opt.island_ga import _Emigrants
+from pyga.utils.hall_of_fame import TopK
+from pyga.constraints.base_constraints import BoxConstraint
+from pyga.constraints.handlers import FeasibilityRules
+from pyga.utils.functions.single_objective import sphere
+
+
+def broken(position):
+    raise ValueError('broken')
+
+
+def infeasible_soga(seed=None):
+
+    bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+    ga = SOGA(bounds, 10, 10, seed=seed)
+
+    # no member of the search space satisfies the constraint.
+    cm = ga.constraint_manager
+    cm.register_constraint(BoxConstraint([20.0, -10.0], [30.0, 10.0]))
+    cm.handler = FeasibilityRules()
+
+    return ga
+
+
+@pytest.fixture
+def bounds():
+
+    return {
+        'x0': [-10.0, 10.0],
+        'x1': [-10.0, 10.0]
+    }
+
+
+class TestIslandGA:
+
+    @pytest.mark.parametrize('kwargs', [
+        {'n_islands': 1},
+        {'n_islands': 2, 'topology': 'star'},
+        {'n_islands': 2, 'migration_interval': 0}
+    ])
+    def test_init_raise(self, bounds, kwargs):
+        with pytest.raises(ValueError):
+            IslandGA(functools.partial(SOGA, bounds, 10, 10), **kwargs)
+
+    @pytest.mark.parametrize('topology', ['ring', 'full', 'random'])
+    def test_migrate(self, bounds, topology):
+
+        ga = IslandGA(functools.partial(SOGA, bounds, 10, 10), n_islands=3,
+                      n_migrants=2, topology=topology)
+
+        emigrants = [
+            (np.full((2, 2), i), np.array([i, i + 0.5])) for i in range(3)
+        ]
+        immigrants = ga.migrate(emigrants)
+
+        assert len(immigrants) == 3
+        for idx, (positions, fitness) in enumerate(immigrants):
+            assert positions.shape == (2, 2)
+            assert idx not in fitness.astype(int)
+
+        if topology == 'ring':
+            assert np.array_equal(immigrants[0][1], [2.0, 2.5])
+        elif topology == 'full':
+            assert np.array_equal(immigrants[0][1], [1.0, 1.5])
+
+    def test_optimise(self, bounds):
+
+        factory = functools.partial(EliteSOGA, bounds, 10, 2, 20)
+        ga = IslandGA(factory, n_islands=2, migration_interval=5, seed=3)
+        ga.optimise(sphere)
+
+        assert len(ga.arr_best_fitness) == 5
+        assert ga.best_individual.fitness == pytest.approx(
+            sphere(ga.best_individual.position)
+        )
+        assert np.all(np.diff(ga.arr_best_fitness) <= 0)
+
+    @pytest.mark.parametrize('cls', [SOGA, SSGA])
+    def test_optimise_emigrants(self, bounds, cls):
+
+        ga = IslandGA(functools.partial(cls, bounds, 10, 20), n_islands=2,
+                      migration_interval=5, n_migrants=4, seed=0)
+        ga.hall_of_fame = TopK(k=10)
+        ga.optimise(sphere)
+
+        # emigrants carry the fitness of their own positions.
+        positions, fitness = ga.hall_of_fame.best()
+        assert len(fitness) == 10
+        assert np.allclose(fitness, [sphere(p) for p in positions])
+
+    def test_emigrants(self, bounds):
+
+        ga = SOGA(bounds, 10, 10)
+        emigrants = _Emigrants(n_migrants=2, n_dims=2)
+
+        emigrants(ga, np.array([[3.0, 0.0], [1.0, 0.0]]), np.array([3.0, 1.0]))
+        emigrants(ga, np.array([[2.0, 0.0], [0.0, 0.0]]),
+                  np.array([2.0, np.inf]))
+
+        positions, fitness = emigrants.pop()
+        assert np.array_equal(fitness, [1.0, 2.0])
+        assert np.array_equal(positions[:, 0], [1.0, 2.0])
+
+        assert emigrants.pop()[0].shape == (0, 2)
+
+    def test_optimise_infeasible(self):
+
+        ga = IslandGA(infeasible_soga, n_islands=2, migration_interval=5,
+                      seed=0)
+        ga.optimise(sphere)
+
+        assert ga.best_individual is None
+        assert len(ga.arr_best_fitness) == 3
+        assert np.all(np.isnan(ga.arr_best_fitness))
+
+    def test_optimise_raise(self, bounds):
+
+        ga = IslandGA(functools.partial(SOGA, bounds, 10, 10), n_islands=2)
+
+        with pytest.raises(RuntimeError):
+            ga.optimise(broken)
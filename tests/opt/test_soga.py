@@ -1,6 +1,10 @@
 import pytest
+import numpy as np
 from pyga.individual import Individual
+from pyga.population import Population
 from pyga.opt.soga import SOGA
+from pyga.utils.functions.single_objective import rastrigin
+from pyga.utils.hall_of_fame import TopK, HallOfFame
 
 
 class TestSOGA:
@@ -39,18 +43,19 @@ class TestSOGA:
 
         soga.reset_environment()
         assert soga.iteration == 0
-        assert soga.population == []
+        assert soga.population is None
         assert soga.best_individual is None
 
     def test_initialise_population(self, soga):
 
         soga.initialise_population()
 
-        assert isinstance(soga.population, list)
+        assert isinstance(soga.population, Population)
         for individual in soga.population:
             assert isinstance(individual, Individual)
 
         assert len(soga.population) == soga.n_individuals
+        assert soga.population.positions.shape == (soga.n_individuals, 2)
 
     def test_update_best(self, soga, individual):
 
@@ -64,3 +69,143 @@ class TestSOGA:
 
         soga.update_best(individual)
         assert soga.best_individual.fitness == 50.0
+
+    def test_evaluate_population(self, soga):
+
+        soga.vectorized = True
+        soga.initialise_population()
+        soga.evaluate_population(soga.population, lambda x: x.sum(axis=1))
+
+        expected = soga.population.positions.sum(axis=1)
+        assert (soga.population.fitness == expected).all()
+        assert soga.n_evaluations == soga.n_individuals
+
+    @pytest.mark.parametrize('fn', [
+        lambda x: np.sum(x ** 2),
+        lambda x: sum(x ** 2)
+    ])
+    def test_evaluate_population_raise(self, soga, fn):
+
+        soga.vectorized = True
+        soga.initialise_population()
+
+        with pytest.raises(ValueError):
+            soga.evaluate_population(soga.population, fn)
+
+    def test_evaluate_pending(self, soga):
+
+        fn = lambda x: x.sum(axis=1)
+
+        soga.vectorized = True
+        soga.initialise_population()
+        soga.step_optimise(fn)
+
+        # offspring carry the fitness of their parents until evaluated.
+        soga.evaluate_pending(fn)
+        expected = soga.population.positions.sum(axis=1)
+
+        assert (soga.population.fitness == expected).all()
+        assert soga.n_evaluations == 2 * soga.n_individuals
+
+        soga.evaluate_pending(fn)
+        soga.step_optimise(fn)
+        assert soga.n_evaluations == 2 * soga.n_individuals
+
+    def test_seed(self):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        def sphere(x):
+            return (x ** 2).sum()
+
+        runs = []
+        for _ in range(2):
+            soga = SOGA(bounds, n_individuals=10, n_iterations=10, seed=42)
+            soga.optimise(sphere)
+            runs.append(soga)
+
+        assert soga.selection.rng is soga.rng
+        assert soga.mutation.rng is soga.rng
+        assert (runs[0].best_individual.fitness
+                == runs[1].best_individual.fitness)
+        assert (runs[0].population.positions
+                == runs[1].population.positions).all()
+
+    def test_bounded_optimise(self):
+
+        bounds = {
+            'x0': [-5.12, 5.12],
+            'x1': [-5.12, 5.12]
+        }
+
+        soga = SOGA(bounds, n_individuals=20, n_iterations=20, seed=0)
+        soga.optimise(rastrigin)
+
+        assert np.all(soga.population.positions >= soga.population.lb)
+        assert np.all(soga.population.positions <= soga.population.ub)
+
+    def test_instrumentation(self):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=5, seed=0)
+        soga.timer.enabled = True
+
+        events = []
+        soga.hooks.register('on_generation_start',
+                            lambda ga: events.append('start'))
+        soga.hooks.register('on_evaluated',
+                            lambda ga, p, f: events.append(len(f)))
+        soga.hooks.register('on_generation_end',
+                            lambda ga: events.append('end'))
+
+        soga.optimise(lambda x: sum(x ** 2))
+
+        summary = soga.timer.summary()
+
+        assert events[:3] == ['start', 10, 'end']
+        assert events.count('end') == soga.iteration == 6
+        assert summary['evaluation']['calls'] == 6
+        assert {'selection', 'crossover', 'mutation', 'constraints',
+                'history'} <= set(summary)
+
+    def test_update_best_population(self, soga):
+
+        soga.initialise_population()
+        soga.population.fitness[:] = np.arange(10.0, 0.0, -1.0)
+
+        feasible = np.ones(10, dtype=bool)
+        feasible[-1] = False
+
+        soga.update_best_population(soga.population, feasible)
+
+        assert soga.best_individual.fitness == 2.0
+        assert np.array_equal(soga.best_individual.position,
+                              soga.population.positions[-2])
+
+        soga.population.positions[-2] = -1.0
+        assert not np.any(soga.best_individual.position == -1.0)
+
+    @pytest.mark.parametrize('archive', [TopK(k=5), HallOfFame(k=5)])
+    def test_hall_of_fame(self, archive):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=5, seed=0)
+        soga.hall_of_fame = archive
+        soga.optimise(lambda x: sum(x ** 2))
+
+        positions, fitness = soga.hall_of_fame.best()
+
+        assert positions.shape == (5, 2)
+        assert fitness[0] == soga.best_individual.fitness
+        assert np.all(np.diff(fitness) >= 0)
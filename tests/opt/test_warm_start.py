@@ -0,0 +1,95 @@
+import pytest
+import numpy as np
+from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
+from pyga.utils.checkpoint import save_checkpoint
+from pyga.utils.hall_of_fame import HallOfFame
+
+
+@pytest.fixture
+def bounds():
+
+    return {
+        'x0': [-10.0, 10.0],
+        'x1': [-10.0, 10.0]
+    }
+
+
+class TestWarmStart:
+
+    def test_partial_seed(self, bounds):
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=10, seed=0)
+        soga.warm_start([[1.0, 2.0], [3.0, 4.0]])
+        soga.initialise_population()
+
+        assert np.array_equal(soga.population.positions[:2],
+                              [[1.0, 2.0], [3.0, 4.0]])
+        assert not np.array_equal(soga.population.positions[2],
+                                  [3.0, 4.0])
+
+    def test_best_seeded(self, bounds):
+
+        soga = SOGA(bounds, n_individuals=2, n_iterations=10, seed=0)
+        soga.warm_start(np.arange(8.0).reshape(4, 2), [4.0, 3.0, 1.0, 2.0])
+
+        assert np.array_equal(soga.warm_start_positions,
+                              [[4.0, 5.0], [6.0, 7.0]])
+        assert list(soga.warm_start_fitness) == [1.0, 2.0]
+
+    def test_known_fitness(self, bounds):
+
+        calls = []
+
+        def fn(x):
+            calls.append(x)
+            return sum(x ** 2)
+
+        ssga = SSGA(bounds, n_individuals=10, n_iterations=10, seed=0)
+        ssga.warm_start([[0.0, 0.0], [1.0, 1.0]], [0.0, np.nan])
+
+        ssga.initialise_population()
+        ssga.evaluate_initial_population(fn)
+
+        assert ssga.n_evaluations == len(calls) == 9
+        assert ssga.best_individual.fitness == 0.0
+        assert ssga.population.fitness[1] == 2.0
+
+    def test_raise(self, bounds):
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=10)
+
+        with pytest.raises(ValueError):
+            soga.warm_start([[1.0, 2.0, 3.0]])
+
+        with pytest.raises(ValueError):
+            soga.warm_start([[1.0, 2.0]], [1.0, 2.0])
+
+    def test_from_hall_of_fame(self, bounds, tmp_path):
+
+        path = str(tmp_path / 'hof.npz')
+
+        hof = HallOfFame(k=3)
+        hof.update(np.arange(6.0).reshape(3, 2), np.array([3.0, 2.0, 1.0]))
+        hof.save(path)
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=10, seed=0)
+        soga.warm_start_from(path)
+
+        assert list(soga.warm_start_fitness) == [1.0, 2.0, 3.0]
+
+    def test_from_checkpoint(self, bounds, tmp_path):
+
+        path = str(tmp_path / 'ckpt.npz')
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=3, seed=0)
+        soga.optimise(lambda x: sum(x ** 2))
+        save_checkpoint(soga, path)
+
+        other = SOGA(bounds, n_individuals=10, n_iterations=3, seed=1)
+        other.warm_start_from(path)
+        other.initialise_population()
+
+        assert other.warm_start_fitness is None
+        assert np.array_equal(other.population.positions,
+                              soga.population.positions)
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+from pyga.individual import Individual
+from pyga.population import Population
+
+
+class TestPopulation:
+
+    @pytest.fixture
+    def population(self):
+
+        bounds = {
+            'x0': [0.0, 10.0],
+            'x1': [0.0, 10.0]
+        }
+
+        return Population(bounds, 6)
+
+    def test_init(self, population):
+
+        assert population.positions.shape == (6, 2)
+        assert population.positions.dtype == np.float64
+        assert np.isnan(population.fitness).all()
+        assert np.all(population.positions >= population.lb)
+        assert np.all(population.positions <= population.ub)
+
+    def test_getitem(self, population):
+
+        individual = population[2]
+        individual.position[0] = 5.0
+        individual.fitness = 1.5
+
+        assert isinstance(individual, Individual)
+        assert population.positions[2, 0] == 5.0
+        assert population.fitness[2] == 1.5
+        assert individual.lb is population.lb
+
+    def test_setitem(self, population):
+
+        individual = population[0].copy()
+        individual.position = np.array([1.0, 2.0])
+        individual.fitness = 3.0
+
+        population[4] = individual
+
+        assert np.array_equal(population.positions[4], [1.0, 2.0])
+        assert population.fitness[4] == 3.0
+
+    def test_take(self, population):
+
+        population.fitness[:] = np.arange(6)
+        ret_pop = population.take([5, 0])
+
+        assert np.array_equal(ret_pop.fitness, [5.0, 0.0])
+        assert ret_pop.lb is population.lb
+
+        ret_pop.positions[0] = 0.0
+        assert not np.array_equal(population.positions[5], [0.0, 0.0])
+
+    def test_rank_key(self, population):
+
+        population.fitness[:] = [2.0, 1.0, np.inf, np.inf, 3.0, 0.5]
+        assert population.rank_key() is population.fitness
+
+        population.violation[2:4] = [4.0, 1.0]
+        order = np.argsort(population.rank_key(), kind='stable')
+        assert list(order) == [5, 1, 0, 4, 3, 2]
+
+        ret_pop = population.take([2, 3])
+        assert np.array_equal(ret_pop.violation, [4.0, 1.0])
@@ -28,3 +28,22 @@ class TestSingleObjective:
     def test_sphere(self):
         pos = np.array([0.0, 0.0, 0.0])
         assert fx.sphere(pos) == pytest.approx(0.0, 1e-6)
+
+    @pytest.mark.parametrize('fn, pos, optimum', [
+        (fx.ackley, [0.0, 0.0, 0.0], 0.0),
+        (fx.beale, [3.0, 0.5], 0.0),
+        (fx.booth, [1.0, 3.0], 0.0),
+        (fx.goldsteinprice, [0.0, -1.0], 3.0),
+        (fx.rastrigin, [0.0, 0.0, 0.0], 0.0),
+        (fx.sphere, [0.0, 0.0, 0.0], 0.0)
+    ])
+    def test_batch(self, fn, pos, optimum):
+        pos = np.asarray(pos)
+        other = np.full_like(pos, 0.5)
+        positions = np.stack([pos, other, pos])
+
+        ret_val = fn(positions)
+
+        assert ret_val.shape == (3,)
+        assert ret_val[0] == pytest.approx(optimum, 1e-6)
+        assert ret_val[1] == pytest.approx(fn(other), 1e-6)
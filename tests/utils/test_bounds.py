@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+from pyga.utils.bounds import *
+
+
+@pytest.fixture
+def positions():
+
+    return np.array([
+        [-2.0, 5.0],
+        [13.0, 10.0]
+    ])
+
+
+lb, ub = np.zeros(2), np.full(2, 10.0)
+
+
+@pytest.mark.parametrize('handler', [
+    ClipBoundsHandler(),
+    ReflectBoundsHandler(),
+    WrapBoundsHandler(),
+    ResampleBoundsHandler()
+])
+def test_apply(handler, positions):
+
+    bounded = handler.apply(positions, lb, ub)
+
+    assert bounded.shape == positions.shape
+    assert np.all((bounded >= lb) & (bounded <= ub))
+    assert bounded[0, 1] == 5.0
+    assert bounded[1, 1] == 10.0
+
+
+def test_clip(positions):
+
+    bounded = ClipBoundsHandler().apply(positions, lb, ub)
+    assert np.array_equal(bounded, [[0.0, 5.0], [10.0, 10.0]])
+
+
+def test_reflect(positions):
+
+    bounded = ReflectBoundsHandler().apply(positions, lb, ub)
+    assert np.array_equal(bounded, [[2.0, 5.0], [7.0, 10.0]])
+
+
+def test_wrap(positions):
+
+    bounded = WrapBoundsHandler().apply(positions, lb, ub)
+    assert np.array_equal(bounded, [[8.0, 5.0], [3.0, 10.0]])
+
+
+def test_in_bounds_unchanged():
+
+    positions = np.array([[1.0, 2.0]])
+    assert ReflectBoundsHandler().apply(positions, lb, ub) is positions
@@ -0,0 +1,68 @@
+import pytest
+import numpy as np
+from pyga.utils.cache import FitnessCache
+from pyga.opt.elite_soga import EliteSOGA
+
+
+class TestFitnessCache:
+
+    def test_init_raise(self):
+        with pytest.raises(ValueError):
+            FitnessCache(maxsize=0)
+
+    def test_get_put(self):
+
+        cache = FitnessCache()
+        assert cache.get(np.array([1.0, 2.0])) is None
+
+        cache.put(np.array([1.0, 2.0]), 5.0)
+        assert cache.get(np.array([1.0, 2.0])) == 5.0
+        assert cache.get(np.array([-0.0, 0.0])) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_decimals(self):
+
+        cache = FitnessCache(decimals=3)
+        cache.put(np.array([1.0, 2.0]), 5.0)
+
+        assert cache.get(np.array([1.0 + 1e-6, 2.0])) == 5.0
+
+    def test_eviction(self):
+
+        cache = FitnessCache(maxsize=2)
+        cache.put(np.array([0.0]), 0.0)
+        cache.put(np.array([1.0]), 1.0)
+        cache.get(np.array([0.0]))
+        cache.put(np.array([2.0]), 2.0)
+
+        assert len(cache) == 2
+        assert cache.get(np.array([1.0])) is None
+        assert cache.get(np.array([0.0])) == 0.0
+
+    def test_evaluate(self):
+
+        cache = FitnessCache()
+        cache.put(np.array([0.0, 0.0]), -1.0)
+
+        positions = np.array([[0.0, 0.0], [1.0, 2.0], [1.0, 2.0]])
+        ret_arr, n_evaluated = cache.evaluate(
+            positions, lambda x: x.sum(axis=1)
+        )
+
+        assert n_evaluated == 1
+        assert np.array_equal(ret_arr, [-1.0, 3.0, 3.0])
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_elites_not_reevaluated(self):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        ga = EliteSOGA(bounds, n_individuals=10, n_elites=4, n_iterations=2)
+        ga.cache = FitnessCache()
+        ga.optimise(lambda x: np.sum(np.square(x)))
+
+        assert ga.n_evaluations == ga.cache.misses
+        assert ga.cache.hits >= 2 * ga.n_elites
@@ -0,0 +1,73 @@
+import pytest
+from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
+from pyga.utils.callbacks import *
+
+
+@pytest.fixture
+def bounds():
+
+    return {
+        'x0': [-10.0, 10.0],
+        'x1': [-10.0, 10.0]
+    }
+
+
+class TestLambdaCallback:
+
+    def test_optimise(self, bounds):
+
+        seen = []
+
+        def on_generation_end(ga):
+            seen.append(ga.population.positions)
+            return ga.iteration == 3
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=100, seed=0)
+        soga.register_callback(LambdaCallback(
+            on_generation_end=on_generation_end
+        ))
+
+        soga.optimise(lambda x: sum(x ** 2))
+
+        assert soga.iteration == 3
+        assert soga.stop_requested
+        assert seen[-1] is soga.population.positions
+
+    def test_register_raise(self, bounds):
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=100)
+
+        with pytest.raises(TypeError):
+            soga.register_callback(lambda ga: True)
+
+
+class TestBaseCallback:
+
+    def test_optimise(self, bounds):
+
+        class Recorder(BaseCallback):
+
+            def __init__(self):
+                self.events = []
+
+            def on_optimise_start(self, ga):
+                self.events.append('start')
+
+            def on_evaluated(self, ga, positions, fitness):
+                self.events.append('evaluated')
+
+            def on_optimise_end(self, ga):
+                self.events.append('end')
+
+        ssga = SSGA(bounds, n_individuals=10, n_iterations=2, seed=0)
+
+        callback = Recorder()
+        ssga.register_callback(callback)
+        ssga.optimise(lambda x: sum(x ** 2))
+
+        # the initial population is evaluated before the start, then the
+        # children of three generations.
+        assert callback.events == (['evaluated', 'start']
+                                   + ['evaluated'] * 3 + ['end'])
+        assert not ssga.stop_requested
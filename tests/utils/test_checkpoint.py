@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
+from pyga.utils.checkpoint import *
+from pyga.utils.hall_of_fame import TopK, HallOfFame
+from pyga.utils.functions.single_objective import sphere
+
+
+@pytest.fixture
+def bounds():
+
+    return {
+        'x0': [-10.0, 10.0],
+        'x1': [-10.0, 10.0]
+    }
+
+
+class TestCheckpoint:
+
+    def test_save_load(self, bounds, tmp_path):
+
+        path = str(tmp_path / 'ckpt.npz')
+
+        ga = SOGA(bounds, n_individuals=10, n_iterations=3, seed=0)
+        ga.optimise(sphere)
+        save_checkpoint(ga, path)
+
+        other = SOGA(bounds, n_individuals=10, n_iterations=3)
+        other.initialise_population()
+        load_checkpoint(other, path)
+
+        assert other.iteration == ga.iteration
+        assert other.n_evaluations == ga.n_evaluations
+        assert np.array_equal(other.population.positions,
+                              ga.population.positions)
+        assert other.best_individual.fitness == ga.best_individual.fitness
+        assert other.history.arr_best_fitness == ga.history.arr_best_fitness
+        assert other.rng.random() == ga.rng.random()
+        assert other.selection.rng is other.rng
+
+    def test_load_raise(self, bounds, tmp_path):
+
+        path = str(tmp_path / 'ckpt.npz')
+
+        ga = SOGA(bounds, n_individuals=10, n_iterations=3)
+        ga.optimise(sphere)
+        save_checkpoint(ga, path)
+
+        other = SOGA({'x0': [0.0, 1.0]}, n_individuals=10, n_iterations=3)
+        other.initialise_population()
+
+        with pytest.raises(ValueError):
+            load_checkpoint(other, path)
+
+    @pytest.mark.parametrize('cls', [SOGA, SSGA])
+    def test_resume(self, bounds, tmp_path, cls):
+
+        path = str(tmp_path / 'ckpt.npz')
+
+        full = cls(bounds, n_individuals=10, n_iterations=10, seed=1)
+        full.optimise(sphere)
+
+        partial = cls(bounds, n_individuals=10, n_iterations=4, seed=1)
+        partial.checkpoint_path = path
+        partial.checkpoint_interval = 5
+        partial.optimise(sphere)
+
+        resumed = cls(bounds, n_individuals=10, n_iterations=10)
+        resumed.optimise(sphere, resume_from=path)
+
+        assert np.array_equal(resumed.population.positions,
+                              full.population.positions)
+        assert (resumed.history.arr_best_fitness
+                == full.history.arr_best_fitness)
+        assert resumed.n_evaluations == full.n_evaluations
+
+    @pytest.mark.parametrize('archive', [TopK, HallOfFame])
+    def test_resume_hall_of_fame(self, bounds, tmp_path, archive):
+
+        path = str(tmp_path / 'ckpt.npz')
+
+        full = SOGA(bounds, n_individuals=10, n_iterations=10, seed=1)
+        full.hall_of_fame = archive(k=50)
+        full.optimise(sphere)
+
+        partial = SOGA(bounds, n_individuals=10, n_iterations=4, seed=1)
+        partial.hall_of_fame = archive(k=50)
+        partial.checkpoint_path = path
+        partial.checkpoint_interval = 5
+        partial.optimise(sphere)
+
+        resumed = SOGA(bounds, n_individuals=10, n_iterations=10)
+        resumed.hall_of_fame = archive(k=50)
+        resumed.optimise(sphere, resume_from=path)
+
+        positions, fitness = resumed.hall_of_fame.best()
+        expected_positions, expected_fitness = full.hall_of_fame.best()
+
+        assert np.array_equal(positions, expected_positions)
+        assert np.array_equal(fitness, expected_fitness)
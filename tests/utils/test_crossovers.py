@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from pyga.individual import Individual
 from pyga.utils.crossovers import *
 
@@ -25,6 +26,25 @@ def parent_b():
     return Individual(bounds)
 
 
+@pytest.fixture
+def parents():
+
+    parents_a = np.random.uniform(0.0, 10.0, size=(6, 8))
+    parents_b = np.random.uniform(0.0, 10.0, size=(6, 8))
+
+    return parents_a, parents_b
+
+
+def assert_genes_swapped(parents, children):
+
+    parents_a, parents_b = parents
+    children_a, children_b = children
+
+    assert children_a.shape == parents_a.shape
+    assert np.all((children_a == parents_a) | (children_a == parents_b))
+    assert np.array_equal(children_a + children_b, parents_a + parents_b)
+
+
 class TestOnePointCrossover:
 
     def test_cross(self, parent_a, parent_b):
@@ -40,6 +60,17 @@ class TestOnePointCrossover:
         assert isinstance(ret_b, Individual)
 
 
+    def test_cross_batch(self, parents):
+
+        crossover = OnePointCrossover()
+        children = crossover.cross_batch(*parents)
+
+        assert_genes_swapped(parents, children)
+
+        swapped = children[0] != parents[0]
+        assert np.all(np.diff(swapped.astype(int), axis=1) >= 0)
+
+
 class TestTwoPointCrossover:
 
     def test_cross(self, parent_a, parent_b):
@@ -55,6 +86,15 @@ class TestTwoPointCrossover:
         assert isinstance(ret_b, Individual)
 
 
+    def test_cross_batch(self, parents):
+
+        crossover = TwoPointCrossover()
+        children = crossover.cross_batch(*parents)
+
+        assert_genes_swapped(parents, children)
+        assert np.all(children[0][:, 0] == parents[0][:, 0])
+
+
 class TestUniformCrossover:
 
     @pytest.mark.parametrize('p_swap', [0.1, None, 0.7])
@@ -76,6 +116,15 @@ class TestUniformCrossover:
             assert isinstance(ret_b, Individual)
 
 
+    @pytest.mark.parametrize('p_swap', [0.1, None, 0.5])
+    def test_cross_batch(self, parents, p_swap):
+
+        crossover = UniformCrossover(p_swap=p_swap)
+        children = crossover.cross_batch(*parents)
+
+        assert_genes_swapped(parents, children)
+
+
 class TestKVectorUniformCrossover:
 
     def test_cross(self):
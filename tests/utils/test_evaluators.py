@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+from pyga.utils.evaluators import *
+
+
+def noisy_sphere(position):
+    return np.sum(np.square(position)) + np.random.uniform()
+
+
+@pytest.fixture
+def positions():
+    return np.random.uniform(-5.0, 5.0, size=(9, 3))
+
+
+class TestSerialEvaluator:
+
+    def test_evaluate(self, positions):
+
+        evaluator = SerialEvaluator()
+        ret_arr = evaluator.evaluate(np.sum, positions)
+
+        assert ret_arr.shape == (9,)
+        assert np.allclose(ret_arr, positions.sum(axis=1))
+
+
+class TestThreadPoolEvaluator:
+
+    def test_init_raise(self):
+        with pytest.raises(ValueError):
+            ThreadPoolEvaluator(chunksize=0)
+
+    @pytest.mark.parametrize('chunksize', [1, 2, 20])
+    def test_evaluate(self, positions, chunksize):
+
+        with ThreadPoolEvaluator(max_workers=2, chunksize=chunksize) as ev:
+            ret_arr = ev.evaluate(np.sum, positions)
+
+        assert np.allclose(ret_arr, positions.sum(axis=1))
+        assert ev.executor is None
+
+
+class TestProcessPoolEvaluator:
+
+    def test_evaluate(self, positions):
+
+        with ProcessPoolEvaluator(max_workers=2, chunksize=2, seed=7) as ev:
+            ret_a = ev.evaluate(noisy_sphere, positions)
+
+        with ProcessPoolEvaluator(max_workers=3, chunksize=2, seed=7) as ev:
+            ret_b = ev.evaluate(noisy_sphere, positions)
+
+        noise = ret_a - np.sum(np.square(positions), axis=1)
+
+        assert np.array_equal(ret_a, ret_b)
+        assert np.all((noise >= 0.0) & (noise < 1.0))
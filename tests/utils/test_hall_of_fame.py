@@ -0,0 +1,156 @@
+import pytest
+import numpy as np
+from pyga.population import Population
+from pyga.opt.elite_soga import EliteSOGA
+from pyga.utils.functions.single_objective import sphere
+from pyga.utils.hall_of_fame import *
+
+
+class TestTopK:
+
+    def test_update(self):
+
+        top_k = TopK(k=3)
+
+        positions = np.arange(10.0).reshape(5, 2)
+        top_k.update(positions, np.array([5.0, 1.0, 4.0, 2.0, 3.0]))
+
+        assert top_k.worst_fitness == 3.0
+
+        top_k.update(positions[:1] + 100, np.array([0.5]))
+        positions, fitness = top_k.best()
+
+        assert list(fitness) == [0.5, 1.0, 2.0]
+        assert np.array_equal(positions[0], [100.0, 101.0])
+        assert np.array_equal(positions[1], [2.0, 3.0])
+
+    def test_push(self):
+
+        top_k = TopK(k=1)
+
+        assert top_k.push(np.zeros(2), 1.0)
+        assert not top_k.push(np.ones(2), 1.0)
+        assert top_k.push(np.ones(2), 0.0)
+        assert len(top_k) == 1
+
+        top_k.clear()
+        assert top_k.worst_fitness == np.inf
+
+    def test_push_repeated(self):
+
+        top_k = TopK(k=2)
+
+        assert top_k.push(np.zeros(2), 1.0)
+        assert not top_k.push(np.zeros(2), 0.5)
+        assert top_k.push(np.ones(2), 2.0)
+
+        # an evicted position may be recorded again.
+        assert top_k.push(np.full(2, 2.0), 0.0)
+        assert top_k.push(np.ones(2), 0.5)
+        assert list(top_k.best()[1]) == [0.0, 0.5]
+
+    def test_optimise(self):
+
+        bounds = {'x0': [-10.0, 10.0], 'x1': [-10.0, 10.0]}
+
+        ga = EliteSOGA(bounds, n_individuals=10, n_elites=4,
+                       n_iterations=50, seed=0)
+        ga.hall_of_fame = TopK(k=10)
+        ga.optimise(sphere)
+
+        # elites are evaluated every generation but recorded once.
+        positions, fitness = ga.hall_of_fame.best()
+        assert len(np.unique(positions, axis=0)) == len(positions) == 10
+
+    def test_init_raise(self):
+
+        with pytest.raises(ValueError):
+            TopK(k=0)
+
+
+class TestHallOfFame:
+
+    def test_push_duplicates(self):
+
+        hof = HallOfFame(k=3, tolerance=0.1)
+
+        assert hof.push(np.array([1.0, 1.0]), 2.0)
+        assert not hof.push(np.array([1.05, 0.95]), 3.0)
+        assert hof.push(np.array([0.95, 1.05]), 1.0)
+
+        positions, fitness = hof.best()
+
+        assert len(hof) == 1
+        assert list(fitness) == [1.0]
+        assert np.array_equal(positions[0], [0.95, 1.05])
+
+    def test_update(self):
+
+        hof = HallOfFame(k=3, tolerance=0.1)
+
+        positions = np.array([
+            [0.0, 0.0],
+            [0.01, 0.0],
+            [1.0, 1.0],
+            [2.0, 2.0],
+            [3.0, 3.0]
+        ])
+
+        hof.update(positions, np.array([5.0, 1.0, 2.0, 3.0, 4.0]))
+        positions, fitness = hof.best()
+
+        assert list(fitness) == [1.0, 2.0, 3.0]
+        assert np.array_equal(positions[0], [0.01, 0.0])
+        assert hof.worst_fitness == 3.0
+
+        hof.update(np.array([[5.0, 5.0]]), np.array([0.0]))
+        assert list(hof.best()[1]) == [0.0, 1.0, 2.0]
+
+    def test_save_load(self, tmp_path):
+
+        hof = HallOfFame(k=4, tolerance=0.5)
+        hof.update(np.arange(8.0).reshape(4, 2), np.arange(4.0))
+
+        path = str(tmp_path / 'hof.npz')
+        hof.save(path)
+
+        other = HallOfFame.load(path)
+
+        assert other.k == 4 and other.tolerance == 0.5
+        assert np.array_equal(other.best()[0], hof.best()[0])
+
+    def test_state_dict(self):
+
+        hall_of_fame = HallOfFame(k=3, tolerance=0.1)
+        hall_of_fame.update(np.array([[0.0], [1.0], [2.0]]),
+                            np.array([3.0, 1.0, 2.0]))
+
+        other = HallOfFame(k=3, tolerance=0.1)
+        other.load_state_dict(hall_of_fame.state_dict())
+
+        assert np.array_equal(other.best()[1], [1.0, 2.0, 3.0])
+        assert np.array_equal(other.best()[0], hall_of_fame.best()[0])
+
+    def test_seed(self):
+
+        hof = HallOfFame(k=4)
+        hof.update(np.arange(8.0).reshape(4, 2), np.arange(4.0))
+
+        population = Population({'x0': [0.0, 10.0], 'x1': [0.0, 10.0]}, 6)
+
+        assert hof.seed(population) == 4
+        assert np.array_equal(population.positions[:4], hof.best()[0])
+        assert list(population.fitness[:4]) == [0.0, 1.0, 2.0, 3.0]
+
+    def test_high_dimensional(self):
+
+        rng = np.random.default_rng(0)
+        hof = HallOfFame(k=50, tolerance=1e-3)
+
+        positions = rng.uniform(size=(500, 100))
+        fitness = rng.uniform(size=500)
+
+        hof.update(positions, fitness)
+
+        assert len(hof) == 50
+        assert np.array_equal(hof.best()[1], np.sort(fitness)[:50])
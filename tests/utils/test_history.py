@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from pyga.utils.history import *
 from pyga.opt.soga import SOGA
 from pyga.individual import Individual
@@ -36,3 +37,161 @@ class TestGeneralHistory:
         assert len(hist.arr_best_fitness) == len(hist.arr_mean_fitness) == 1
         assert hist.arr_best_fitness[0] == 0.5
         assert hist.arr_mean_fitness[0] == 5.0
+
+
+class TestColumnarHistory:
+
+    @pytest.fixture
+    def soga(self):
+
+        bounds = {
+            'x0': [0.0, 10.0],
+            'x1': [0.0, 10.0]
+        }
+
+        soga = SOGA(bounds, n_individuals=30, n_iterations=100)
+        soga.initialise_population()
+
+        soga.best_individual = Individual(bounds)
+        soga.best_individual.fitness = 0.5
+
+        soga.population.fitness[:] = 5.0
+
+        return soga
+
+    def test_write_history(self, soga):
+
+        hist = ColumnarHistory(soga, capacity=1)
+
+        for _ in range(3):
+            hist.write_history()
+
+        assert len(hist) == 3
+        assert list(hist.arr_best_fitness) == [0.5] * 3
+        assert list(hist.arr_mean_fitness) == [5.0] * 3
+        assert hist.data['std_fitness'][0] == 0.0
+
+    @pytest.mark.parametrize('name', ['hist.csv', 'hist.bin'])
+    def test_stream(self, soga, tmp_path, name):
+
+        path = str(tmp_path / name)
+        hist = ColumnarHistory(soga, stream=path, buffer_size=2)
+
+        for idx in range(5):
+            soga.iteration = idx
+            hist.write_history()
+
+        assert hist.n_flushed == 4
+        hist.flush()
+
+        data = ColumnarHistory.read(path)
+
+        assert len(data) == len(hist) == 5
+        assert list(data['iteration']) == list(range(5))
+        assert list(data['best_fitness']) == [0.5] * 5
+
+    def test_state_dict(self, soga):
+
+        hist = ColumnarHistory(soga)
+        hist.write_history()
+
+        other = ColumnarHistory(soga)
+        other.load_state_dict(hist.state_dict())
+
+        assert list(other.data) == list(hist.data)
+
+    @pytest.mark.parametrize('name', ['hist.csv', 'hist.bin'])
+    def test_resume(self, tmp_path, name):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        fn = lambda x: sum(x ** 2)
+        ckpt_path = str(tmp_path / 'ckpt.npz')
+
+        full = SOGA(bounds, n_individuals=10, n_iterations=11, seed=0)
+        full.history = ColumnarHistory(full, stream=str(tmp_path / name),
+                                       buffer_size=2)
+        full.optimise(fn)
+        expected = ColumnarHistory.read(str(tmp_path / name))
+
+        # the partial run streams rows beyond the checkpoint.
+        partial = SOGA(bounds, n_individuals=10, n_iterations=7, seed=0)
+        partial.history = ColumnarHistory(partial, stream=str(tmp_path / name),
+                                          buffer_size=2)
+        partial.checkpoint_path = ckpt_path
+        partial.checkpoint_interval = 5
+        partial.optimise(fn)
+
+        resumed = SOGA(bounds, n_individuals=10, n_iterations=11)
+        resumed.history = ColumnarHistory(resumed,
+                                          stream=str(tmp_path / name),
+                                          buffer_size=2)
+        resumed.optimise(fn, resume_from=ckpt_path)
+
+        data = ColumnarHistory.read(str(tmp_path / name))
+
+        assert list(data['iteration']) == list(range(12))
+        assert list(data['iteration']) == list(expected['iteration'])
+        assert np.array_equal(data['best_fitness'], expected['best_fitness'])
+
+
+class TestTrajectoryHistory:
+
+    def test_optimise(self, tmp_path):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        path = str(tmp_path / 'trajectory')
+
+        soga = SOGA(bounds, n_individuals=10, n_iterations=4, seed=0)
+        soga.history = TrajectoryHistory(soga, path, n_generations=2)
+        soga.optimise(lambda x: sum(x ** 2))
+
+        positions, fitness = TrajectoryHistory.read(path)
+
+        assert positions.shape == (5, 10, 2)
+        assert fitness.shape == (5, 10)
+
+        # each generation is recorded once it has been evaluated.
+        assert np.allclose(fitness, (positions ** 2).sum(axis=2))
+
+    def test_resume(self, tmp_path):
+
+        bounds = {
+            'x0': [-10.0, 10.0],
+            'x1': [-10.0, 10.0]
+        }
+
+        fn = lambda x: sum(x ** 2)
+        ckpt_path = str(tmp_path / 'ckpt.npz')
+
+        full = SOGA(bounds, n_individuals=10, n_iterations=11, seed=0)
+        full.history = TrajectoryHistory(full, str(tmp_path / 'full'))
+        full.optimise(fn)
+
+        path = str(tmp_path / 'trajectory')
+
+        partial = SOGA(bounds, n_individuals=10, n_iterations=7, seed=0)
+        partial.history = TrajectoryHistory(partial, path, n_generations=2)
+        partial.checkpoint_path = ckpt_path
+        partial.checkpoint_interval = 5
+        partial.optimise(fn)
+
+        resumed = SOGA(bounds, n_individuals=10, n_iterations=11)
+        resumed.history = TrajectoryHistory(resumed, path, n_generations=2)
+        resumed.optimise(fn, resume_from=ckpt_path)
+
+        positions, fitness = TrajectoryHistory.read(path)
+        expected_positions, expected_fitness = TrajectoryHistory.read(
+            str(tmp_path / 'full')
+        )
+
+        assert fitness.shape == (12, 10)
+        assert np.array_equal(positions, expected_positions)
+        assert np.array_equal(fitness, expected_fitness)
@@ -0,0 +1,42 @@
+import pytest
+from pyga.utils.hooks import *
+
+
+class TestHookRegistry:
+
+    def test_register_fire(self):
+
+        calls = []
+        registry = HookRegistry()
+
+        def hook(*args):
+            calls.append(args)
+
+        registry.register('on_generation_end', hook)
+        registry.fire('on_generation_end', 1)
+        registry.fire('on_generation_start', 2)
+
+        assert calls == [(1,)]
+
+        registry.remove('on_generation_end', hook)
+        registry.fire('on_generation_end', 1)
+
+        assert calls == [(1,)]
+
+    def test_fire_stop(self):
+
+        registry = HookRegistry()
+        registry.register('on_generation_end', lambda ga: None)
+
+        assert not registry.fire('on_generation_end', None)
+
+        registry.register('on_generation_end', lambda ga: ga > 1)
+        registry.register('on_generation_end', lambda ga: False)
+
+        assert not registry.fire('on_generation_end', 1)
+        assert registry.fire('on_generation_end', 2)
+
+    def test_register_raise(self):
+
+        with pytest.raises(ValueError):
+            HookRegistry().register('on_nothing', print)
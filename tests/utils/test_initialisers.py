@@ -0,0 +1,131 @@
+import sys
+import pytest
+import numpy as np
+from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
+from pyga.opt.elite_soga import EliteSOGA
+from pyga.utils.initialisers import *
+
+
+lb, ub = np.array([-5.0, 0.0, 10.0]), np.array([5.0, 1.0, 20.0])
+
+
+def make_initialiser(cls, seed=0):
+
+    initialiser = cls()
+    initialiser.rng = np.random.default_rng(seed)
+
+    return initialiser
+
+
+@pytest.mark.parametrize('cls', [
+    UniformInitialiser,
+    LatinHypercubeInitialiser,
+    HaltonInitialiser,
+    OppositionInitialiser
+])
+def test_initialise(cls):
+
+    positions = make_initialiser(cls).initialise(11, lb, ub)
+
+    assert positions.shape == (11, 3)
+    assert np.all((positions >= lb) & (positions <= ub))
+
+    # seeded initialisers are reproducible.
+    other = make_initialiser(cls).initialise(11, lb, ub)
+    assert np.array_equal(positions, other)
+
+
+@pytest.mark.parametrize('cls', [
+    LatinHypercubeInitialiser,
+    HaltonInitialiser,
+    OppositionInitialiser
+])
+@pytest.mark.parametrize('n_dims', [1, 2])
+def test_initialise_low_dimensional(cls, n_dims):
+
+    positions = make_initialiser(cls).initialise(
+        8, lb[:n_dims], ub[:n_dims]
+    )
+
+    assert positions.shape == (8, n_dims)
+    assert np.all((positions >= lb[:n_dims]) & (positions <= ub[:n_dims]))
+
+
+def test_latin_hypercube_strata():
+
+    n = 20
+    positions = make_initialiser(LatinHypercubeInitialiser).initialise(
+        n, lb, ub
+    )
+
+    strata = np.floor((positions - lb) / (ub - lb) * n).astype(int)
+    for column in strata.T:
+        assert np.array_equal(np.sort(column), np.arange(n))
+
+
+def test_halton():
+
+    initialiser = HaltonInitialiser(scramble=False)
+    points = initialiser._sample(4, 2)
+
+    expected = np.array([
+        [1 / 2, 1 / 3],
+        [1 / 4, 2 / 3],
+        [3 / 4, 1 / 9],
+        [1 / 8, 4 / 9]
+    ])
+
+    assert np.allclose(points, expected)
+    assert np.array_equal(HaltonInitialiser._primes(1), [2])
+    assert np.array_equal(HaltonInitialiser._primes(2), [2, 3])
+    assert np.array_equal(HaltonInitialiser._primes(6), [2, 3, 5, 7, 11, 13])
+    assert HaltonInitialiser._primes(1000)[-1] == 7919
+
+
+def test_opposition():
+
+    positions = make_initialiser(OppositionInitialiser).initialise(
+        7, lb, ub
+    )
+
+    assert np.allclose(positions[4:], lb + ub - positions[:3])
+
+
+def test_sobol():
+
+    pytest.importorskip('scipy.stats.qmc')
+
+    positions = make_initialiser(SobolInitialiser).initialise(16, lb, ub)
+
+    assert positions.shape == (16, 3)
+    assert np.all((positions >= lb) & (positions <= ub))
+
+
+def test_sobol_missing_scipy(monkeypatch):
+
+    # a None entry makes the import fail as if scipy were not installed.
+    monkeypatch.setitem(sys.modules, 'scipy.stats.qmc', None)
+
+    with pytest.raises(ImportError, match='PyGAopt\\[sobol\\]'):
+        SobolInitialiser()
+
+
+@pytest.mark.parametrize('cls, kwargs', [
+    (SOGA, {}),
+    (EliteSOGA, {'n_elites': 2}),
+    (SSGA, {})
+])
+def test_optimiser(cls, kwargs):
+
+    bounds = {'x0': [-5.0, 5.0], 'x1': [0.0, 1.0]}
+
+    ga = cls(bounds, n_individuals=10, n_iterations=1, seed=0, **kwargs)
+    ga.initialiser = LatinHypercubeInitialiser()
+
+    ga.bind_rng()
+    ga.initialise_population()
+
+    strata = np.floor(ga.population.positions[:, 0] + 5.0).astype(int)
+    assert np.array_equal(np.sort(strata), np.arange(10))
+    assert ga.initialiser.rng is ga.rng
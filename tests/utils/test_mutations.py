@@ -2,7 +2,7 @@ import pytest
 import numpy as np
 
 from pyga.individual import Individual
-from pyga.utils.mutations import RandomMutation
+from pyga.utils.mutations import *
 
 
 class TestRandomMutation:
@@ -28,3 +28,67 @@ class TestRandomMutation:
         assert all(ret_ind.position >= 9.0)
         assert all(ret_ind.position <= 11.0)
         assert not np.array_equal(np.array([10.0, 10.0]), ret_ind.position)
+
+    def test_mutate_batch(self):
+
+        positions = np.full((4, 3), 10.0)
+        mutation = RandomMutation()
+        ret_arr = mutation.mutate_batch(positions, None, None)
+
+        assert ret_arr.shape == (4, 3)
+        assert np.all((ret_arr >= 9.0) & (ret_arr <= 11.0))
+        assert np.all(ret_arr == ret_arr[:, [0]])
+
+
+@pytest.fixture
+def bounds():
+    return np.array([0.0, -1.0, 10.0]), np.array([1.0, 1.0, 20.0])
+
+
+@pytest.mark.parametrize('mutation', [
+    GaussianMutation(sigma=0.5, p_gene=1.0),
+    PolynomialMutation(eta=5.0, p_gene=1.0),
+    UniformResetMutation(p_gene=1.0)
+])
+def test_mutate_batch_in_bounds(mutation, bounds):
+
+    lb, ub = bounds
+    positions = np.random.uniform(lb, ub, size=(200, 3))
+    ret_arr = mutation.mutate_batch(positions, lb, ub)
+
+    assert ret_arr.shape == positions.shape
+    assert np.all((ret_arr >= lb) & (ret_arr <= ub))
+    assert np.all(ret_arr != positions)
+
+
+@pytest.mark.parametrize('mutation', [
+    GaussianMutation(), PolynomialMutation(), UniformResetMutation()
+])
+def test_mutate(mutation):
+
+    individual = Individual({'x0': [0.0, 20.0], 'x1': [0.0, 20.0]})
+    individual.position = np.array([10.0, 10.0])
+
+    ret_ind = mutation.mutate(individual)
+
+    assert ret_ind is individual
+    assert np.all((ret_ind.position >= 0.0) & (ret_ind.position <= 20.0))
+
+
+@pytest.mark.parametrize('cls, kwargs', [
+    (GaussianMutation, {'sigma': 0.0}),
+    (PolynomialMutation, {'eta': -1.0}),
+    (UniformResetMutation, {'p_gene': 1.5})
+])
+def test_init_raise(cls, kwargs):
+    with pytest.raises(ValueError):
+        cls(**kwargs)
+
+
+def test_p_gene():
+
+    positions = np.full((1000, 10), 0.5)
+    mutation = UniformResetMutation(p_gene=0.2)
+    ret_arr = mutation.mutate_batch(positions, np.zeros(10), np.ones(10))
+
+    assert np.mean(ret_arr != positions) == pytest.approx(0.2, abs=0.02)
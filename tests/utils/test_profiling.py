@@ -0,0 +1,43 @@
+import json
+from pyga.utils.profiling import *
+
+
+class TestPhaseTimer:
+
+    def test_disabled(self):
+
+        timer = PhaseTimer()
+
+        with timer.phase('evaluation'):
+            pass
+
+        assert timer.summary() == {}
+
+    def test_phase(self):
+
+        timer = PhaseTimer(enabled=True)
+
+        for _ in range(2):
+            with timer.phase('evaluation'):
+                pass
+
+        timer.add('selection', 1.0)
+        summary = timer.summary()
+
+        assert summary['evaluation']['calls'] == 2
+        assert summary['selection']['mean'] == 1.0
+        assert 0.0 < summary['selection']['fraction'] <= 1.0
+
+        timer.reset()
+        assert timer.summary() == {}
+
+    def test_export(self, tmp_path):
+
+        timer = PhaseTimer(enabled=True)
+        timer.add('selection', 0.5)
+
+        path = str(tmp_path / 'timings.json')
+        timer.export(path)
+
+        with open(path) as f:
+            assert json.load(f)['selection']['total'] == 0.5
@@ -1,4 +1,5 @@
 import pytest
+import numpy as np
 from pyga.individual import Individual
 from pyga.utils.recombinations import *
 
@@ -31,16 +32,6 @@ class TestBaseRecombination:
         with pytest.raises(ValueError):
             recombination = BaseRecombination(p=-0.25)
 
-    @pytest.mark.parametrize('pos', [[25.0, 25.0], [75.0, 25.0], [75.0, 75.0]])
-    def test__in_bounds(self, pos):
-        lb, ub = [0.0, 0.0], [50.0, 50.0]
-        recombination = BaseRecombination(p=0.25)
-
-        if pos == [25.0, 25.0]:
-            assert recombination._in_bounds(pos, lb, ub)
-        else:
-            assert not recombination._in_bounds(pos, lb, ub)
-
 
 class TestLineRecombination:
 
@@ -56,9 +47,26 @@ class TestLineRecombination:
 class TestIntermediateRecombination:
 
     def test_cross(self, parent_a, parent_b):
-        recombination = LineRecombination()
+        recombination = IntermediateRecombination()
         ret_a, ret_b = recombination.cross(parent_a, parent_b)
 
         assert isinstance(recombination, (BaseRecombination, BaseCrossover))
         assert isinstance(ret_a, Individual)
         assert isinstance(ret_b, Individual)
+
+
+@pytest.mark.parametrize('recombination', [
+    LineRecombination(p=0.5), IntermediateRecombination(p=0.5)
+])
+def test_cross_batch(recombination):
+
+    lb, ub = np.zeros(3), np.array([1.0, 10.0, 100.0])
+    parents_a = np.random.uniform(lb, ub, size=(20, 3))
+    parents_b = np.random.uniform(lb, ub, size=(20, 3))
+
+    ret_a, ret_b = recombination.cross_batch(parents_a, parents_b, lb, ub)
+
+    assert ret_a.shape == ret_b.shape == (20, 3)
+    assert np.all((ret_a >= lb) & (ret_a <= ub))
+    assert np.all((ret_b >= lb) & (ret_b <= ub))
+    assert not np.array_equal(ret_a, parents_a)
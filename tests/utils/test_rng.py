@@ -0,0 +1,37 @@
+import numpy as np
+from pyga.utils.rng import *
+
+
+class TestRNG:
+
+    def test_check_rng(self):
+
+        rng = np.random.default_rng(0)
+
+        assert check_rng(rng) is rng
+        assert isinstance(check_rng(None), np.random.Generator)
+        assert check_rng(5).random() == check_rng(5).random()
+
+    def test_get_rng(self):
+
+        rng = np.random.default_rng(0)
+
+        assert get_rng(rng) is rng
+        assert get_rng(None) is get_rng(None)
+
+    def test_spawn_seeds(self):
+
+        seeds = spawn_seeds(check_rng(1), 3)
+        draws = [np.random.default_rng(s).random() for s in seeds]
+
+        assert len(set(draws)) == 3
+        assert draws == [np.random.default_rng(s).random()
+                         for s in spawn_seeds(check_rng(1), 3)]
+
+    def test_spawn_seeds_advances(self):
+
+        rng = check_rng(1)
+        first, second = spawn_seeds(rng, 1), spawn_seeds(rng, 1)
+
+        assert (np.random.default_rng(first[0]).random()
+                != np.random.default_rng(second[0]).random())
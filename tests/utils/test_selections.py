@@ -1,22 +1,20 @@
 import pytest
+import numpy as np
 from pyga.individual import Individual
+from pyga.population import Population
 from pyga.utils.selections import *
 
 
 @pytest.fixture
 def population():
 
-    population = []
-    for i in range(1, 5 + 1):
+    bounds = {
+        'x0': [0.0, 10.0],
+        'x1': [0.0, 10.0]
+    }
 
-        bounds = {
-            'x0': [0.0, 10.0],
-            'x1': [0.0, 10.0]
-        }
-
-        _ind = Individual(bounds)
-        _ind.fitness = i
-        population.append(_ind)
+    population = Population(bounds, 5)
+    population.fitness[:] = np.arange(1, 5 + 1)
 
     return population
 
@@ -31,6 +29,15 @@ class TestRandomSelection:
 
         assert isinstance(ret_ind, Individual)
 
+    def test_select_many(self, population):
+
+        selection = RandomSelection()
+        selection.preprocess(population)
+        ret_arr = selection.select_many(population, 7)
+
+        assert ret_arr.shape == (7,)
+        assert np.all((ret_arr >= 0) & (ret_arr < len(population)))
+
 
 class TestTournamentSelection:
 
@@ -47,6 +54,13 @@ class TestTournamentSelection:
 
             assert isinstance(ret_int, Individual)
 
+    def test_select_index(self, population):
+
+        selection = TournamentSelection(t_size=50)
+        selection.preprocess(population)
+
+        assert selection.select_index(population) == 0
+
 
 class TestFitnessProportionateSelection:
 
@@ -57,7 +71,7 @@ class TestFitnessProportionateSelection:
         selection.preprocess(population)
 
         assert selection.cdf[-1] == pytest.approx(cdf_sum, 1e-6)
-        assert isinstance(selection.cdf, list)
+        assert isinstance(selection.cdf, np.ndarray)
 
     def test_select(self, population):
 
@@ -67,6 +81,16 @@ class TestFitnessProportionateSelection:
 
         assert isinstance(ret_ind, Individual)
 
+    def test_select_many(self, population):
+
+        selection = FitnessProportionateSelection()
+        selection.preprocess(population)
+        ret_arr = selection.select_many(population, 20_000)
+
+        counts = np.bincount(ret_arr, minlength=len(population))
+        assert ret_arr.shape == (20_000,)
+        assert np.all(np.diff(counts) < 0)
+
 
 class TestStochasticUniversalSamplingSelection:
 
@@ -77,10 +101,8 @@ class TestStochasticUniversalSamplingSelection:
         selection.preprocess(population)
 
         assert selection.cdf[-1] == pytest.approx(cdf_sum, 1e-6)
-        assert isinstance(selection.cdf, list)
-        assert isinstance(selection.population, list)
-        for ind in selection.population:
-            assert isinstance(ind, Individual)
+        assert isinstance(selection.cdf, np.ndarray)
+        assert sorted(selection.indices) == list(range(len(population)))
 
     def test_select(self, population):
 
@@ -90,16 +112,30 @@ class TestStochasticUniversalSamplingSelection:
 
         assert isinstance(ret_ind, Individual)
 
-    def test__shuffle(self, population):
-
-        pre_set = set([i.fitness for i in population])
+    def test_select_many(self, population):
 
         selection = StochasticUniversalSamplingSelection()
-        ret_pop = selection._shuffle(population)
+        selection.preprocess(population)
+        ret_arr = selection.select_many(population, 50)
+
+        # fitness 1 has 1 / sum(1 / f) = 0.438 of the selection probability.
+        counts = np.bincount(ret_arr, minlength=len(population))
+        assert counts[0] in (21, 22, 23)
+        assert counts[0] == counts.max()
 
-        post_set = set([i.fitness for i in ret_pop])
 
-        assert pre_set == post_set
-        assert isinstance(ret_pop, list)
-        for ind in ret_pop:
-            assert isinstance(ind, Individual)
+class TestTruncationSelection:
+
+    @pytest.mark.parametrize('proportion', [0.0, 1.5])
+    def test_init_raise(self, proportion):
+        with pytest.raises(ValueError):
+            TruncationSelection(proportion=proportion)
+
+    def test_select_many(self, population):
+
+        selection = TruncationSelection(proportion=0.4)
+        selection.preprocess(population)
+        ret_arr = selection.select_many(population, 20)
+
+        assert set(ret_arr) <= {0, 1}
+        assert isinstance(selection.select(population), Individual)
@@ -1,6 +1,8 @@
 import pytest
 import time
+import numpy as np
 from pyga.opt.soga import SOGA
+from pyga.opt.ssga import SSGA
 from pyga.individual import Individual
 from pyga.utils.termination_manager import *
 
@@ -43,11 +45,30 @@ class TestEvaluationTerminationManager:
 
     def test_termination_check(self, ga):
 
-        ga.iteration = 11
         tm = EvaluationTerminationManager(ga, n_evaluations=100)
-        ret_bool = tm.termination_check()
 
-        assert ret_bool
+        ga.n_evaluations = 99
+        assert not tm.termination_check()
+
+        ga.n_evaluations = 100
+        assert tm.termination_check()
+
+    @pytest.mark.parametrize('cls', [SOGA, SSGA])
+    def test_optimise(self, cls):
+
+        bounds = {
+            'x0': [0.0, 10.0],
+            'x1': [0.0, 10.0]
+        }
+
+        ga = cls(bounds, n_individuals=10, n_iterations=1_000, seed=0)
+        ga.termination_manager = EvaluationTerminationManager(ga, 25)
+
+        calls = []
+        ga.optimise(lambda x: calls.append(x) or sum(x))
+
+        assert ga.n_evaluations == len(calls) == 25
+        assert ga.best_individual.fitness < np.inf
 
 
 class TestErrorTerminationManager:
@@ -67,3 +88,84 @@ class TestErrorTerminationManager:
         ret_bool = tm.termination_check()
 
         assert ret_bool
+
+
+class TestStagnationTerminationManager:
+
+    def test_termination_check(self, ga):
+
+        ga.initialise_population()
+        ga.update_best(ga.population[0])
+
+        tm = StagnationTerminationManager(ga, n_generations=2, rtol=0.1)
+
+        for iteration, fitness in enumerate([10.0, 9.5, 8.0, 7.5, 7.5]):
+            ga.iteration = iteration
+            ga.best_individual.fitness = fitness
+
+            # repeated checks within a generation are counted once.
+            done = tm.termination_check()
+            assert tm.termination_check() == done
+
+        assert tm.n_stagnant == 2
+        assert done
+
+        ga.iteration = 0
+        assert not tm.termination_check()
+
+
+class TestDiversityTerminationManager:
+
+    def test_termination_check(self, ga):
+
+        tm = DiversityTerminationManager(ga, threshold=1e-3)
+        assert not tm.termination_check()
+
+        ga.initialise_population()
+        assert not tm.termination_check()
+
+        ga.population.positions[:] = 5.0
+        assert tm.diversity() == 0.0
+        assert tm.termination_check()
+
+
+class TestCompositeTerminationManager:
+
+    def test_termination_check(self, ga):
+
+        tm_iteration = IterationTerminationManager(ga)
+        tm_evaluation = EvaluationTerminationManager(ga, n_evaluations=100)
+
+        tm_any = tm_iteration | tm_evaluation
+        tm_all = tm_iteration & tm_evaluation
+
+        assert isinstance(tm_any, AnyTerminationManager)
+        assert tm_any.evaluation_budget == 100
+        assert tm_all.evaluation_budget is None
+
+        ga.n_evaluations = 100
+        assert tm_any.termination_check()
+        assert not tm_all.termination_check()
+
+        ga.iteration = 150
+        assert tm_all.termination_check()
+
+    def test_state_dict(self, ga):
+
+        ga.initialise_population()
+        ga.update_best(ga.population[0])
+        ga.best_individual.fitness = 3.0
+
+        tm = (StagnationTerminationManager(ga, n_generations=5)
+              | TimeTerminationManager(t_budget=10))
+        tm.termination_check()
+
+        state = tm.state_dict()
+        assert set(state) == {'0.best_fitness', '0.n_stagnant',
+                              '1.t_elapsed'}
+
+        other = (StagnationTerminationManager(ga, n_generations=5)
+                 | TimeTerminationManager(t_budget=10))
+        other.load_state_dict(state)
+
+        assert other.managers[0].best_fitness == 3.0